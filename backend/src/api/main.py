@@ -19,6 +19,7 @@ from .dependencies import get_current_user
 from .middleware.auth import AuthMiddleware
 from .middleware.telemetry import TelemetryMiddleware
 from .middleware.error_handler import ErrorHandlerMiddleware
+from .responses import FastJSONResponse
 from .routers import documents, queue, process, websocket, search, logs, tools, entities
 from .socketio_app import socket_app
 
@@ -111,7 +112,8 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=FastJSONResponse
 )
 
 # Add CORS middleware
@@ -0,0 +1,37 @@
+"""Response classes shared by the API routers"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+# Optional faster encoder; the stdlib encoder is used when it is missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson when it is installed
+
+    Tool results can carry thousands of findings, where the stdlib encoder
+    dominates response time. Content orjson cannot encode (such as integers
+    beyond 64 bits) falls back to the standard JSONResponse rendering.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode the response content
+
+        Args:
+            content: JSON-compatible response content
+
+        Returns:
+            Encoded response body
+        """
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass
+        return super().render(content)
@@ -1,7 +1,9 @@
 """API endpoints for document tool management and recommendations"""
 
-from typing import List, Dict, Any, Optional
+import json
+from typing import AsyncIterator, List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from opentelemetry import trace
 
@@ -98,13 +100,7 @@ async def list_tools():
     """Get information about all available document tools"""
     with tracer.start_as_current_span("list_tools"):
         try:
-            tool_info = DocumentToolRegistry.get_tool_info()
-            stats = DocumentToolRegistry.get_stats()
-
-            return {
-                "tools": tool_info,
-                "statistics": stats
-            }
+            return DocumentToolRegistry.get_dashboard()
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to list tools: {str(e)}")
 
@@ -292,6 +288,60 @@ async def execute_tool(
             )
 
 
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format a server-sent event carrying a JSON payload"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/execute/stream")
+async def execute_tool_stream(
+    request: ToolExecutionRequest,
+    document_service=Depends(get_document_service),
+    llm_service=Depends(get_llm_service),
+    vector_search_service=Depends(get_vector_search_service)
+) -> StreamingResponse:
+    """Execute a tool on a specific document, streaming results as server-sent events
+
+    Tools providing execute_stream() send each result section as soon as it
+    is ready; other tools send their full result as a single event. The
+    stream ends with a "done" event, or an "error" event on failure.
+    """
+    with tracer.start_as_current_span("execute_tool_stream") as span:
+        span.set_attribute("document.id", request.document_id)
+        span.set_attribute("tool.type", request.tool_type.value)
+
+        document = await document_service.get_document(request.document_id)
+        if not document:
+            raise HTTPException(status_code=404, detail=f"Document {request.document_id} not found")
+
+        tool = DocumentToolRegistry.create(
+            tool_type=request.tool_type,
+            document_service=document_service,
+            llm_service=llm_service,
+            vector_search_service=vector_search_service,
+            singleton=False  # Don't cache for execution
+        )
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            if hasattr(tool, "execute_stream"):
+                async for part in tool.execute_stream(document=document, parameters=request.parameters):
+                    yield _sse_event(part)
+            else:
+                result = await tool.execute(document=document, parameters=request.parameters)
+                yield _sse_event(result)
+        except ValueError as e:
+            yield _sse_event({"error": f"Validation error: {str(e)}"}, event="error")
+            return
+        except Exception as e:
+            yield _sse_event({"error": f"Execution error: {str(e)}"}, event="error")
+            return
+        yield _sse_event({"tool_type": request.tool_type.value}, event="done")
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get("/document-types/{document_type}/tools", response_model=List[str])
 async def get_tools_for_document_type(document_type: DocumentType):
     """Get list of tools that support a specific document type"""
@@ -4,8 +4,8 @@ import os
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import yaml
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AliasChoices, Field
 from functools import lru_cache
 
 class StorageConfig(BaseSettings):
@@ -236,6 +236,16 @@ class TelemetryConfig(BaseSettings):
     service_name: str = Field(default="mavn-bench-backend", env="SERVICE_NAME")
     otlp_endpoint: str = Field(default="http://localhost:4317", env="OTEL_EXPORTER_OTLP_ENDPOINT")
     jaeger_endpoint: str = Field(default="http://localhost:14268/api/traces", env="JAEGER_ENDPOINT")
+    trace_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        validation_alias=AliasChoices("TELEMETRY_TRACE_SAMPLE_RATE", "TRACE_SAMPLE_RATE"),
+        description="Fraction of service operations traced (0.0-1.0)"
+    )
+
+    # Field names stay accepted for YAML and nested (TELEMETRY__*) values
+    model_config = SettingsConfigDict(populate_by_name=True)
 
 class PaginationConfig(BaseSettings):
     """Pagination settings"""
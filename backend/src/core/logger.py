@@ -118,21 +118,25 @@ class CentralizedLogger:
 
         return kwargs
     
-    def debug(self, message: str, **kwargs):
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at this level would be emitted"""
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args, **kwargs):
         kwargs = self._inject_trace_context(kwargs)
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
     
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         kwargs = self._inject_trace_context(kwargs)
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         kwargs = self._inject_trace_context(kwargs)
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         kwargs = self._inject_trace_context(kwargs)
-        self.logger.error(message, **kwargs)
+        self.logger.error(message, *args, **kwargs)
         
         # Record exception in current span if available
         span = trace.get_current_span()
@@ -142,8 +146,8 @@ class CentralizedLogger:
                 exc_info = kwargs.get('exc_info')
                 if exc_info and exc_info is not True and hasattr(exc_info, '__traceback__'):
                     span.record_exception(exc_info)
-            span.set_status(Status(StatusCode.ERROR, message))
+            span.set_status(Status(StatusCode.ERROR, message % args if args else message))
     
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         kwargs = self._inject_trace_context(kwargs)
-        self.logger.critical(message, **kwargs)
+        self.logger.critical(message, *args, **kwargs)
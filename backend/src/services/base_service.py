@@ -5,11 +5,35 @@ from typing import Optional, Dict, Any
 from opentelemetry import trace
 from opentelemetry.trace import Status, StatusCode
 import asyncio
+import random
 from functools import wraps
 
 from ..core.logger import CentralizedLogger
 from ..core.config import get_settings
 
+
+class _UnsampledOperation:
+    """Context manager for operations skipped by trace sampling
+
+    Records no span but still logs errors the same way a traced span does.
+    """
+
+    __slots__ = ("logger", "operation_name")
+
+    def __init__(self, logger: CentralizedLogger, operation_name: str):
+        self.logger = logger
+        self.operation_name = operation_name
+
+    def __enter__(self):
+        return trace.INVALID_SPAN
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self.logger.error(f"Error in {self.operation_name}: {str(exc)}",
+                            exc_info=exc)
+        return False
+
+
 class BaseService:
     """Base service class with automatic tracing and logging"""
     
@@ -18,10 +42,22 @@ class BaseService:
         self.tracer = trace.get_tracer(service_name)
         self.logger = CentralizedLogger(service_name)
         self.settings = get_settings()
+        self._trace_sample_rate = self.settings.telemetry.trace_sample_rate
     
-    @contextmanager
     def traced_operation(self, operation_name: str, **attributes):
-        """Context manager for traced operations"""
+        """Context manager for traced operations
+
+        Operations are sampled according to telemetry.trace_sample_rate;
+        unsampled calls get a no-op span and skip span creation, but errors
+        are still logged.
+        """
+        if self._trace_sample_rate < 1.0 and random.random() >= self._trace_sample_rate:
+            return _UnsampledOperation(self.logger, operation_name)
+        return self._traced_span(operation_name, **attributes)
+
+    @contextmanager
+    def _traced_span(self, operation_name: str, **attributes):
+        """Context manager that records a span for the operation"""
         with self.tracer.start_as_current_span(operation_name) as span:
             # Set common attributes
             span.set_attributes({
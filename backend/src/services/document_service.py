@@ -1,6 +1,7 @@
 """Document service for CRUD operations and document management"""
 
 import asyncio
+import logging
 import uuid
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -162,7 +163,7 @@ class DocumentService(BaseService):
                     self.logger.warning(f"Document not found for update: {document_id}")
                     return None
 
-                # Save current version
+                # Snapshot current version (persisted together with the update)
                 current_version = DocumentVersion(
                     version=document.metadata.version,
                     timestamp=document.metadata.updated_timestamp,
@@ -170,7 +171,6 @@ class DocumentService(BaseService):
                     changes={"snapshot": "before_update"},
                     commit_message=f"Snapshot before update by {user_id}"
                 )
-                await self.storage.save_version(document_id, current_version)
 
                 # Apply updates
                 for key, value in updates.items():
@@ -205,12 +205,6 @@ class DocumentService(BaseService):
                 )
                 document.audit_log.append(audit_entry)
 
-                # Save updated document
-                success = await self.storage.save(document)
-                if not success:
-                    raise RuntimeError("Failed to save updated document")
-
-                # Save new version
                 new_version = DocumentVersion(
                     version=document.metadata.version,
                     timestamp=document.metadata.updated_timestamp,
@@ -218,7 +212,13 @@ class DocumentService(BaseService):
                     changes=updates,
                     commit_message=f"Updated by {user_id}"
                 )
-                await self.storage.save_version(document_id, new_version)
+
+                # Save snapshot, updated document and new version in one storage call
+                success = await self.storage.transactional_update(
+                    document_id, document, current_version, new_version
+                )
+                if not success:
+                    raise RuntimeError("Failed to save updated document")
 
                 self.logger.info(f"Updated document: {document_id} to version {document.metadata.version}")
                 return document
@@ -310,8 +310,12 @@ class DocumentService(BaseService):
             offset=offset
         ):
             try:
+                # Skip building log messages entirely when INFO is disabled
+                log_info = self.logger.is_enabled_for(logging.INFO)
+
                 # Get documents from storage
-                self.logger.info(f"[DocumentService] list_documents called - user_id: {user_id}, type: {document_type}, limit: {limit}, offset: {offset}, include_deleted: {include_deleted}")
+                if log_info:
+                    self.logger.info(f"[DocumentService] list_documents called - user_id: {user_id}, type: {document_type}, limit: {limit}, offset: {offset}, include_deleted: {include_deleted}")
 
                 documents = await self.storage.list_documents(
                     user_id=user_id,
@@ -320,7 +324,8 @@ class DocumentService(BaseService):
                     offset=offset
                 )
 
-                self.logger.info(f"[DocumentService] Retrieved {len(documents)} documents from storage")
+                if log_info:
+                    self.logger.info(f"[DocumentService] Retrieved {len(documents)} documents from storage")
 
                 # Filter out deleted documents if requested
                 if not include_deleted:
@@ -329,9 +334,11 @@ class DocumentService(BaseService):
                         doc for doc in documents
                         if not getattr(doc.metadata, "deleted", False)
                     ]
-                    self.logger.info(f"[DocumentService] After filtering deleted: {original_count} -> {len(documents)} documents")
+                    if log_info:
+                        self.logger.info(f"[DocumentService] After filtering deleted: {original_count} -> {len(documents)} documents")
 
-                self.logger.info(f"[DocumentService] Returning {len(documents)} documents")
+                if log_info:
+                    self.logger.info(f"[DocumentService] Returning {len(documents)} documents")
                 return documents
 
             except Exception as e:
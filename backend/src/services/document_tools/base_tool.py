@@ -1,11 +1,12 @@
 """Base class for all document processing tools"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from dataclasses import dataclass
 from enum import Enum
 
 from ..base_service import BaseService
+from ..input_validation import compile_input_validator
 
 
 class ToolCategory(str, Enum):
@@ -44,6 +45,13 @@ class DocumentToolCapability(str, Enum):
     METADATA_ENRICHMENT = "metadata_enrichment"
 
 
+# Precomputed value -> member tables. Indexing these avoids the
+# EnumMeta.__call__ path when deserializing category/capability strings,
+# and accepts enum members as keys too (str enums hash like their value).
+_CATEGORY_LOOKUP: Dict[str, DocumentToolCategory] = {e.value: e for e in DocumentToolCategory}
+_CAPABILITY_LOOKUP: Dict[str, DocumentToolCapability] = {e.value: e for e in DocumentToolCapability}
+
+
 @dataclass
 class DocumentToolMetadata:
     """Metadata about a document tool"""
@@ -54,8 +62,8 @@ class DocumentToolMetadata:
     version: str = "1.0.0"
     icon: Optional[str] = None
 
-    # Capabilities
-    capabilities: List[DocumentToolCapability] = None
+    # Capabilities (frozen to a tuple in __post_init__)
+    capabilities: Sequence[DocumentToolCapability] = None
 
     # Document compatibility
     supported_document_types: List[Any] = None  # List of DocumentType enums
@@ -77,15 +85,45 @@ class DocumentToolMetadata:
     output_schema: Dict[str, Any] = None
 
     def __post_init__(self):
-        if self.capabilities is None:
-            self.capabilities = []
+        try:
+            self.category = _CATEGORY_LOOKUP[self.category]
+            self.capabilities = tuple(
+                _CAPABILITY_LOOKUP[c] for c in self.capabilities or ()
+            )
+        except KeyError as e:
+            raise ValueError(f"Unknown tool category or capability: {e.args[0]}") from e
         if self.supported_document_types is None:
             self.supported_document_types = []
+
+        # Hashed siblings of the ordered fields for O(1) membership checks
+        self._capability_set = frozenset(self.capabilities)
+        self._document_type_set = frozenset(self.supported_document_types)
+        # No declared document types means the tool handles every type
+        self._supports_all_document_types = not self._document_type_set
         if self.input_schema is None:
             self.input_schema = {}
         if self.output_schema is None:
             self.output_schema = {}
 
+        # Schema-specialized input validator (not a dataclass field)
+        self._validate = compile_input_validator(
+            self.input_schema,
+            missing_message="Required parameter '{field}' missing",
+            type_message="Parameter '{field}' must be {type}, got {actual}",
+            id_argument="document_id"
+        )
+
+    def has_capability(self, capability: DocumentToolCapability) -> bool:
+        """Check whether the tool declares a capability
+
+        Args:
+            capability: Capability to look for
+
+        Returns:
+            True if the capability is declared
+        """
+        return capability in self._capability_set
+
 
 class BaseDocumentTool(ABC):
     """Abstract base class for all document processing tools
@@ -94,8 +132,22 @@ class BaseDocumentTool(ABC):
     Each tool encapsulates a specific document operation (validation, analysis, etc.)
 
     Tools receive services via dependency injection in the constructor.
+
+    Instance state is slotted; subclasses declare their own __slots__ (empty
+    if they add no attributes). The decorator's _tool_type/_tool_aliases are
+    class attributes and intentionally not slots, so undecorated classes
+    still report as undecorated.
     """
 
+    __slots__ = (
+        "name",
+        "document_service",
+        "llm_service",
+        "vector_search_service",
+        "graph_search_service",
+        "_services",
+    )
+
     def __init__(
         self,
         name: str,
@@ -166,41 +218,7 @@ class BaseDocumentTool(ABC):
         Returns:
             True if valid, raises ValueError otherwise
         """
-        metadata = self.get_metadata()
-
-        if not document_id:
-            raise ValueError("document_id is required")
-
-        if parameters is None:
-            parameters = {}
-
-        # Check required fields
-        for field, schema in metadata.input_schema.items():
-            if schema.get("required", False) and field not in parameters:
-                raise ValueError(f"Required parameter '{field}' missing")
-
-            # Check field types if present
-            if field in parameters and "type" in schema:
-                expected_type = schema["type"]
-                actual_value = parameters[field]
-
-                type_map = {
-                    "str": str,
-                    "int": int,
-                    "float": (int, float),
-                    "bool": bool,
-                    "list": list,
-                    "dict": dict
-                }
-
-                expected_python_type = type_map.get(expected_type)
-                if expected_python_type and not isinstance(actual_value, expected_python_type):
-                    raise ValueError(
-                        f"Parameter '{field}' must be {expected_type}, "
-                        f"got {type(actual_value).__name__}"
-                    )
-
-        return True
+        return self.get_metadata()._validate(document_id, parameters)
 
     async def can_process_document(self, document_type: str, content_length: int = 0) -> bool:
         """Check if this tool can process the given document
@@ -215,7 +233,7 @@ class BaseDocumentTool(ABC):
         metadata = self.get_metadata()
 
         # Check document type compatibility
-        if metadata.supported_document_types and document_type not in metadata.supported_document_types:
+        if not metadata._supports_all_document_types and document_type not in metadata._document_type_set:
             return False
 
         # Check content length constraints
@@ -243,13 +261,74 @@ class BaseDocumentTool(ABC):
         metadata = self.get_metadata()
         score = 0.0
 
-        # Base score for document type compatibility
-        if document_type in metadata.supported_document_types:
+        # Base score for document type compatibility (no declared types
+        # means the tool handles every type, generically)
+        if metadata._supports_all_document_types:
+            score = 0.25
+        elif document_type in metadata._document_type_set:
             score = 0.5
 
         # Override in subclasses for intelligent scoring
         return score
 
+    @classmethod
+    def score_document_from_metadata(
+        cls,
+        metadata: DocumentToolMetadata,
+        document: Any
+    ) -> float:
+        """Cheap recommendation pre-score computed from static metadata
+
+        Used by the registry to rank tools before instantiating any of them.
+
+        Args:
+            metadata: Cached tool metadata
+            document: DocumentMessage to score
+
+        Returns:
+            Score from 0.0 (not applicable) to 1.0
+        """
+        document_type = document.metadata.document_type
+        if not metadata._supports_all_document_types and document_type not in metadata._document_type_set:
+            return 0.0
+
+        content = document.content
+        content_length = len(content.formatted_content or content.raw_text or "") if content else 0
+        if metadata.min_content_length and content_length < metadata.min_content_length:
+            return 0.0
+        if metadata.max_content_length and content_length > metadata.max_content_length:
+            return 0.0
+
+        # Tools declaring no document types handle everything, but generically
+        return 0.25 if metadata._supports_all_document_types else 0.5
+
+    def get_recommendations_for_document(self, document: Any) -> Dict[str, Any]:
+        """Build a recommendation for this tool given a document
+
+        Args:
+            document: DocumentMessage to evaluate
+
+        Returns:
+            Dictionary with applicable, score, reasoning and metadata keys
+        """
+        metadata = self.get_metadata()
+        document_type = document.metadata.document_type
+        score = self.get_recommendation_score(document_type)
+
+        return {
+            "applicable": score > 0,
+            "score": score,
+            "reasoning": (
+                f"Supports {document_type.value} documents" if score > 0
+                else f"Not suited to {document_type.value} documents"
+            ),
+            "metadata": {
+                "execution_time_estimate": metadata.execution_time_estimate,
+                "requires_llm": metadata.requires_llm,
+                "requires_vector_search": metadata.requires_vector_search
+            }
+        }
+
     def __str__(self) -> str:
         """String representation of the tool"""
         metadata = self.get_metadata()
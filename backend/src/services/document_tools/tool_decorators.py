@@ -1,7 +1,11 @@
 """Tool registration decorators for automatic discovery of document tools"""
 
-from typing import Type, Optional, List, Dict
-from functools import wraps
+import importlib
+import os
+import sys
+from types import MappingProxyType
+from typing import Type, Optional, List, Dict, Mapping, Tuple
+from functools import wraps, lru_cache
 
 from .tool_registry import DocumentToolType, DocumentToolRegistry
 from .base_tool import BaseDocumentTool
@@ -9,6 +13,7 @@ from .base_tool import BaseDocumentTool
 
 # Registry for decorated tools
 _decorated_tools: Dict[DocumentToolType, Type[BaseDocumentTool]] = {}
+_decorated_tools_view: Mapping[DocumentToolType, Type[BaseDocumentTool]] = MappingProxyType(_decorated_tools)
 
 
 def register_document_tool(
@@ -54,20 +59,28 @@ def register_document_tool(
 
         # Add metadata to the class for introspection
         cls._tool_type = tool_type
-        cls._tool_aliases = aliases or []
+        cls._tool_aliases = tuple(aliases or ())
+
+        # Re-decorating a class must not leave stale introspection results
+        _clear_introspection_caches()
+
+        # Register immediately (or once a frozen registry is unfrozen);
+        # auto_register_decorated_tools only has to restore entries dropped
+        # from the registry since decoration
+        DocumentToolRegistry.register_when_unfrozen(cls, [tool_type, *cls._tool_aliases])
 
         return cls
 
     return decorator
 
 
-def get_decorated_tools() -> Dict[DocumentToolType, Type[BaseDocumentTool]]:
+def get_decorated_tools() -> Mapping[DocumentToolType, Type[BaseDocumentTool]]:
     """Get all tools registered via decorators
 
     Returns:
-        Dictionary mapping tool types to tool classes
+        Read-only live mapping of tool types to tool classes
     """
-    return _decorated_tools.copy()
+    return _decorated_tools_view
 
 
 def clear_decorated_tools():
@@ -76,33 +89,34 @@ def clear_decorated_tools():
 
 
 def auto_register_decorated_tools():
-    """Register all decorated tools with the DocumentToolRegistry
+    """Ensure all decorated tools are registered with the DocumentToolRegistry
 
-    This function should be called during initialization to register
-    all tools that have been decorated with @register_document_tool.
-    It scans for decorated tools and registers them with the main registry.
+    Decorated tools register themselves at decoration time, so this only
+    re-registers classes whose entries have since been removed or replaced
+    (e.g. after the registry was cleared in tests).
 
     Returns:
-        Number of tools registered
+        Number of decorated tool classes
     """
-    count = 0
-    registered_classes = set()  # Track unique classes to avoid duplicate registration
+    # Unique classes in decoration order; aliases map to the same class
+    unique_classes = list(dict.fromkeys(_decorated_tools.values()))
+    registered = DocumentToolRegistry.get_all_tools()
 
-    for tool_type, tool_class in _decorated_tools.items():
-        # Avoid registering the same class multiple times for aliases
-        if tool_class not in registered_classes:
-            DocumentToolRegistry.register(tool_type, tool_class)
-            registered_classes.add(tool_class)
-            count += 1
+    for tool_class in unique_classes:
+        tool_types = [tool_class._tool_type, *tool_class._tool_aliases]
+        if any(registered.get(tool_type) is not tool_class for tool_type in tool_types):
+            DocumentToolRegistry.register_many(tool_class, tool_types)
 
-    return count
+    return len(unique_classes)
 
 
 def scan_and_import_tools(package_path: str = "src.services.document_tools.tools"):
     """Scan and import all tool modules to trigger decorator registration
 
     This function dynamically imports all tool modules in the specified package
-    to ensure their @register_document_tool decorators are executed.
+    to ensure their @register_document_tool decorators are executed. It is
+    only used by initialize_document_tools when MAVN_TOOL_AUTOSCAN is set;
+    the static import list in the tools package is the default path.
 
     Args:
         package_path: Python package path containing tool modules
@@ -110,32 +124,21 @@ def scan_and_import_tools(package_path: str = "src.services.document_tools.tools
     Returns:
         List of imported module names
     """
-    import os
-    import importlib
+    # Local import: the scanner is opt-in, so keep it off the module import path
     import pkgutil
-    from pathlib import Path
 
     imported_modules = []
 
     try:
-        # Convert package path to filesystem path
-        package_parts = package_path.split('.')
-        base_path = Path(__file__).parent
-
-        # Navigate to the tools directory
-        tools_path = base_path / "tools"
-
-        if not tools_path.exists():
+        package = importlib.import_module(package_path)
+        package_dirs = getattr(package, "__path__", None)
+        if package_dirs is None:
             return imported_modules
 
-        # Import all Python files in the tools directory
-        for file_path in tools_path.glob("*.py"):
-            if file_path.name.startswith("__"):
-                continue  # Skip __init__.py and __pycache__
-
-            module_name = file_path.stem
-            full_module_path = f"{package_path}.{module_name}"
-
+        # iter_modules works through the package's finders, so this also
+        # covers zip/wheel deployments and skips dunder modules
+        for module_info in pkgutil.iter_modules(package_dirs, package.__name__ + "."):
+            full_module_path = module_info.name
             try:
                 importlib.import_module(full_module_path)
                 imported_modules.append(full_module_path)
@@ -154,21 +157,36 @@ def initialize_document_tools():
 
     This is the main initialization function that should be called during
     application startup. It:
-    1. Scans for tool modules and imports them
+    1. Imports tool modules via the tools package's static import list
+       (plus a filesystem scan only when MAVN_TOOL_AUTOSCAN is set)
     2. Registers all decorated tools
-    3. Returns initialization statistics
+    3. Freezes the registry so the tool set is read-only afterwards
+    4. Returns initialization statistics
+
+    Calling it again (e.g. from the admin endpoint) unfreezes the registry
+    for the duration of the call.
 
     Returns:
         Dictionary with initialization statistics
     """
-    # Scan and import tool modules
-    imported_modules = scan_and_import_tools()
+    DocumentToolRegistry.unfreeze()
+
+    # Import tool modules via the tools package's static import list
+    from . import tools as _tools_pkg
+    module_prefix = _tools_pkg.__name__ + "."
+    imported_modules = [name for name in sys.modules if name.startswith(module_prefix)]
+
+    # Optional filesystem scan for tool modules missing from the static list
+    if os.environ.get("MAVN_TOOL_AUTOSCAN"):
+        for module_name in scan_and_import_tools():
+            if module_name not in imported_modules:
+                imported_modules.append(module_name)
 
     # Register all decorated tools
     registered_count = auto_register_decorated_tools()
+    DocumentToolRegistry.freeze()
 
     # Get registry statistics
-    from .tool_registry import DocumentToolRegistry
     stats = DocumentToolRegistry.get_stats()
 
     return {
@@ -180,7 +198,15 @@ def initialize_document_tools():
     }
 
 
-# Utility functions for tool introspection
+# Utility functions for tool introspection, memoized per class
+def _clear_introspection_caches():
+    """Drop memoized introspection results after a class is (re)decorated"""
+    get_tool_type_for_class.cache_clear()
+    get_tool_aliases_for_class.cache_clear()
+    is_tool_decorated.cache_clear()
+
+
+@lru_cache(maxsize=256)
 def get_tool_type_for_class(tool_class: Type[BaseDocumentTool]) -> Optional[DocumentToolType]:
     """Get the primary tool type for a tool class
 
@@ -193,18 +219,20 @@ def get_tool_type_for_class(tool_class: Type[BaseDocumentTool]) -> Optional[Docu
     return getattr(tool_class, '_tool_type', None)
 
 
-def get_tool_aliases_for_class(tool_class: Type[BaseDocumentTool]) -> List[DocumentToolType]:
+@lru_cache(maxsize=256)
+def get_tool_aliases_for_class(tool_class: Type[BaseDocumentTool]) -> Tuple[DocumentToolType, ...]:
     """Get the aliases for a tool class
 
     Args:
         tool_class: Tool class to inspect
 
     Returns:
-        List of tool type aliases
+        Tuple of tool type aliases
     """
-    return getattr(tool_class, '_tool_aliases', [])
+    return tuple(getattr(tool_class, '_tool_aliases', ()))
 
 
+@lru_cache(maxsize=256)
 def is_tool_decorated(tool_class: Type[BaseDocumentTool]) -> bool:
     """Check if a tool class has been decorated
 
@@ -214,4 +242,4 @@ def is_tool_decorated(tool_class: Type[BaseDocumentTool]) -> bool:
     Returns:
         True if decorated, False otherwise
     """
-    return hasattr(tool_class, '_tool_type')
\ No newline at end of file
+    return hasattr(tool_class, '_tool_type')
@@ -1,6 +1,12 @@
 """Registry for document processing tools - manages tool registration and discovery"""
 
-from typing import Dict, Type, Optional, List, Any, Set
+import copy
+import hashlib
+import logging
+from collections import Counter, OrderedDict, defaultdict
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Type, Optional, List, Any, Set, Mapping, Tuple
 from enum import Enum
 
 from .base_tool import BaseDocumentTool, DocumentToolMetadata, DocumentToolCategory, DocumentToolCapability
@@ -8,6 +14,13 @@ from ...models.document import DocumentType, DocumentMessage
 from ...core.logger import CentralizedLogger
 
 
+# Index key for tools that declare no supported document types (i.e. all types)
+_ALL_DOCUMENT_TYPES = "*"
+
+# Maximum number of cached recommendation lists
+_RECOMMENDATION_CACHE_SIZE = 128
+
+
 class DocumentToolType(str, Enum):
     """Types of document tools available"""
     # JSON Tools
@@ -36,6 +49,16 @@ class DocumentToolType(str, Enum):
     EXTRACT_TEXT = "extract_text"
 
 
+# Precomputed member -> value tables. Enum.value goes through a descriptor on
+# every access; the payload builders below run it per tool and per field.
+_TYPE_VALUES: Dict[DocumentToolType, str] = {t: t.value for t in DocumentToolType}
+_METADATA_VALUES: Dict[Enum, str] = {
+    e: e.value
+    for enum_cls in (DocumentToolCategory, DocumentToolCapability, DocumentType)
+    for e in enum_cls
+}
+
+
 class DocumentToolRegistry:
     """Registry for managing document processing tools
 
@@ -45,8 +68,91 @@ class DocumentToolRegistry:
     """
 
     _tools: Dict[DocumentToolType, Type[BaseDocumentTool]] = {}
+    # Read-only live view of _tools handed out to callers
+    _tools_view: Mapping[DocumentToolType, Type[BaseDocumentTool]] = MappingProxyType(_tools)
+    # Set by freeze() once initialization is done; registration then raises
+    _frozen: bool = False
+    # (tool class, tool types) decorated while frozen, registered by unfreeze()
+    _pending_registrations: List[Tuple[Type[BaseDocumentTool], List[DocumentToolType]]] = []
     _instances: Dict[DocumentToolType, BaseDocumentTool] = {}
-    _logger = CentralizedLogger("DocumentToolRegistry")
+    _metadata_cache: Dict[DocumentToolType, DocumentToolMetadata] = {}
+
+    # Inverted indexes maintained alongside the metadata cache
+    _by_doc_type: Dict[Any, List[DocumentToolType]] = {}
+    _by_capability: Dict[DocumentToolCapability, List[DocumentToolType]] = {}
+    _by_category: Dict[DocumentToolCategory, List[DocumentToolType]] = {}
+
+    # Recommendation lists keyed by (document fingerprint, max, tools version);
+    # _tools_version is bumped whenever the registered tool set changes
+    _recommendation_cache: "OrderedDict[Tuple[str, int, int], List[Dict[str, Any]]]" = OrderedDict()
+    _tools_version: int = 0
+
+    _logger: Optional[CentralizedLogger] = None
+
+    @classmethod
+    def _log(cls) -> CentralizedLogger:
+        """Get the registry logger, creating it on first use"""
+        if cls._logger is None:
+            cls._logger = CentralizedLogger("DocumentToolRegistry")
+        return cls._logger
+
+    @classmethod
+    def freeze(cls):
+        """Make the registered tool set read-only
+
+        Called once tool initialization is complete; tools are not registered
+        at runtime, so later register calls indicate a bug and raise. Tools
+        decorated while frozen are queued instead (see register_when_unfrozen).
+        """
+        if cls._frozen:
+            return
+        cls._tools = MappingProxyType(dict(cls._tools))
+        cls._tools_view = cls._tools
+        cls._frozen = True
+
+    @classmethod
+    def unfreeze(cls):
+        """Allow registration again (re-initialization and testing)
+
+        Registrations queued while frozen are applied here.
+        """
+        if not cls._frozen:
+            return
+        cls._tools = dict(cls._tools)
+        cls._tools_view = MappingProxyType(cls._tools)
+        cls._frozen = False
+
+        pending, cls._pending_registrations = cls._pending_registrations, []
+        for tool_class, tool_types in pending:
+            cls.register_many(tool_class, tool_types)
+
+    @classmethod
+    def is_frozen(cls) -> bool:
+        """Check whether the registry has been frozen
+
+        Returns:
+            True if registration is currently disallowed
+        """
+        return cls._frozen
+
+    @classmethod
+    def _check_not_frozen(cls, tool_class: Type[BaseDocumentTool]):
+        """Raise if the registry has been frozen
+
+        Args:
+            tool_class: Tool class being registered, named in the error
+        """
+        if cls._frozen:
+            raise RuntimeError(
+                f"Cannot register {tool_class.__name__}: DocumentToolRegistry is frozen "
+                "after initialization; use register_when_unfrozen() or call unfreeze() first"
+            )
+
+    @classmethod
+    def _tools_changed(cls):
+        """Invalidate results derived from the registered tool set"""
+        cls._tools_version += 1
+        cls._recommendation_cache.clear()
 
     @classmethod
     def register(cls, tool_type: DocumentToolType, tool_class: Type[BaseDocumentTool]):
@@ -58,9 +164,89 @@ class DocumentToolRegistry:
         """
         if not issubclass(tool_class, BaseDocumentTool):
             raise ValueError(f"{tool_class} must inherit from BaseDocumentTool")
+        cls._check_not_frozen(tool_class)
 
+        if tool_type in cls._metadata_cache:
+            # Re-registration replaces the previous tool's index entries
+            cls._unindex_metadata(tool_type)
         cls._tools[tool_type] = tool_class
-        cls._logger.info(f"Registered document tool: {tool_type}")
+        cls._tools_changed()
+
+        # Cache metadata eagerly; tools that need DI to build metadata are
+        # populated lazily on first access instead
+        try:
+            cls._populate_metadata(tool_type)
+        except Exception as e:
+            cls._log().debug("Deferred metadata for %s: %s", tool_type, e)
+
+        log = cls._log()
+        if log.is_enabled_for(logging.INFO):
+            log.info("Registered document tool: %s", tool_type)
+
+    @classmethod
+    def register_many(
+        cls,
+        tool_class: Type[BaseDocumentTool],
+        tool_types: List[DocumentToolType]
+    ):
+        """Register one tool class under several tool types in a single batch
+
+        The class is checked once, metadata is built once and shared by all
+        tool types, and a single log line is emitted.
+
+        Args:
+            tool_class: Tool class to register
+            tool_types: Primary tool type followed by any aliases
+        """
+        if not issubclass(tool_class, BaseDocumentTool):
+            raise ValueError(f"{tool_class} must inherit from BaseDocumentTool")
+        cls._check_not_frozen(tool_class)
+        if not tool_types:
+            return
+
+        for tool_type in tool_types:
+            if tool_type in cls._metadata_cache:
+                cls._unindex_metadata(tool_type)
+        cls._tools.update(dict.fromkeys(tool_types, tool_class))
+        cls._tools_changed()
+
+        try:
+            metadata = tool_class(name=tool_types[0].value).get_metadata()
+        except Exception as e:
+            cls._log().debug("Deferred metadata for %s: %s", tool_types[0], e)
+        else:
+            for tool_type in tool_types:
+                cls._metadata_cache[tool_type] = metadata
+                cls._index_metadata(tool_type, metadata)
+
+        log = cls._log()
+        if log.is_enabled_for(logging.INFO):
+            log.info("Registered document tool %s as: %s", tool_class.__name__,
+                     ", ".join(tool_type.value for tool_type in tool_types))
+
+    @classmethod
+    def register_when_unfrozen(
+        cls,
+        tool_class: Type[BaseDocumentTool],
+        tool_types: List[DocumentToolType]
+    ):
+        """Register a tool class now, or queue it until the next unfreeze()
+
+        Used for tools decorated after initialization froze the registry
+        (e.g. a tool module imported late), which must not fail at import.
+
+        Args:
+            tool_class: Tool class to register
+            tool_types: Primary tool type followed by any aliases
+        """
+        if not cls._frozen:
+            cls.register_many(tool_class, tool_types)
+            return
+        if not issubclass(tool_class, BaseDocumentTool):
+            raise ValueError(f"{tool_class} must inherit from BaseDocumentTool")
+
+        cls._pending_registrations.append((tool_class, list(tool_types)))
+        cls._log().info("Registry frozen; queued %s until the next unfreeze()", tool_class.__name__)
 
     @classmethod
     def create(
@@ -88,10 +274,12 @@ class DocumentToolRegistry:
         Raises:
             ValueError: If tool type is unknown
         """
-        # Check for existing instance if singleton
-        if singleton and tool_type in cls._instances:
-            cls._logger.debug(f"Returning existing {tool_type} instance")
-            return cls._instances[tool_type]
+        # Fast path: an existing singleton is a single dict lookup, with no
+        # logging or argument handling
+        if singleton:
+            instance = cls._instances.get(tool_type)
+            if instance is not None:
+                return instance
 
         # Create new instance
         tool_class = cls._tools.get(tool_type)
@@ -100,7 +288,7 @@ class DocumentToolRegistry:
 
         try:
             instance = tool_class(
-                tool_id=tool_type.value,
+                name=_TYPE_VALUES[tool_type],
                 document_service=document_service,
                 llm_service=llm_service,
                 vector_search_service=vector_search_service,
@@ -111,21 +299,23 @@ class DocumentToolRegistry:
             if singleton:
                 cls._instances[tool_type] = instance
 
-            cls._logger.info(f"Created {tool_type} tool instance")
+            log = cls._log()
+            if log.is_enabled_for(logging.INFO):
+                log.info("Created %s tool instance", tool_type)
             return instance
 
         except Exception as e:
-            cls._logger.error(f"Failed to create {tool_type} tool: {str(e)}")
+            cls._log().error("Failed to create %s tool: %s", tool_type, e)
             raise
 
     @classmethod
-    def get_all_tools(cls) -> Dict[DocumentToolType, Type[BaseDocumentTool]]:
+    def get_all_tools(cls) -> Mapping[DocumentToolType, Type[BaseDocumentTool]]:
         """Get all registered tool classes
 
         Returns:
-            Dictionary of tool types to tool classes
+            Read-only live mapping of tool types to tool classes
         """
-        return cls._tools.copy()
+        return cls._tools_view
 
     @classmethod
     def get_tool_metadata(cls, tool_type: DocumentToolType) -> Optional[DocumentToolMetadata]:
@@ -137,12 +327,62 @@ class DocumentToolRegistry:
         Returns:
             Tool metadata or None if tool not found
         """
-        tool_class = cls._tools.get(tool_type)
-        if tool_class:
-            # Create temporary instance to get metadata
-            temp_instance = tool_class(name=tool_type.value)
-            return temp_instance.get_metadata()
-        return None
+        metadata = cls._metadata_cache.get(tool_type)
+        if metadata is None and tool_type in cls._tools:
+            metadata = cls._populate_metadata(tool_type)
+        return metadata
+
+    @classmethod
+    def _populate_metadata(cls, tool_type: DocumentToolType) -> DocumentToolMetadata:
+        """Build and cache metadata for a registered tool
+
+        Args:
+            tool_type: Type of tool
+
+        Returns:
+            Tool metadata
+        """
+        # Create temporary instance to get metadata
+        temp_instance = cls._tools[tool_type](name=tool_type.value)
+        metadata = temp_instance.get_metadata()
+        cls._metadata_cache[tool_type] = metadata
+        cls._index_metadata(tool_type, metadata)
+        return metadata
+
+    @classmethod
+    def _index_metadata(cls, tool_type: DocumentToolType, metadata: DocumentToolMetadata):
+        """Add a tool to the document type, capability and category indexes"""
+        if metadata._supports_all_document_types:
+            cls._by_doc_type.setdefault(_ALL_DOCUMENT_TYPES, []).append(tool_type)
+        else:
+            for doc_type in metadata._document_type_set:
+                cls._by_doc_type.setdefault(doc_type, []).append(tool_type)
+        for capability in metadata.capabilities:
+            cls._by_capability.setdefault(capability, []).append(tool_type)
+        cls._by_category.setdefault(metadata.category, []).append(tool_type)
+
+    @classmethod
+    def _unindex_metadata(cls, tool_type: DocumentToolType):
+        """Drop a tool's cached metadata and index entries"""
+        cls._metadata_cache.pop(tool_type, None)
+        for index in (cls._by_doc_type, cls._by_capability, cls._by_category):
+            for key, tool_types in list(index.items()):
+                if tool_type in tool_types:
+                    tool_types.remove(tool_type)
+                    if not tool_types:
+                        del index[key]
+
+    @classmethod
+    def _ensure_indexed(cls):
+        """Populate metadata (and indexes) for tools whose metadata was deferred"""
+        if len(cls._metadata_cache) == len(cls._tools):
+            return
+        for tool_type in cls._tools:
+            if tool_type not in cls._metadata_cache:
+                try:
+                    cls._populate_metadata(tool_type)
+                except Exception as e:
+                    cls._log().warning("Failed to get metadata for %s: %s", tool_type, e)
 
     @classmethod
     def find_tools_by_document_type(
@@ -157,17 +397,9 @@ class DocumentToolRegistry:
         Returns:
             List of tool types supporting the document type
         """
-        matching_tools = []
-
-        for tool_type in cls._tools:
-            metadata = cls.get_tool_metadata(tool_type)
-            if metadata and (
-                not metadata.supported_document_types or  # Empty means all types
-                document_type in metadata.supported_document_types
-            ):
-                matching_tools.append(tool_type)
-
-        return matching_tools
+        cls._ensure_indexed()
+        # Empty supported_document_types means the tool handles all types
+        return cls._by_doc_type.get(document_type, []) + cls._by_doc_type.get(_ALL_DOCUMENT_TYPES, [])
 
     @classmethod
     def find_tools_by_capability(
@@ -182,14 +414,8 @@ class DocumentToolRegistry:
         Returns:
             List of tool types with the capability
         """
-        matching_tools = []
-
-        for tool_type in cls._tools:
-            metadata = cls.get_tool_metadata(tool_type)
-            if metadata and capability in metadata.capabilities:
-                matching_tools.append(tool_type)
-
-        return matching_tools
+        cls._ensure_indexed()
+        return list(cls._by_capability.get(capability, []))
 
     @classmethod
     def find_tools_by_category(
@@ -204,14 +430,8 @@ class DocumentToolRegistry:
         Returns:
             List of tool types in the category
         """
-        matching_tools = []
-
-        for tool_type in cls._tools:
-            metadata = cls.get_tool_metadata(tool_type)
-            if metadata and metadata.category == category:
-                matching_tools.append(tool_type)
-
-        return matching_tools
+        cls._ensure_indexed()
+        return list(cls._by_category.get(category, []))
 
     @classmethod
     def get_recommendations_for_document(
@@ -234,9 +454,35 @@ class DocumentToolRegistry:
         Returns:
             List of tool recommendations with scores
         """
+        cache_key = (
+            cls._document_fingerprint(document),
+            max_recommendations,
+            cls._tools_version
+        )
+        cached = cls._recommendation_cache.get(cache_key)
+        if cached is not None:
+            cls._recommendation_cache.move_to_end(cache_key)
+            # Deep copy: recommendations carry nested dicts (e.g. "metadata")
+            return copy.deepcopy(cached)
+
+        # Rank tools from cached metadata first so only the most promising
+        # candidates are instantiated
+        candidates = []
+        for tool_type, tool_class in cls._tools.items():
+            try:
+                metadata = cls.get_tool_metadata(tool_type)
+                score = tool_class.score_document_from_metadata(metadata, document)
+            except Exception as e:
+                cls._log().warning("Failed to pre-score %s: %s", tool_type, e)
+                continue
+            if score > 0:
+                candidates.append((score, tool_type, metadata))
+
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
         recommendations = []
 
-        for tool_type in cls._tools:
+        for _, tool_type, metadata in candidates[:max_recommendations * 2]:
             try:
                 # Create tool instance to get recommendations
                 tool = cls.create(
@@ -251,20 +497,45 @@ class DocumentToolRegistry:
 
                 if recommendation["applicable"]:
                     recommendations.append({
-                        "tool_type": tool_type.value,
-                        "tool_name": tool.get_metadata().name,
-                        "tool_icon": tool.get_metadata().icon,
-                        "tool_category": tool.get_metadata().category.value,
+                        "tool_type": _TYPE_VALUES[tool_type],
+                        "tool_name": metadata.name,
+                        "tool_icon": metadata.icon,
+                        "tool_category": _METADATA_VALUES[metadata.category],
                         **recommendation
                     })
 
             except Exception as e:
-                cls._logger.warning(f"Failed to get recommendation from {tool_type}: {str(e)}")
+                cls._log().warning("Failed to get recommendation from %s: %s", tool_type, e)
 
         # Sort by score descending
         recommendations.sort(key=lambda x: x["score"], reverse=True)
+        recommendations = recommendations[:max_recommendations]
+
+        cls._recommendation_cache[cache_key] = recommendations
+        if len(cls._recommendation_cache) > _RECOMMENDATION_CACHE_SIZE:
+            cls._recommendation_cache.popitem(last=False)
+
+        return copy.deepcopy(recommendations)
+
+    @staticmethod
+    def _document_fingerprint(document: DocumentMessage) -> str:
+        """Hash the document fields that recommendation scoring depends on
+
+        Args:
+            document: Document being scored
 
-        return recommendations[:max_recommendations]
+        Returns:
+            Hex digest identifying the document revision and content
+        """
+        metadata = document.metadata
+        content = document.content
+        text = (content.formatted_content or content.raw_text or "") if content else ""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{metadata.document_id}\0{metadata.version}\0{metadata.document_type}\0".encode()
+        )
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
 
     @classmethod
     def get_available_tools(cls) -> List[DocumentToolType]:
@@ -277,9 +548,14 @@ class DocumentToolRegistry:
 
     @classmethod
     def clear_instances(cls):
-        """Clear all singleton instances (mainly for testing)"""
+        """Clear all singleton instances and cached metadata (mainly for testing)"""
         cls._instances.clear()
-        cls._logger.info("Cleared all tool instances")
+        cls._metadata_cache.clear()
+        cls._by_doc_type.clear()
+        cls._by_capability.clear()
+        cls._by_category.clear()
+        cls._tools_changed()
+        cls._log().info("Cleared all tool instances")
 
     @classmethod
     def is_registered(cls, tool_type: DocumentToolType) -> bool:
@@ -293,6 +569,83 @@ class DocumentToolRegistry:
         """
         return tool_type in cls._tools
 
+    @classmethod
+    def _iter_metadata(cls):
+        """Yield (tool_type, metadata) for every registered tool with metadata
+
+        Reads the metadata cache, building entries only for tools whose
+        metadata was deferred at registration.
+        """
+        cache = cls._metadata_cache
+        for tool_type in cls._tools:
+            metadata = cache.get(tool_type) or cls.get_tool_metadata(tool_type)
+            if metadata:
+                yield tool_type, metadata
+
+    @staticmethod
+    def _tool_data(metadata: DocumentToolMetadata) -> Dict[str, Any]:
+        """Build the public description of a tool from its metadata"""
+        return {
+            "id": metadata.id,
+            "name": metadata.name,
+            "description": metadata.description,
+            "icon": metadata.icon,
+            "version": metadata.version,
+            "capabilities": [_METADATA_VALUES[cap] for cap in metadata.capabilities],
+            "supported_document_types": [_METADATA_VALUES[dt] for dt in metadata.supported_document_types],
+            "execution_time_estimate": metadata.execution_time_estimate,
+            "batch_capable": metadata.batch_capable,
+            "requires_llm": metadata.requires_llm,
+            "requires_vector_search": metadata.requires_vector_search
+        }
+
+    @classmethod
+    def _scan(cls, with_info: bool, with_stats: bool):
+        """Fetch registered metadata once, building tool info and/or stats
+
+        Args:
+            with_info: Whether to build the tool info payload
+            with_stats: Whether to build the statistics payload
+
+        Returns:
+            Tuple of (tool_info, stats); a payload not requested is None
+        """
+        all_metadata = [metadata for _, metadata in cls._iter_metadata()]
+
+        tool_info = None
+        if with_info:
+            # Group tools by category, keeping first-seen category order
+            grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            tools = {metadata.id: cls._tool_data(metadata) for metadata in all_metadata}
+            for metadata in all_metadata:
+                grouped[_METADATA_VALUES[metadata.category]].append(tools[metadata.id])
+            tool_info = {
+                "categories": {
+                    category_name: {"name": category_name, "tools": category_tools}
+                    for category_name, category_tools in grouped.items()
+                },
+                "tools": tools
+            }
+
+        stats = None
+        if with_stats:
+            values = _METADATA_VALUES
+            stats = {
+                "total_tools": len(cls._tools),
+                "active_instances": len(cls._instances),
+                "category_distribution": dict(Counter(
+                    values[metadata.category] for metadata in all_metadata
+                )),
+                "capability_distribution": dict(Counter(map(values.__getitem__, chain.from_iterable(
+                    metadata.capabilities for metadata in all_metadata
+                )))),
+                "document_type_support": dict(Counter(map(values.__getitem__, chain.from_iterable(
+                    metadata.supported_document_types for metadata in all_metadata
+                ))))
+            }
+
+        return tool_info, stats
+
     @classmethod
     def get_tool_info(cls) -> Dict[str, Dict[str, Any]]:
         """Get information about all registered tools
@@ -300,43 +653,7 @@ class DocumentToolRegistry:
         Returns:
             Dictionary with tool information organized by category
         """
-        tool_info = {
-            "categories": {},
-            "tools": {}
-        }
-
-        # Group tools by category
-        for tool_type in cls._tools:
-            metadata = cls.get_tool_metadata(tool_type)
-            if metadata:
-                category_name = metadata.category.value
-
-                # Initialize category if not exists
-                if category_name not in tool_info["categories"]:
-                    tool_info["categories"][category_name] = {
-                        "name": category_name,
-                        "tools": []
-                    }
-
-                # Add tool to category
-                tool_data = {
-                    "id": metadata.id,
-                    "name": metadata.name,
-                    "description": metadata.description,
-                    "icon": metadata.icon,
-                    "version": metadata.version,
-                    "capabilities": [cap.value for cap in metadata.capabilities],
-                    "supported_document_types": [dt.value for dt in metadata.supported_document_types],
-                    "execution_time_estimate": metadata.execution_time_estimate,
-                    "batch_capable": metadata.batch_capable,
-                    "requires_llm": metadata.requires_llm,
-                    "requires_vector_search": metadata.requires_vector_search
-                }
-
-                tool_info["categories"][category_name]["tools"].append(tool_data)
-                tool_info["tools"][metadata.id] = tool_data
-
-        return tool_info
+        return cls._scan(with_info=True, with_stats=False)[0]
 
     @classmethod
     def get_stats(cls) -> Dict[str, Any]:
@@ -345,35 +662,17 @@ class DocumentToolRegistry:
         Returns:
             Statistics about registered tools
         """
-        total_tools = len(cls._tools)
-        active_instances = len(cls._instances)
-
-        # Count by category
-        category_counts = {}
-        capability_counts = {}
-        document_type_support = {}
+        return cls._scan(with_info=False, with_stats=True)[1]
 
-        for tool_type in cls._tools:
-            metadata = cls.get_tool_metadata(tool_type)
-            if metadata:
-                # Count categories
-                category = metadata.category.value
-                category_counts[category] = category_counts.get(category, 0) + 1
-
-                # Count capabilities
-                for capability in metadata.capabilities:
-                    cap_name = capability.value
-                    capability_counts[cap_name] = capability_counts.get(cap_name, 0) + 1
-
-                # Count document type support
-                for doc_type in metadata.supported_document_types:
-                    dt_name = doc_type.value
-                    document_type_support[dt_name] = document_type_support.get(dt_name, 0) + 1
+    @classmethod
+    def get_dashboard(cls) -> Dict[str, Any]:
+        """Get tool information and registry statistics in a single pass
 
+        Returns:
+            Dictionary with "tools" (as get_tool_info) and "statistics" (as get_stats)
+        """
+        tool_info, stats = cls._scan(with_info=True, with_stats=True)
         return {
-            "total_tools": total_tools,
-            "active_instances": active_instances,
-            "category_distribution": category_counts,
-            "capability_distribution": capability_counts,
-            "document_type_support": document_type_support
-        }
\ No newline at end of file
+            "tools": tool_info,
+            "statistics": stats
+        }
@@ -3,16 +3,14 @@
 # This module contains concrete implementations of document processing tools.
 # Tools are automatically discovered and registered via decorators.
 
-# Import all tool modules to trigger decorator registration
-try:
-    from . import validate_json_tool
-    from . import sentiment_analysis_tool
-    from . import find_similar_documents_tool
-    from . import extract_entities_tool
-except ImportError:
-    # Tools may not be implemented yet
-    pass
+# Import all tool modules to trigger decorator registration. This static list
+# is the canonical discovery path; add new tool modules here.
+from . import validate_json_tool
+from . import sentiment_analysis_tool
+from . import find_similar_documents_tool
 
 __all__ = [
-    # Tool modules will be added here as they are implemented
-]
\ No newline at end of file
+    "validate_json_tool",
+    "sentiment_analysis_tool",
+    "find_similar_documents_tool",
+]
@@ -1,6 +1,16 @@
 """Find similar documents tool using vector search"""
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
+import heapq
+import inspect
+import json
+import re
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, FrozenSet
 
 from ..base_tool import (
     BaseDocumentTool,
@@ -13,10 +23,80 @@ from ..tool_decorators import register_document_tool
 from ....models.document import DocumentType, DocumentMessage
 
 
+# Maximum number of characters of document text used as a similarity query
+_MAX_QUERY_LENGTH = 2000
+
+# JSON documents larger than this are not parsed for query text
+_MAX_JSON_PARSE_LENGTH = 64 * 1024
+
+# Similarity levels from most to least similar, as reported in statistics
+_SIMILARITY_LEVELS = ("very_high", "high", "medium", "low")
+
+# Lower score bounds of the medium/high/very_high levels; bisecting a score
+# into these edges indexes _LEVELS_BY_EDGE
+_LEVEL_EDGES = (0.7, 0.8, 0.9)
+_LEVELS_BY_EDGE = _SIMILARITY_LEVELS[::-1]
+
+# Query embeddings keyed by (sha256 of query text, provider, model), storing
+# (expiry time, embedding). Shared by all tool instances.
+_EMBEDDING_CACHE_SIZE = 2048
+_EMBEDDING_CACHE_TTL_SECONDS = 600.0
+_embedding_cache: "OrderedDict[Tuple[str, str, Optional[str]], Tuple[float, Tuple[float, ...]]]" = OrderedDict()
+
+# Keyword extraction: words of 3+ letters that are not stop words
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'between', 'among', 'this', 'that',
+    'these', 'those', 'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves',
+    'you', 'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself',
+    'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'they', 'them', 'their',
+    'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'am', 'is', 'are',
+    'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'having', 'do',
+    'does', 'did', 'doing', 'will', 'would', 'should', 'could', 'can', 'may',
+    'might', 'must', 'shall'
+})
+
+# Keyword sets of candidate documents keyed by a digest of their text, so
+# unchanged content is shared across versions and duplicate documents
+_DOCUMENT_KEYWORD_CACHE_SIZE = 10_000
+_document_keyword_cache: "OrderedDict[bytes, FrozenSet[str]]" = OrderedDict()
+# Candidates are scored in worker threads, so cache access is locked
+_document_keyword_lock = threading.Lock()
+
+
+# Keyword arguments passed to similarity_search for server-side exclusion
+_EXCLUSION_PARAMETERS = ("exclude_ids", "exclude_document_types")
+
+
+def _supports_exclusion(search) -> bool:
+    """Check whether a similarity_search callable accepts every exclusion argument
+
+    Args:
+        search: Vector search service's similarity_search
+
+    Returns:
+        True if all of _EXCLUSION_PARAMETERS can be passed to the service
+    """
+    try:
+        parameters = inspect.signature(search).parameters
+    except (TypeError, ValueError):
+        return False
+    if any(parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()):
+        return True
+    return all(
+        name in parameters and parameters[name].kind is not inspect.Parameter.POSITIONAL_ONLY
+        for name in _EXCLUSION_PARAMETERS
+    )
+
+
 @register_document_tool(DocumentToolType.FIND_SIMILAR_DOCUMENTS)
 class FindSimilarDocumentsTool(BaseDocumentTool):
     """Tool for finding similar documents using vector search"""
 
+    __slots__ = ()
+
     def get_metadata(self) -> DocumentToolMetadata:
         """Get tool metadata"""
         return DocumentToolMetadata(
@@ -123,22 +203,29 @@ class FindSimilarDocumentsTool(BaseDocumentTool):
                 }
             }
 
+        # Tokenize the query once; shared by keyword search and statistics
+        query_keywords = frozenset(self._extract_keywords(query_text))
+
         # Perform vector search if service is available
         if self.vector_search_service:
             similar_docs = await self._vector_similarity_search(
-                query_text, document, limit, similarity_threshold, exclude_same_type
+                query_text, document, limit, similarity_threshold, exclude_same_type,
+                query_keywords=query_keywords
             )
         else:
             # Fallback to keyword-based similarity
             similar_docs = await self._keyword_similarity_search(
-                query_text, document, limit, similarity_threshold, exclude_same_type
+                query_text, document, limit, similarity_threshold, exclude_same_type,
+                query_keywords=query_keywords
             )
 
         # Enrich results with additional metadata
         enriched_docs = await self._enrich_results(similar_docs, include_content)
 
         # Generate statistics
-        statistics = self._generate_search_statistics(similar_docs, query_text)
+        statistics = self._generate_search_statistics(
+            enriched_docs, query_text, query_keywords=query_keywords
+        )
 
         return {
             "similar_documents": enriched_docs,
@@ -153,101 +240,208 @@ class FindSimilarDocumentsTool(BaseDocumentTool):
 
     def _extract_query_text(self, document: DocumentMessage) -> str:
         """Extract text content suitable for similarity search"""
-        if not document.content:
+        content = document.content
+        if not content:
             return ""
 
         # Use formatted content if available, otherwise raw text
-        query_text = document.content.formatted_content or document.content.text or ""
+        query_text = content.formatted_content or content.raw_text
+        if not query_text:
+            return ""
 
-        # For JSON documents, extract meaningful text
-        if document.metadata.document_type == DocumentType.JSON:
+        # For JSON documents, extract meaningful text. Very large documents
+        # are not parsed; their leading text is used as-is instead.
+        if document.metadata.document_type == DocumentType.JSON and len(query_text) <= _MAX_JSON_PARSE_LENGTH:
             query_text = self._extract_json_text(query_text)
 
-        # Limit query length for performance
-        max_query_length = 2000
-        if len(query_text) > max_query_length:
-            query_text = query_text[:max_query_length]
-
-        return query_text.strip()
+        # Limit query length before stripping, so a large document is never
+        # scanned or copied in full
+        return query_text[:_MAX_QUERY_LENGTH].strip()
 
     def _extract_json_text(self, json_content: str) -> str:
         """Extract meaningful text from JSON content for similarity search"""
         try:
-            import json
             data = json.loads(json_content)
-
-            # Extract string values recursively
-            text_parts = []
-
-            def extract_strings(obj):
-                if isinstance(obj, str):
-                    # Skip very short strings and common technical terms
-                    if len(obj) > 3 and not obj.isdigit():
-                        text_parts.append(obj)
-                elif isinstance(obj, dict):
-                    for value in obj.values():
-                        extract_strings(value)
-                elif isinstance(obj, list):
-                    for item in obj:
-                        extract_strings(item)
-
-            extract_strings(data)
-            return " ".join(text_parts)
-
         except json.JSONDecodeError:
             # If not valid JSON, return original content
             return json_content
 
+        # Walk string values in document order with an explicit stack,
+        # stopping once enough text has been collected for the query
+        text_parts = []
+        append = text_parts.append
+        collected = 0
+        stack = [data]
+        pop = stack.pop
+        while stack and collected < _MAX_QUERY_LENGTH:
+            obj = pop()
+            obj_type = type(obj)
+            if obj_type is str:
+                # Skip very short strings and common technical terms
+                if len(obj) > 3 and not obj.isdigit():
+                    append(obj)
+                    collected += len(obj) + 1
+            elif obj_type is dict:
+                stack.extend(reversed(list(obj.values())))
+            elif obj_type is list:
+                stack.extend(reversed(obj))
+
+        return " ".join(text_parts)
+
     async def _vector_similarity_search(
         self,
         query_text: str,
         source_document: DocumentMessage,
         limit: int,
         threshold: float,
-        exclude_same_type: bool
+        exclude_same_type: bool,
+        query_keywords: Optional[FrozenSet[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Perform vector-based similarity search"""
+        """Perform vector-based similarity search
+
+        The source document (and, if requested, its document type) is
+        excluded by the vector service when it accepts exclude_ids /
+        exclude_document_types, so only `limit` results cross the wire.
+        Services without those arguments are over-fetched by one, and
+        paged further only if local filtering leaves too few results.
+        """
         try:
-            # Generate query embedding
-            query_embedding = await self.vector_search_service.generate_embedding(query_text)
-
-            # Search for similar documents
-            search_results = await self.vector_search_service.similarity_search(
-                query_vector=query_embedding,
-                limit=limit * 2,  # Get more results to filter
-                threshold=threshold
+            # Generate query embedding (cached by content hash)
+            query_embedding = await self._get_query_embedding(query_text)
+
+            source_id = source_document.metadata.document_id
+            source_type = source_document.metadata.document_type.value
+            search = self.vector_search_service.similarity_search
+
+            if _supports_exclusion(search):
+                search_results = await search(
+                    query_vector=query_embedding,
+                    limit=limit,
+                    threshold=threshold,
+                    exclude_ids=[source_id],
+                    exclude_document_types=[source_type] if exclude_same_type else None
+                )
+                return self._filter_vector_results(
+                    search_results, source_id, source_type, limit, exclude_same_type
+                )
+
+            fetch_limit = limit + 1
+            while True:
+                search_results = await search(
+                    query_vector=query_embedding,
+                    limit=fetch_limit,
+                    threshold=threshold
+                )
+                filtered_results = self._filter_vector_results(
+                    search_results, source_id, source_type, limit, exclude_same_type
+                )
+                if len(filtered_results) >= limit or len(search_results) < fetch_limit:
+                    return filtered_results
+                fetch_limit *= 2
+
+        except Exception as e:
+            # Fallback to keyword search if vector search fails
+            return await self._keyword_similarity_search(
+                query_text, source_document, limit, threshold, exclude_same_type,
+                query_keywords=query_keywords
             )
 
-            # Filter results
-            filtered_results = []
-            for result in search_results:
-                # Skip the source document itself
-                if result.get("document_id") == source_document.metadata.document_id:
-                    continue
+    def _filter_vector_results(
+        self,
+        search_results: List[Dict[str, Any]],
+        source_id: str,
+        source_type: str,
+        limit: int,
+        exclude_same_type: bool
+    ) -> List[Dict[str, Any]]:
+        """Drop excluded documents from vector results and normalize them
 
-                # Skip same document type if requested
-                if exclude_same_type and result.get("document_type") == source_document.metadata.document_type.value:
-                    continue
+        Args:
+            search_results: Raw results from the vector search service
+            source_id: ID of the source document
+            source_type: Document type value of the source document
+            limit: Maximum number of results to keep
+            exclude_same_type: Whether to drop documents of the source type
+
+        Returns:
+            Up to `limit` normalized results
+        """
+        filtered_results = []
+        if limit <= 0:
+            return filtered_results
 
-                filtered_results.append({
-                    "document_id": result.get("document_id"),
-                    "similarity_score": result.get("score", 0.0),
-                    "document_type": result.get("document_type"),
-                    "title": result.get("title"),
-                    "metadata": result.get("metadata", {}),
-                    "method": "vector_search"
-                })
+        # Bound append and a countdown keep the per-result loop lean
+        append = filtered_results.append
+        remaining = limit
+        for result in search_results:
+            get = result.get
+            document_id = get("document_id")
 
-                if len(filtered_results) >= limit:
-                    break
+            # Skip the source document itself
+            if document_id == source_id:
+                continue
 
-            return filtered_results
+            # Skip same document type if requested
+            document_type = get("document_type")
+            if exclude_same_type and document_type == source_type:
+                continue
 
-        except Exception as e:
-            # Fallback to keyword search if vector search fails
-            return await self._keyword_similarity_search(
-                query_text, source_document, limit, threshold, exclude_same_type
-            )
+            append({
+                "document_id": document_id,
+                "similarity_score": get("score", 0.0),
+                "document_type": document_type,
+                "title": get("title"),
+                "metadata": get("metadata", {}),
+                "method": "vector_search"
+            })
+
+            remaining -= 1
+            if not remaining:
+                break
+
+        return filtered_results
+
+    def _embedding_cache_key(self, query_text: str) -> Tuple[str, str, Optional[str]]:
+        """Build the embedding cache key for a query
+
+        Args:
+            query_text: Text being embedded
+
+        Returns:
+            Tuple of (content hash, provider name, model name)
+        """
+        service = self.vector_search_service
+        provider = getattr(service, "embedding_provider", None) or type(service).__name__
+        model = getattr(service, "embedding_model", None)
+        return hashlib.sha256(query_text.encode("utf-8")).hexdigest(), provider, model
+
+    async def _get_query_embedding(self, query_text: str) -> List[float]:
+        """Get the embedding for a query, reusing cached embeddings
+
+        Args:
+            query_text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        key = self._embedding_cache_key(query_text)
+        now = time.monotonic()
+
+        cached = _embedding_cache.get(key)
+        if cached is not None:
+            expires_at, embedding = cached
+            if expires_at > now:
+                _embedding_cache.move_to_end(key)
+                return list(embedding)
+            del _embedding_cache[key]
+
+        embedding = tuple(await self.vector_search_service.generate_embedding(query_text))
+
+        _embedding_cache[key] = (now + _EMBEDDING_CACHE_TTL_SECONDS, embedding)
+        if len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+        return list(embedding)
 
     async def _keyword_similarity_search(
         self,
@@ -255,14 +449,18 @@ class FindSimilarDocumentsTool(BaseDocumentTool):
         source_document: DocumentMessage,
         limit: int,
         threshold: float,
-        exclude_same_type: bool
+        exclude_same_type: bool,
+        query_keywords: Optional[FrozenSet[str]] = None
     ) -> List[Dict[str, Any]]:
         """Fallback keyword-based similarity search"""
         # This is a simplified implementation
         # In a real system, you would query your document storage
 
-        # Extract keywords from query
-        keywords = self._extract_keywords(query_text)
+        # Extract keywords from query once (unless the caller already did);
+        # candidates are compared by set intersection
+        keywords = query_keywords
+        if keywords is None:
+            keywords = frozenset(self._extract_keywords(query_text))
 
         if not self.document_service:
             return []
@@ -271,134 +469,245 @@ class FindSimilarDocumentsTool(BaseDocumentTool):
             # Get all documents (in real implementation, this would be paginated)
             all_documents = await self.document_service.list_documents(limit=100)
 
-            similar_docs = []
+            # Score candidates off the event loop; keyword extraction is CPU-bound
+            similar_docs = await asyncio.to_thread(
+                self._score_keyword_candidates,
+                all_documents,
+                keywords,
+                threshold,
+                exclude_same_type,
+                source_document.metadata.document_id,
+                source_document.metadata.document_type,
+                limit
+            )
+
+            return similar_docs
 
-            for doc in all_documents:
-                # Skip the source document
-                if doc.metadata.document_id == source_document.metadata.document_id:
-                    continue
+        except Exception as e:
+            return []
 
-                # Skip same document type if requested
-                if exclude_same_type and doc.metadata.document_type == source_document.metadata.document_type:
-                    continue
+    def _score_keyword_candidates(
+        self,
+        documents: List[DocumentMessage],
+        query_keywords: FrozenSet[str],
+        threshold: float,
+        exclude_same_type: bool,
+        source_document_id: str,
+        source_document_type: DocumentType,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Score candidate documents against the query keywords
 
-                # Calculate keyword-based similarity
-                if doc.content and doc.content.text:
-                    similarity = self._calculate_keyword_similarity(keywords, doc.content.text)
-
-                    if similarity >= threshold:
-                        similar_docs.append({
-                            "document_id": doc.metadata.document_id,
-                            "similarity_score": similarity,
-                            "document_type": doc.metadata.document_type.value,
-                            "title": doc.metadata.title,
-                            "metadata": {
-                                "created_at": doc.metadata.created_at.isoformat() if doc.metadata.created_at else None,
-                                "file_size": doc.metadata.file_size,
-                                "tags": doc.metadata.tags
-                            },
-                            "method": "keyword_search"
-                        })
-
-            # Sort by similarity score and limit results
-            similar_docs.sort(key=lambda x: x["similarity_score"], reverse=True)
-            return similar_docs[:limit]
+        Runs in a worker thread; see _keyword_similarity_search. The best
+        `limit` results are kept in a min-heap whose smallest score raises
+        the bar for the remaining candidates once it is full.
 
-        except Exception as e:
+        Args:
+            documents: Candidate documents
+            query_keywords: Keywords of the query
+            threshold: Minimum similarity score
+            exclude_same_type: Whether to skip documents of the source type
+            source_document_id: ID of the source document (always skipped)
+            source_document_type: Type of the source document
+            limit: Maximum number of results
+
+        Returns:
+            Up to `limit` results at or above the threshold, best first
+            (earlier candidates win ties)
+        """
+        query_size = len(query_keywords)
+        if limit <= 0 or (not query_size and threshold > 0):
+            # Nothing to return, or every similarity is 0.0
             return []
 
+        # Entries are (score, -position, result): on equal scores the later
+        # candidate sorts lower and is evicted first
+        heap: List[Tuple[float, int, Dict[str, Any]]] = []
+
+        for position, doc in enumerate(documents):
+            metadata = doc.metadata
+
+            # Cheap checks first: skip the source document
+            if metadata.document_id == source_document_id:
+                continue
+
+            # Skip same document type if requested
+            if exclude_same_type and metadata.document_type == source_document_type:
+                continue
+
+            content = doc.content
+            text = (content.formatted_content or content.raw_text) if content else None
+            if not text:
+                continue
+
+            # Optimistic bound: distinct keywords are 3+ letters plus a
+            # separator, so short texts cannot reach the threshold (or,
+            # once the heap is full, beat its weakest entry)
+            if query_size:
+                bound = min((len(text) + 1) // 4, query_size) / query_size
+                if bound < threshold or (len(heap) == limit and bound <= heap[0][0]):
+                    continue
+
+            # Calculate keyword-based similarity
+            document_keywords = self._document_keywords(doc)
+            if document_keywords is None:
+                continue
+
+            similarity = self._calculate_keyword_similarity(query_keywords, document_keywords)
+            if similarity < threshold or (len(heap) == limit and similarity <= heap[0][0]):
+                continue
+
+            entry = (similarity, -position, {
+                "document_id": metadata.document_id,
+                "similarity_score": similarity,
+                "document_type": metadata.document_type.value,
+                "title": metadata.title,
+                "metadata": {
+                    "created_at": metadata.created_at.isoformat() if metadata.created_at else None,
+                    "file_size": metadata.file_size,
+                    "tags": metadata.tags
+                },
+                "method": "keyword_search"
+            })
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
+
+        return [result for _, _, result in sorted(heap, reverse=True)]
+
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text for similarity matching"""
-        # Simple keyword extraction (could be improved with NLP)
-        import re
-
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'between', 'among', 'this', 'that',
-            'these', 'those', 'i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves',
-            'you', 'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself',
-            'she', 'her', 'hers', 'herself', 'it', 'its', 'itself', 'they', 'them', 'their',
-            'theirs', 'themselves', 'what', 'which', 'who', 'whom', 'this', 'that', 'these',
-            'those', 'am', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
-            'had', 'having', 'do', 'does', 'did', 'doing', 'will', 'would', 'should', 'could',
-            'can', 'may', 'might', 'must', 'shall'
-        }
+        # Simple keyword extraction (could be improved with NLP). Dedupe and
+        # drop stop words with C-level set operations, so the stop-word check
+        # runs once per distinct word rather than once per token
+        keywords = set(_WORD_RE.findall(text.lower()))
+        keywords -= _STOP_WORDS
+        return list(keywords)
 
-        # Extract words
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+    def _document_keywords(self, document: DocumentMessage) -> Optional[FrozenSet[str]]:
+        """Get the keyword set of a candidate document, caching by content
 
-        # Filter out stop words and short words
-        keywords = [word for word in words if word not in stop_words and len(word) >= 3]
+        Args:
+            document: Candidate document
+
+        Returns:
+            Frozen set of keywords, or None if the document has no text
+        """
+        content = document.content
+        text = (content.formatted_content or content.raw_text) if content else None
+        if not text:
+            return None
+
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with _document_keyword_lock:
+            keywords = _document_keyword_cache.get(key)
+            if keywords is not None:
+                _document_keyword_cache.move_to_end(key)
+                return keywords
+
+        keywords = frozenset(self._extract_keywords(text))
+        with _document_keyword_lock:
+            _document_keyword_cache[key] = keywords
+            if len(_document_keyword_cache) > _DOCUMENT_KEYWORD_CACHE_SIZE:
+                _document_keyword_cache.popitem(last=False)
+        return keywords
+
+    def _calculate_keyword_similarity(
+        self,
+        query_keywords: FrozenSet[str],
+        document_keywords: FrozenSet[str]
+    ) -> float:
+        """Calculate similarity based on keyword overlap
 
-        # Get unique keywords
-        return list(set(keywords))
+        Args:
+            query_keywords: Keywords of the query
+            document_keywords: Keywords of the candidate document
 
-    def _calculate_keyword_similarity(self, query_keywords: List[str], document_text: str) -> float:
-        """Calculate similarity based on keyword overlap"""
+        Returns:
+            Fraction of query keywords present in the document
+        """
         if not query_keywords:
             return 0.0
-
-        document_text_lower = document_text.lower()
-        matches = 0
-
-        for keyword in query_keywords:
-            if keyword in document_text_lower:
-                matches += 1
-
-        # Calculate Jaccard similarity coefficient
-        return matches / len(query_keywords)
+        return len(query_keywords & document_keywords) / len(query_keywords)
 
     async def _enrich_results(
         self,
         similar_docs: List[Dict[str, Any]],
         include_content: bool
     ) -> List[Dict[str, Any]]:
-        """Enrich similarity results with additional metadata"""
-        enriched_docs = []
+        """Enrich similarity results with additional metadata
+
+        The result dicts are built by this tool's search methods, so they are
+        enriched in place and the same list is returned.
+
+        Args:
+            similar_docs: Search results to enrich (consumed)
+            include_content: Whether to add content snippets
 
-        for doc in similar_docs:
-            enriched_doc = doc.copy()
+        Returns:
+            The enriched results
+        """
+        # Fetch snippets for all results concurrently when requested
+        snippets = [None] * len(similar_docs)
+        if include_content and self.document_service and similar_docs:
+            snippets = await asyncio.gather(
+                *(self._fetch_snippet(doc["document_id"]) for doc in similar_docs),
+                return_exceptions=True
+            )
 
+        for doc, snippet in zip(similar_docs, snippets):
             # Add content snippet if requested and document service is available
-            if include_content and self.document_service:
-                try:
-                    # Get document content
-                    full_doc = await self.document_service.get_document(doc["document_id"])
-                    if full_doc and full_doc.content and full_doc.content.text:
-                        # Extract a snippet
-                        content_text = full_doc.content.text
-                        snippet_length = 200
-                        enriched_doc["content_snippet"] = (
-                            content_text[:snippet_length] + "..."
-                            if len(content_text) > snippet_length
-                            else content_text
-                        )
-                except Exception:
-                    enriched_doc["content_snippet"] = "Content unavailable"
+            if isinstance(snippet, BaseException):
+                doc["content_snippet"] = "Content unavailable"
+            elif snippet:
+                doc["content_snippet"] = snippet
 
             # Add similarity interpretation
-            score = enriched_doc["similarity_score"]
-            if score >= 0.9:
-                enriched_doc["similarity_level"] = "very_high"
-            elif score >= 0.8:
-                enriched_doc["similarity_level"] = "high"
-            elif score >= 0.7:
-                enriched_doc["similarity_level"] = "medium"
-            else:
-                enriched_doc["similarity_level"] = "low"
+            doc["similarity_level"] = _LEVELS_BY_EDGE[
+                bisect_right(_LEVEL_EDGES, doc["similarity_score"])
+            ]
+
+        return similar_docs
 
-            enriched_docs.append(enriched_doc)
+    async def _fetch_snippet(self, document_id: str, snippet_length: int = 200) -> Optional[str]:
+        """Fetch a document and return only a short snippet of its content
 
-        return enriched_docs
+        The full document is released as soon as the snippet is sliced, so
+        concurrent fetches do not keep whole document bodies alive.
+
+        Args:
+            document_id: ID of the document
+            snippet_length: Maximum snippet length before the ellipsis
+
+        Returns:
+            Content snippet, or None if the document has no text
+        """
+        full_doc = await self.document_service.get_document(document_id)
+        content = full_doc.content if full_doc else None
+        content_text = (content.formatted_content or content.raw_text) if content else None
+        if not content_text:
+            return None
+        if len(content_text) > snippet_length:
+            return content_text[:snippet_length] + "..."
+        return content_text
 
     def _generate_search_statistics(
         self,
         similar_docs: List[Dict[str, Any]],
-        query_text: str
+        query_text: str,
+        query_keywords: Optional[FrozenSet[str]] = None
     ) -> Dict[str, Any]:
-        """Generate search statistics"""
+        """Generate search statistics
+
+        Args:
+            similar_docs: Results already enriched by _enrich_results
+            query_text: Query used for the search
+            query_keywords: Keywords already extracted from the query, if any
+
+        Returns:
+            Search statistics
+        """
         if not similar_docs:
             return {
                 "total_searched": 0,
@@ -410,18 +719,12 @@ class FindSimilarDocumentsTool(BaseDocumentTool):
             }
 
         scores = [doc["similarity_score"] for doc in similar_docs]
+        if query_keywords is None:
+            query_keywords = self._extract_keywords(query_text)
 
-        # Calculate similarity distribution
-        distribution = {"very_high": 0, "high": 0, "medium": 0, "low": 0}
-        for score in scores:
-            if score >= 0.9:
-                distribution["very_high"] += 1
-            elif score >= 0.8:
-                distribution["high"] += 1
-            elif score >= 0.7:
-                distribution["medium"] += 1
-            else:
-                distribution["low"] += 1
+        # Similarity levels were assigned by _enrich_results; just count them
+        distribution = dict.fromkeys(_SIMILARITY_LEVELS, 0)
+        distribution.update(Counter(doc["similarity_level"] for doc in similar_docs))
 
         return {
             "total_searched": len(similar_docs),  # Simplified
@@ -430,5 +733,5 @@ class FindSimilarDocumentsTool(BaseDocumentTool):
             "max_similarity": max(scores),
             "min_similarity": min(scores),
             "similarity_distribution": distribution,
-            "query_keywords": len(self._extract_keywords(query_text))
+            "query_keywords": len(query_keywords)
         }
\ No newline at end of file
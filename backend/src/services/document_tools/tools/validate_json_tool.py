@@ -1,9 +1,42 @@
 """JSON validation tool for checking JSON document validity and structure"""
 
+import asyncio
+import atexit
+import hashlib
+import io
 import json
-import jsonschema
-from typing import Dict, Any, Optional
-from jsonschema import validate, ValidationError, Draft7Validator
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+from jsonschema import Draft7Validator
+
+# Optional faster parser; the stdlib parser is used when it is missing.
+# Releases before 3.9.15 have no recursion limit and crash the interpreter
+# on deeply nested input, so text for those is depth-checked first.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    ORJSON_DEPTH_LIMITED = tuple(int(part) for part in re.findall(r"\d+", orjson.__version__)[:3]) >= (3, 9, 15)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    ORJSON_DEPTH_LIMITED = False
+
+# Optional schema compiler for the common all-valid case
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+# Optional event parser for analyzing large documents without a parsed tree
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 from ..base_tool import (
     BaseDocumentTool,
@@ -15,11 +48,752 @@ from ..tool_registry import DocumentToolType
 from ..tool_decorators import register_document_tool
 from ....models.document import DocumentType, DocumentMessage
 
+# Compiled schema validators kept per process; batch runs reuse one schema
+_VALIDATOR_CACHE_SIZE = 128
+
+# Schema keywords whose values are instance data rather than subschemas,
+# and keywords mapping names to subschemas; canonicalization leaves data
+# alone and never treats a property name as a keyword
+_SCHEMA_DATA_KEYWORDS = frozenset({"const", "default", "enum", "examples"})
+_SCHEMA_MAP_KEYWORDS = frozenset({
+    "$defs", "definitions", "dependencies", "patternProperties", "properties"
+})
+
+# orjson turns integers outside the 64-bit range into floats; any run of
+# this many digits may be such an integer, so those documents use the stdlib
+_LONG_DIGIT_RUN_RE = re.compile(r"\d{19}")
+
+# Strict-mode findings reported before the error list is truncated
+_MAX_STRICT_ERRORS = 100
+
+# Arrays with more elements than this are reported as large; callers can
+# override it per call with the large_array_threshold parameter
+_LARGE_ARRAY_THRESHOLD = 1000
+
+# Top-level objects nested deeper than this get a deep nesting warning
+_DEEP_NESTING_THRESHOLD = 10
+
+# Nesting depth past which analysis stops and the document is rejected,
+# bounding the walk on adversarial input such as [[[[...]]]] 100k deep
+_MAX_DEPTH = 1000
+
+# Escape sequences and the bytes other than quotes and brackets, dropped by
+# the nesting pre-scan that keeps deep text away from older orjson releases
+_JSON_ESCAPE_RE = re.compile(rb"\\.", re.DOTALL)
+_NON_STRUCTURAL_BYTES = bytes(byte for byte in range(256) if byte not in b'"[]{}')
+_BRACKET_DEPTH_DELTA = {ord("{"): 1, ord("["): 1, ord("}"): -1, ord("]"): -1}
+
+# One bit per parsed JSON type; an array is mixed when its OR-ed mask has
+# more than one bit set. Exact type() lookups keep bool apart from int.
+_TYPE_BITS = {
+    type(None): 1,
+    bool: 2,
+    int: 4,
+    float: 8,
+    str: 16,
+    list: 32,
+    dict: 64
+}
+_OTHER_TYPE_BIT = 128
+
+# Documents at least this long are analyzed from parser events when no
+# schema or strict checks need the parsed tree, keeping memory O(depth)
+_STREAM_ANALYSIS_MIN_LENGTH = 8 * 1024 * 1024
+
+# Worker processes for batch validation, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+class _SchemaKey:
+    """Validator cache key holding a canonical schema, compared by digest"""
+
+    __slots__ = ("canonical", "digest")
+
+    def __init__(self, canonical: str):
+        self.canonical = canonical
+        self.digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _SchemaKey) and self.digest == other.digest
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _get_validator(schema_key: _SchemaKey) -> Draft7Validator:
+    """Build a validator for a canonical schema
+
+    The schema is checked against the metaschema once; later lookups for the
+    same schema skip both the check and the validator construction.
+
+    Args:
+        schema_key: Cache key from _schema_key
+
+    Returns:
+        Validator ready for iter_errors
+    """
+    schema = json.loads(schema_key.canonical)
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _get_fast_validator(schema_key: _SchemaKey) -> Optional[Callable[[Any], Any]]:
+    """Compile a schema to a specialized check function with fastjsonschema
+
+    Defaults are not filled in and formats are not checked, matching how
+    Draft7Validator is used. The check only says pass/fail; failures are
+    re-run through Draft7Validator to report every error.
+
+    Args:
+        schema_key: Cache key from _schema_key
+
+    Returns:
+        Compiled check function, or None when fastjsonschema is missing or
+        cannot compile the schema
+    """
+    if not FASTJSONSCHEMA_AVAILABLE:
+        return None
+    try:
+        return fastjsonschema.compile(
+            json.loads(schema_key.canonical),
+            use_default=False,
+            use_formats=False,
+            detailed_exceptions=False
+        )
+    except Exception:
+        return None
+
+
+def _passes(fast_check: Callable[[Any], Any], json_data: Any) -> bool:
+    """Run a compiled fastjsonschema check"""
+    try:
+        fast_check(json_data)
+    except fastjsonschema.JsonSchemaValueException:
+        return False
+    return True
+
+
+def _nesting_exceeds(json_content: str, limit: int) -> bool:
+    """Check whether JSON text nests arrays/objects deeper than a limit
+
+    Bracket counts bound the depth, so small documents are settled by two
+    str.count calls. Otherwise escapes and everything but quotes and
+    brackets are dropped, the quoted spans are split away, and the
+    remaining brackets are summed as running +1/-1 depth changes.
+
+    Args:
+        json_content: JSON document text
+        limit: Maximum allowed nesting depth
+
+    Returns:
+        True if some bracket outside a string literal is nested deeper
+    """
+    if json_content.count("{") + json_content.count("[") <= limit:
+        return False
+    data = json_content.encode("utf-8", "surrogatepass")
+    if b"\\" in data:
+        data = _JSON_ESCAPE_RE.sub(b"", data)
+    brackets = b"".join(data.translate(None, _NON_STRUCTURAL_BYTES).split(b'"')[::2])
+    return max(accumulate(map(_BRACKET_DEPTH_DELTA.__getitem__, brackets)), default=0) > limit
+
+
+def _parse_json(json_content: str) -> Any:
+    """Parse JSON text, preferring orjson when it is installed
+
+    orjson is stricter than the stdlib parser (no NaN/Infinity) and reads
+    integers beyond 64 bits as floats, so anything it rejects, or that may
+    hold such an integer, is parsed with json.loads. That keeps the parsed
+    values and the syntax error details identical to the stdlib. With
+    orjson releases that lack a recursion limit, text nested deeper than
+    _MAX_DEPTH also goes to json.loads, which raises RecursionError where
+    orjson would crash.
+
+    Args:
+        json_content: JSON document text
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+        RecursionError: If the text is nested too deeply to parse
+    """
+    if (
+        ORJSON_AVAILABLE
+        and not _LONG_DIGIT_RUN_RE.search(json_content)
+        and (ORJSON_DEPTH_LIMITED or not _nesting_exceeds(json_content, _MAX_DEPTH))
+    ):
+        try:
+            return orjson.loads(json_content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_content)
+
+
+def _canonical_schema_node(node: Any) -> Any:
+    """Normalize one schema node for _canonicalize_schema"""
+    if isinstance(node, list):
+        return [_canonical_schema_node(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    canonical = {}
+    for key, value in node.items():
+        if key == "$comment":
+            continue
+        if key in _SCHEMA_DATA_KEYWORDS:
+            canonical[key] = value
+        elif key in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            canonical[key] = {name: _canonical_schema_node(sub) for name, sub in value.items()}
+        elif key == "type" and isinstance(value, list) and len(value) == 1:
+            canonical[key] = value[0]
+        else:
+            canonical[key] = _canonical_schema_node(value)
+    return canonical
+
+
+def _canonicalize_schema(schema: Dict[str, Any]) -> str:
+    """Serialize a schema so equivalent spellings produce the same text
+
+    Keys are sorted at every level, single-entry type lists become the bare
+    type name and $comment annotations are dropped. None of these change
+    validation results or error messages.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Canonical JSON text with compact separators
+    """
+    return json.dumps(_canonical_schema_node(schema), sort_keys=True, separators=(",", ":"))
+
+
+def _schema_key(schema: Dict[str, Any]) -> _SchemaKey:
+    """Build the validator cache key for a schema"""
+    return _SchemaKey(_canonicalize_schema(schema))
+
+
+def _json_content(document: DocumentMessage) -> str:
+    """Extract the JSON text from a document"""
+    if not document.content:
+        return ""
+    return document.content.raw_text or document.content.formatted_content
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared batch validation process pool, creating it on first use
+
+    The pool is shut down at interpreter exit.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        atexit.register(_shutdown_process_pool)
+    return _process_pool
+
+
+def _shutdown_process_pool():
+    """Shut down the batch validation process pool if it was created"""
+    global _process_pool
+    pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _validate_json_batch(
+    json_contents: List[Optional[str]],
+    schema: Optional[Dict[str, Any]],
+    strict: bool,
+    collect_statistics: bool = True,
+    additional_checks: bool = True,
+    large_array_threshold: int = _LARGE_ARRAY_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """Validate a chunk of JSON texts with the same options in one worker call
+
+    Args:
+        json_contents: JSON document texts
+        schema: JSON schema to validate against (optional)
+        strict: Whether to enable strict validation
+        collect_statistics: Whether to gather structure statistics
+        additional_checks: Whether to run the structure and strict checks
+        large_array_threshold: Array size above which arrays are reported
+
+    Returns:
+        Validation results in the same order as the texts
+    """
+    return [
+        _validate_json(
+            json_content, schema, strict, collect_statistics, additional_checks, large_array_threshold
+        )
+        for json_content in json_contents
+    ]
+
+
+def _validate_json(
+    json_content: Optional[str],
+    schema: Optional[Dict[str, Any]],
+    strict: bool,
+    collect_statistics: bool = True,
+    additional_checks: bool = True,
+    large_array_threshold: int = _LARGE_ARRAY_THRESHOLD
+) -> Dict[str, Any]:
+    """Validate JSON text for syntax, schema compliance and structure
+
+    Kept at module level so batch validation can run it in worker processes.
+    With both collect_statistics and additional_checks off the structure
+    walk is skipped, leaving only the parse and the schema check.
+
+    Args:
+        json_content: JSON document text
+        schema: JSON schema to validate against (optional)
+        strict: Whether to enable strict validation
+        collect_statistics: Whether to gather structure statistics
+        additional_checks: Whether to run the structure and strict checks
+        large_array_threshold: Array size above which arrays are reported
+
+    Returns:
+        Validation results with errors, warnings, and statistics
+    """
+    if not json_content:
+        return {
+            "valid": False,
+            "errors": ["No JSON content found in document"],
+            "warnings": [],
+            "statistics": {}
+        }
+
+    walk = collect_statistics or additional_checks
+    if (
+        walk
+        and IJSON_AVAILABLE
+        and not schema
+        and not (strict and additional_checks)
+        and len(json_content) >= _STREAM_ANALYSIS_MIN_LENGTH
+    ):
+        try:
+            validation_results, statistics = _analyze_events(ijson.basic_parse(
+                io.BytesIO(json_content.encode("utf-8")),
+                use_float=True
+            ), large_array_threshold)
+        except (ijson.JSONError, ValueError, RecursionError):
+            # Syntax errors (and values only the stdlib accepts, such as
+            # NaN) go through the regular parse for the usual details
+            pass
+        else:
+            return {
+                "valid": not validation_results["errors"],
+                "errors": validation_results["errors"],
+                "warnings": validation_results["warnings"] if additional_checks else [],
+                "statistics": statistics if collect_statistics else {}
+            }
+
+    # Validate JSON syntax
+    errors = []
+    warnings = []
+    json_data = None
+
+    try:
+        json_data = _parse_json(json_content)
+    except json.JSONDecodeError as e:
+        errors.append({
+            "type": "syntax_error",
+            "message": f"Invalid JSON syntax: {str(e)}",
+            "line": getattr(e, 'lineno', None),
+            "column": getattr(e, 'colno', None)
+        })
+    except RecursionError:
+        errors.append({
+            "type": "max_depth_exceeded",
+            "message": "JSON nesting is too deep to parse"
+        })
+
+    statistics = {}
+
+    # If JSON is valid, proceed with additional validation
+    if json_data is not None:
+        # Schema validation
+        if schema:
+            try:
+                schema_key = _schema_key(schema)
+                validator = _get_validator(schema_key)
+                fast_check = _get_fast_validator(schema_key)
+                if fast_check is not None and _passes(fast_check, json_data):
+                    schema_errors = ()
+                else:
+                    schema_errors = validator.iter_errors(json_data)
+                for e in schema_errors:
+                    errors.append({
+                        "type": "schema_validation",
+                        "message": f"Schema validation failed: {e.message}",
+                        "path": list(e.absolute_path),
+                        "schema_path": list(e.schema_path)
+                    })
+            except Exception as e:
+                errors.append({
+                    "type": "schema_error",
+                    "message": f"Schema validation error: {str(e)}"
+                })
+
+        # Additional validation checks and statistics in one pass
+        if walk:
+            validation_results, walk_statistics = _analyze(
+                json_data, strict and additional_checks, large_array_threshold
+            )
+            errors.extend(validation_results["errors"])
+            if additional_checks:
+                warnings.extend(validation_results["warnings"])
+                errors.extend(validation_results["strict_errors"])
+            if collect_statistics:
+                statistics = walk_statistics
+
+    return {
+        "valid": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "statistics": statistics
+    }
+
+
+def _materialize_path(node: Tuple[Any, Any]) -> str:
+    """Build the dotted path string for a linked path node
+
+    Args:
+        node: (parent node, object key or array index); the root is
+            (None, None)
+
+    Returns:
+        Path such as root.items[2].name
+    """
+    segments = []
+    parent, segment = node
+    while parent is not None:
+        segments.append(f"[{segment}]" if type(segment) is int else f".{segment}")
+        parent, segment = parent
+    return "root" + "".join(reversed(segments))
+
+
+def _analyze(
+    json_data: Any,
+    strict: bool,
+    large_array_threshold: int = _LARGE_ARRAY_THRESHOLD
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run the additional validation checks and gather statistics
+
+    The tree is walked once with an explicit stack, so every check and
+    counter shares a single visit per node and deep documents cannot hit
+    the recursion limit. Children are pushed in reverse to keep findings
+    in document order. The walk stops at the first node deeper than
+    _MAX_DEPTH, leaving the statistics partial.
+
+    Args:
+        json_data: Parsed JSON data
+        strict: Whether to enable strict validation
+        large_array_threshold: Array size above which arrays are reported
+
+    Returns:
+        Tuple of (dictionary with errors, warnings and strict errors,
+        statistics)
+    """
+    type_distribution: Dict[str, int] = {}
+    total_keys = total_arrays = total_objects = 0
+    total_primitives = total_null_values = max_depth = 0
+    errors = []
+    large_arrays = []
+    null_paths = []
+    inconsistent_arrays = []
+
+    # Null and array type checks only apply to top-level objects; they
+    # stop once the error budget is spent while the statistics carry on
+    check_strict = strict and isinstance(json_data, dict)
+    strict_budget = _MAX_STRICT_ERRORS
+    truncated = False
+
+    type_bit = _TYPE_BITS.get
+    # Paths are (parent node, key or index) links, turned into strings only
+    # for the nodes that end up in a finding; only containers need a node
+    stack = [(json_data, None, None, 0)]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        obj, parent, segment, depth = pop()
+        if depth > max_depth:
+            max_depth = depth
+            if depth > _MAX_DEPTH:
+                errors.append(_max_depth_error(depth))
+                break
+
+        # Parsed JSON only holds exact dicts and lists, so identity checks
+        # on the type replace two isinstance calls per node
+        obj_type = type(obj)
+        if obj is None:
+            total_null_values += 1
+            total_primitives += 1
+            type_name = "null"
+            if check_strict:
+                if strict_budget:
+                    null_paths.append(_materialize_path((parent, segment)))
+                    strict_budget -= 1
+                else:
+                    check_strict = False
+                    truncated = True
+        elif obj_type is dict:
+            total_objects += 1
+            total_keys += len(obj)
+            type_name = "object"
+            node = (parent, segment)
+            child_depth = depth + 1
+            extend(zip(
+                reversed(obj.values()), repeat(node), reversed(obj.keys()), repeat(child_depth)
+            ))
+        elif obj_type is list:
+            total_arrays += 1
+            type_name = "array"
+            node = (parent, segment)
+            size = len(obj)
+            if size > large_array_threshold:
+                large_arrays.append((_materialize_path(node), size))
+            if check_strict and obj:
+                mask = 0
+                for item in obj:
+                    mask |= type_bit(type(item), _OTHER_TYPE_BIT)
+                    if mask & (mask - 1):
+                        break
+                if mask & (mask - 1):
+                    if strict_budget:
+                        types = list(set(type(item).__name__ for item in obj))
+                        inconsistent_arrays.append((_materialize_path(node), types))
+                        strict_budget -= 1
+                    else:
+                        check_strict = False
+                        truncated = True
+            child_depth = depth + 1
+            extend(zip(
+                reversed(obj), repeat(node), range(size - 1, -1, -1), repeat(child_depth)
+            ))
+        else:
+            total_primitives += 1
+            type_name = obj_type.__name__
+
+        type_distribution[type_name] = type_distribution.get(type_name, 0) + 1
+
+    statistics = {
+        "total_keys": total_keys,
+        "total_arrays": total_arrays,
+        "total_objects": total_objects,
+        "total_primitives": total_primitives,
+        "max_depth": max_depth,
+        "total_null_values": total_null_values,
+        "type_distribution": type_distribution
+    }
+
+    warnings = []
+    strict_errors = []
+
+    # Check for common issues
+    if isinstance(json_data, dict):
+        warnings.extend(_structure_warnings(len(json_data) == 0, max_depth, large_arrays))
+
+        # Strict mode checks
+        for path in null_paths:
+            strict_errors.append({
+                "type": "null_value",
+                "message": f"Null value found at {path}",
+                "path": path
+            })
+        for path, types in inconsistent_arrays:
+            strict_errors.append({
+                "type": "inconsistent_array",
+                "message": f"Array at {path} contains inconsistent types: {types}",
+                "path": path,
+                "types": types
+            })
+        if truncated:
+            warnings.append({
+                "type": "truncated",
+                "message": f"Strict error list truncated at {_MAX_STRICT_ERRORS} entries"
+            })
+
+    return {
+        "errors": errors,
+        "warnings": warnings,
+        "strict_errors": strict_errors
+    }, statistics
+
+
+def _max_depth_error(depth: int) -> Dict[str, Any]:
+    """Build the error reported when nesting exceeds _MAX_DEPTH"""
+    return {
+        "type": "max_depth_exceeded",
+        "message": f"JSON nesting exceeds the maximum depth of {_MAX_DEPTH}",
+        "depth": depth
+    }
+
+
+def _structure_warnings(
+    empty_object: bool,
+    max_depth: int,
+    large_arrays: List[Tuple[str, int]]
+) -> List[Dict[str, Any]]:
+    """Build the structure warnings for a top-level JSON object
+
+    Args:
+        empty_object: Whether the object has no keys
+        max_depth: Maximum nesting depth
+        large_arrays: (path, size) of arrays over the large array threshold,
+            in document order
+
+    Returns:
+        List of warning dictionaries
+    """
+    warnings = []
+
+    # Check for empty objects
+    if empty_object:
+        warnings.append({
+            "type": "empty_object",
+            "message": "JSON object is empty"
+        })
+
+    # Check for very deep nesting
+    if max_depth > _DEEP_NESTING_THRESHOLD:
+        warnings.append({
+            "type": "deep_nesting",
+            "message": f"JSON has deep nesting (depth: {max_depth})",
+            "depth": max_depth
+        })
+
+    # Check for large arrays
+    for path, size in large_arrays:
+        warnings.append({
+            "type": "large_array",
+            "message": f"Large array found at {path} with {size} elements",
+            "path": path,
+            "size": size
+        })
+
+    return warnings
+
+
+def _analyze_events(
+    events: Iterable[Tuple[str, Any]],
+    large_array_threshold: int = _LARGE_ARRAY_THRESHOLD
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run the non-strict checks and gather statistics from parser events
+
+    Produces the same results as _analyze(json_data, strict=False) from an
+    ijson basic_parse event stream, holding only the open containers rather
+    than the whole parsed tree. Duplicate object keys are all counted here,
+    where a parsed dict would keep only the last one. Reading stops at the
+    first value deeper than _MAX_DEPTH.
+
+    Args:
+        events: (event, value) pairs from ijson.basic_parse
+        large_array_threshold: Array size above which arrays are reported
+
+    Returns:
+        Tuple of (dictionary with errors, warnings and strict errors,
+        statistics)
+    """
+    type_distribution: Dict[str, int] = {}
+    total_keys = total_arrays = total_objects = 0
+    total_primitives = total_null_values = max_depth = 0
+    errors = []
+    large_arrays = []
+    root_is_object = False
+    root_is_empty = False
+
+    # Open containers as [path, is_array, child count, current key or, for
+    # arrays, opening order]
+    frames: List[List[Any]] = []
+    for event, value in events:
+        if event == "map_key":
+            frames[-1][3] = value
+            continue
+        if event == "end_map" or event == "end_array":
+            path, is_array, count, order = frames.pop()
+            if is_array:
+                if count > large_array_threshold:
+                    large_arrays.append((order, path, count))
+            else:
+                total_keys += count
+                if not frames:
+                    root_is_empty = count == 0
+            continue
+
+        depth = len(frames)
+        if depth > max_depth:
+            max_depth = depth
+            if depth > _MAX_DEPTH:
+                errors.append(_max_depth_error(depth))
+                break
+
+        if event == "start_map" or event == "start_array":
+            if frames:
+                parent = frames[-1]
+                if parent[1]:
+                    path = f"{parent[0]}[{parent[2]}]"
+                else:
+                    path = f"{parent[0]}.{parent[3]}"
+                parent[2] += 1
+            else:
+                path = "root"
+                root_is_object = event == "start_map"
+            if event == "start_map":
+                total_objects += 1
+                type_name = "object"
+                frames.append([path, False, 0, None])
+            else:
+                # Arrays close in post-order; keep the opening order to
+                # report them in document order
+                frames.append([path, True, 0, total_arrays])
+                total_arrays += 1
+                type_name = "array"
+        else:
+            if frames:
+                frames[-1][2] += 1
+            total_primitives += 1
+            if event == "null":
+                total_null_values += 1
+                type_name = "null"
+            else:
+                type_name = type(value).__name__
+
+        type_distribution[type_name] = type_distribution.get(type_name, 0) + 1
+
+    statistics = {
+        "total_keys": total_keys,
+        "total_arrays": total_arrays,
+        "total_objects": total_objects,
+        "total_primitives": total_primitives,
+        "max_depth": max_depth,
+        "total_null_values": total_null_values,
+        "type_distribution": type_distribution
+    }
+
+    warnings = []
+    if root_is_object:
+        large_arrays.sort()
+        warnings = _structure_warnings(
+            root_is_empty,
+            max_depth,
+            [(path, size) for _, path, size in large_arrays]
+        )
+
+    return {
+        "errors": errors,
+        "warnings": warnings,
+        "strict_errors": []
+    }, statistics
+
 
 @register_document_tool(DocumentToolType.VALIDATE_JSON)
 class ValidateJSONTool(BaseDocumentTool):
     """Tool for validating JSON documents and checking against schemas"""
 
+    __slots__ = ()
+
     def get_metadata(self) -> DocumentToolMetadata:
         """Get tool metadata"""
         return DocumentToolMetadata(
@@ -45,6 +819,25 @@ class ValidateJSONTool(BaseDocumentTool):
                     "required": False,
                     "default": False,
                     "description": "Enable strict validation mode"
+                },
+                "collect_statistics": {
+                    "type": "bool",
+                    "required": False,
+                    "default": True,
+                    "description": "Gather JSON structure statistics"
+                },
+                "additional_checks": {
+                    "type": "bool",
+                    "required": False,
+                    "default": True,
+                    "description": "Run structure warnings and strict checks; turn off "
+                                   "with collect_statistics for a syntax/schema-only check"
+                },
+                "large_array_threshold": {
+                    "type": "int",
+                    "required": False,
+                    "default": _LARGE_ARRAY_THRESHOLD,
+                    "description": "Array size above which a large array warning is raised"
                 }
             },
             output_schema={
@@ -78,7 +871,8 @@ class ValidateJSONTool(BaseDocumentTool):
 
         Args:
             document: Document containing JSON content
-            parameters: Validation parameters (schema, strict mode)
+            parameters: Validation parameters (schema, strict mode,
+                statistics and additional check switches)
 
         Returns:
             Validation results with errors, warnings, and statistics
@@ -89,252 +883,56 @@ class ValidateJSONTool(BaseDocumentTool):
         parameters = parameters or {}
         schema = parameters.get("schema")
         strict = parameters.get("strict", False)
+        collect_statistics = parameters.get("collect_statistics", True)
+        additional_checks = parameters.get("additional_checks", True)
+        large_array_threshold = parameters.get("large_array_threshold", _LARGE_ARRAY_THRESHOLD)
 
-        # Extract JSON content
-        json_content = document.content.text if document.content else ""
-
-        if not json_content:
-            return {
-                "valid": False,
-                "errors": ["No JSON content found in document"],
-                "warnings": [],
-                "statistics": {}
-            }
-
-        # Validate JSON syntax
-        errors = []
-        warnings = []
-        json_data = None
-
-        try:
-            json_data = json.loads(json_content)
-        except json.JSONDecodeError as e:
-            errors.append({
-                "type": "syntax_error",
-                "message": f"Invalid JSON syntax: {str(e)}",
-                "line": getattr(e, 'lineno', None),
-                "column": getattr(e, 'colno', None)
-            })
-
-        # If JSON is valid, proceed with additional validation
-        if json_data is not None:
-            # Schema validation
-            if schema:
-                try:
-                    validate(instance=json_data, schema=schema)
-                except ValidationError as e:
-                    errors.append({
-                        "type": "schema_validation",
-                        "message": f"Schema validation failed: {e.message}",
-                        "path": list(e.absolute_path),
-                        "schema_path": list(e.schema_path)
-                    })
-                except Exception as e:
-                    errors.append({
-                        "type": "schema_error",
-                        "message": f"Schema validation error: {str(e)}"
-                    })
-
-            # Additional validation checks
-            validation_results = self._perform_additional_validation(json_data, strict)
-            warnings.extend(validation_results["warnings"])
-            if strict:
-                errors.extend(validation_results["strict_errors"])
-
-            # Generate statistics
-            statistics = self._generate_statistics(json_data)
-        else:
-            statistics = {}
-
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
-            "statistics": statistics
-        }
+        json_content = _json_content(document)
+        return _validate_json(
+            json_content, schema, strict, collect_statistics, additional_checks, large_array_threshold
+        )
 
-    def _perform_additional_validation(
+    async def execute_batch(
         self,
-        json_data: Any,
-        strict: bool
-    ) -> Dict[str, Any]:
-        """Perform additional JSON validation checks
+        documents: List[DocumentMessage],
+        parameters: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Validate several JSON documents in worker processes
+
+        Parsing and the structure walk are CPU bound, so documents are spread
+        across a process pool instead of blocking the event loop one by one.
+        Each worker gets one contiguous chunk, so the schema, options and
+        event loop round trip are paid once per worker rather than per
+        document.
 
         Args:
-            json_data: Parsed JSON data
-            strict: Whether to enable strict validation
+            documents: Documents containing JSON content
+            parameters: Validation parameters (as for execute) for all documents
 
         Returns:
-            Dictionary with warnings and strict errors
+            Validation results in the same order as the documents
         """
-        warnings = []
-        strict_errors = []
-
-        # Check for common issues
-        if isinstance(json_data, dict):
-            # Check for duplicate keys (this is already handled by json.loads)
-            # Check for empty objects
-            if len(json_data) == 0:
-                warnings.append({
-                    "type": "empty_object",
-                    "message": "JSON object is empty"
-                })
-
-            # Check for very deep nesting
-            max_depth = self._calculate_max_depth(json_data)
-            if max_depth > 10:
-                warnings.append({
-                    "type": "deep_nesting",
-                    "message": f"JSON has deep nesting (depth: {max_depth})",
-                    "depth": max_depth
-                })
-
-            # Check for large arrays
-            large_arrays = self._find_large_arrays(json_data)
-            for path, size in large_arrays:
-                if size > 1000:
-                    warnings.append({
-                        "type": "large_array",
-                        "message": f"Large array found at {path} with {size} elements",
-                        "path": path,
-                        "size": size
-                    })
+        for document in documents:
+            self.validate_input(document, parameters)
 
-            # Strict mode checks
-            if strict:
-                # Check for null values
-                null_paths = self._find_null_values(json_data)
-                for path in null_paths:
-                    strict_errors.append({
-                        "type": "null_value",
-                        "message": f"Null value found at {path}",
-                        "path": path
-                    })
-
-                # Check for inconsistent types in arrays
-                inconsistent_arrays = self._find_inconsistent_arrays(json_data)
-                for path, types in inconsistent_arrays:
-                    strict_errors.append({
-                        "type": "inconsistent_array",
-                        "message": f"Array at {path} contains inconsistent types: {types}",
-                        "path": path,
-                        "types": types
-                    })
-
-        return {
-            "warnings": warnings,
-            "strict_errors": strict_errors
-        }
-
-    def _calculate_max_depth(self, obj: Any, current_depth: int = 0) -> int:
-        """Calculate maximum nesting depth of JSON object"""
-        if isinstance(obj, dict):
-            if not obj:
-                return current_depth
-            return max(
-                self._calculate_max_depth(value, current_depth + 1)
-                for value in obj.values()
-            )
-        elif isinstance(obj, list):
-            if not obj:
-                return current_depth
-            return max(
-                self._calculate_max_depth(item, current_depth + 1)
-                for item in obj
-            )
-        else:
-            return current_depth
-
-    def _find_large_arrays(self, obj: Any, path: str = "root") -> list:
-        """Find arrays with more than threshold elements"""
-        large_arrays = []
-
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = f"{path}.{key}"
-                large_arrays.extend(self._find_large_arrays(value, new_path))
-        elif isinstance(obj, list):
-            if len(obj) > 100:  # Threshold for "large" array
-                large_arrays.append((path, len(obj)))
-            for i, item in enumerate(obj):
-                new_path = f"{path}[{i}]"
-                large_arrays.extend(self._find_large_arrays(item, new_path))
-
-        return large_arrays
-
-    def _find_null_values(self, obj: Any, path: str = "root") -> list:
-        """Find null values in JSON structure"""
-        null_paths = []
-
-        if obj is None:
-            null_paths.append(path)
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = f"{path}.{key}"
-                null_paths.extend(self._find_null_values(value, new_path))
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                new_path = f"{path}[{i}]"
-                null_paths.extend(self._find_null_values(item, new_path))
-
-        return null_paths
-
-    def _find_inconsistent_arrays(self, obj: Any, path: str = "root") -> list:
-        """Find arrays with inconsistent element types"""
-        inconsistent_arrays = []
-
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_path = f"{path}.{key}"
-                inconsistent_arrays.extend(self._find_inconsistent_arrays(value, new_path))
-        elif isinstance(obj, list):
-            if obj:  # Non-empty array
-                types = set(type(item).__name__ for item in obj)
-                if len(types) > 1:
-                    inconsistent_arrays.append((path, list(types)))
-
-            for i, item in enumerate(obj):
-                new_path = f"{path}[{i}]"
-                inconsistent_arrays.extend(self._find_inconsistent_arrays(item, new_path))
-
-        return inconsistent_arrays
-
-    def _generate_statistics(self, json_data: Any) -> Dict[str, Any]:
-        """Generate statistics about JSON structure"""
-        stats = {
-            "total_keys": 0,
-            "total_arrays": 0,
-            "total_objects": 0,
-            "total_primitives": 0,
-            "max_depth": 0,
-            "total_null_values": 0,
-            "type_distribution": {}
-        }
-
-        def analyze_recursive(obj, depth=0):
-            stats["max_depth"] = max(stats["max_depth"], depth)
-
-            if obj is None:
-                stats["total_null_values"] += 1
-                stats["total_primitives"] += 1
-                type_name = "null"
-            elif isinstance(obj, dict):
-                stats["total_objects"] += 1
-                stats["total_keys"] += len(obj)
-                type_name = "object"
-                for value in obj.values():
-                    analyze_recursive(value, depth + 1)
-            elif isinstance(obj, list):
-                stats["total_arrays"] += 1
-                type_name = "array"
-                for item in obj:
-                    analyze_recursive(item, depth + 1)
-            else:
-                stats["total_primitives"] += 1
-                type_name = type(obj).__name__
-
-            # Update type distribution
-            stats["type_distribution"][type_name] = stats["type_distribution"].get(type_name, 0) + 1
+        parameters = parameters or {}
+        options = (
+            parameters.get("schema"),
+            parameters.get("strict", False),
+            parameters.get("collect_statistics", True),
+            parameters.get("additional_checks", True),
+            parameters.get("large_array_threshold", _LARGE_ARRAY_THRESHOLD)
+        )
 
-        analyze_recursive(json_data)
-        return stats
\ No newline at end of file
+        contents = [_json_content(document) for document in documents]
+        if len(contents) <= 1:
+            return _validate_json_batch(contents, *options)
+
+        chunk_size = -(-len(contents) // min(len(contents), os.cpu_count() or 1))
+        loop = asyncio.get_running_loop()
+        pool = _get_process_pool()
+        chunk_results = await asyncio.gather(*(
+            loop.run_in_executor(pool, _validate_json_batch, contents[start:start + chunk_size], *options)
+            for start in range(0, len(contents), chunk_size)
+        ))
+        return [result for chunk in chunk_results for result in chunk]
@@ -0,0 +1,116 @@
+"""Generated input validators shared by the document and LLM tool base classes"""
+
+from typing import Dict, Any, Optional, Callable
+
+
+# Python types accepted for each input_schema "type" value, with the noun
+# available to type error messages
+_SCHEMA_TYPE_CHECKS: Dict[str, Any] = {
+    "str": (str, "a string"),
+    "int": (int, "an integer"),
+    "float": ((int, float), "a number"),
+    "bool": (bool, "a boolean"),
+    "list": (list, "a list"),
+    "dict": (dict, "a dictionary")
+}
+
+# Generated validators keyed by schema signature, messages and length limit
+_VALIDATOR_CACHE: Dict[tuple, Callable[..., bool]] = {}
+
+
+def _type_name(spec: Dict[str, Any]) -> Optional[str]:
+    """Get a field's schema type name, or None if the field is untyped
+
+    Type values that are not strings (e.g. ["str", "int"]) are not checked,
+    so they are treated as untyped.
+    """
+    type_name = spec.get("type")
+    return type_name if isinstance(type_name, str) else None
+
+
+def compile_input_validator(
+    input_schema: Dict[str, Any],
+    missing_message: str,
+    type_message: str,
+    max_text_length: Optional[int] = None,
+    id_argument: Optional[str] = None
+) -> Callable[..., bool]:
+    """Generate a straight-line validator function for a tool input schema
+
+    The schema is walked once and turned into Python source with one
+    required/type check per field, so validation does no generic dict
+    walking or type-map lookups per call.
+
+    Args:
+        input_schema: Tool input schema (field name -> field spec)
+        missing_message: Error for a missing required field, formatted
+            with {field}
+        type_message: Error for a wrongly typed field, formatted with
+            {field}, {type} (schema type name), {noun} and {actual} (the
+            value's type name, filled in at call time)
+        max_text_length: Maximum length of the "text" field, if limited
+        id_argument: Name of a required identifier passed before the input
+            dict (e.g. "document_id"); the input dict may then be None
+
+    Returns:
+        Function taking the input dict (preceded by the identifier, if
+        any) that returns True or raises ValueError
+    """
+    signature = (
+        tuple(
+            (field, _type_name(spec), bool(spec.get("required", False)))
+            for field, spec in input_schema.items()
+        ),
+        missing_message,
+        type_message,
+        max_text_length or None,
+        id_argument
+    )
+    validator = _VALIDATOR_CACHE.get(signature)
+    if validator is not None:
+        return validator
+
+    namespace: Dict[str, Any] = {}
+    if id_argument:
+        lines = [
+            f"def _validate({id_argument}, data):",
+            f"    if not {id_argument}:",
+            f"        raise ValueError({f'{id_argument} is required'!r})",
+            "    if data is None:",
+            "        data = {}",
+        ]
+    else:
+        lines = ["def _validate(data):"]
+    for index, (field, type_name, required) in enumerate(signature[0]):
+        check = _SCHEMA_TYPE_CHECKS.get(type_name)
+        if check is None and not required:
+            continue
+        field_literal = repr(field)
+        lines.append(f"    if {field_literal} in data:")
+        if check is not None:
+            expected, noun = check
+            namespace[f"_t{index}"] = expected
+            message = type_message.format(field=field, type=type_name, noun=noun, actual="{actual}")
+            head, placeholder, tail = message.partition("{actual}")
+            type_error = repr(head)
+            if placeholder:
+                type_error += f" + type(value).__name__ + {tail!r}"
+            lines.append(f"        value = data[{field_literal}]")
+            lines.append(f"        if not isinstance(value, _t{index}):")
+            lines.append(f"            raise ValueError({type_error})")
+        else:
+            lines.append("        pass")
+        if required:
+            missing_error = repr(missing_message.format(field=field))
+            lines.append("    else:")
+            lines.append(f"        raise ValueError({missing_error})")
+    if max_text_length:
+        length_error = repr(f"Input text exceeds maximum length of {max_text_length} characters")
+        lines.append(f"    if 'text' in data and len(data['text']) > {max_text_length!r}:")
+        lines.append(f"        raise ValueError({length_error})")
+    lines.append("    return True")
+
+    exec(compile("\n".join(lines), f"<input validator {signature[0]!r}>", "exec"), namespace)
+    validator = namespace["_validate"]
+    _VALIDATOR_CACHE[signature] = validator
+    return validator
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from ..base_service import BaseService
+from ..input_validation import compile_input_validator
 
 
 class ToolCapability(str, Enum):
@@ -19,7 +20,7 @@ class ToolCapability(str, Enum):
     QUESTION_ANSWERING = "question_answering"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     """Metadata about an LLM tool"""
     name: str
@@ -57,7 +58,17 @@ class BaseLLMTool(ABC):
         """
         self.name = name
         self.llm_client = llm_client
-        self._metadata = None
+
+        # Metadata is static per tool; build it once and reuse it
+        self._metadata = self.get_metadata()
+
+        # Schema-specialized input validator, built once per tool
+        self._validate_input = compile_input_validator(
+            self._metadata.input_schema,
+            missing_message="Required field '{field}' missing",
+            type_message="Field '{field}' must be {noun}",
+            max_text_length=self._metadata.max_input_length
+        )
 
     @abstractmethod
     async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -93,38 +104,7 @@ class BaseLLMTool(ABC):
         Returns:
             True if valid, raises ValueError otherwise
         """
-        metadata = self.get_metadata()
-
-        # Check required fields
-        for field, schema in metadata.input_schema.items():
-            if schema.get("required", False) and field not in input_data:
-                raise ValueError(f"Required field '{field}' missing")
-
-            # Check field types if present
-            if field in input_data and "type" in schema:
-                expected_type = schema["type"]
-                actual_value = input_data[field]
-
-                if expected_type == "str" and not isinstance(actual_value, str):
-                    raise ValueError(f"Field '{field}' must be a string")
-                elif expected_type == "int" and not isinstance(actual_value, int):
-                    raise ValueError(f"Field '{field}' must be an integer")
-                elif expected_type == "float" and not isinstance(actual_value, (int, float)):
-                    raise ValueError(f"Field '{field}' must be a number")
-                elif expected_type == "bool" and not isinstance(actual_value, bool):
-                    raise ValueError(f"Field '{field}' must be a boolean")
-                elif expected_type == "list" and not isinstance(actual_value, list):
-                    raise ValueError(f"Field '{field}' must be a list")
-                elif expected_type == "dict" and not isinstance(actual_value, dict):
-                    raise ValueError(f"Field '{field}' must be a dictionary")
-
-        # Check max input length if specified
-        if metadata.max_input_length and "text" in input_data:
-            text_length = len(input_data["text"])
-            if text_length > metadata.max_input_length:
-                raise ValueError(f"Input text exceeds maximum length of {metadata.max_input_length} characters")
-
-        return True
+        return self._validate_input(input_data)
 
     def prepare_prompt(self, template: str, **kwargs) -> str:
         """Prepare a prompt from a template
@@ -169,7 +149,7 @@ class BaseLLMTool(ABC):
 
     def __str__(self) -> str:
         """String representation of the tool"""
-        metadata = self.get_metadata()
+        metadata = self._metadata
         return f"{self.name} (v{metadata.version}): {metadata.description}"
 
     def __repr__(self) -> str:
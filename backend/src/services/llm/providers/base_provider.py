@@ -1,10 +1,14 @@
 """Base provider architecture for multi-model LLM support"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from enum import Flag, auto, Enum
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice, repeat, starmap
+import asyncio
+import random
+import re
 
 
 class ModelCapabilities(Flag):
@@ -27,7 +31,55 @@ class CostTier(str, Enum):
     ECONOMY = "economy"  # Cheapest, basic quality
 
 
-@dataclass
+# Cost tiers ranked from cheapest to most expensive
+_TIER_ORDER: Dict[CostTier, int] = {
+    CostTier.ECONOMY: 0,
+    CostTier.STANDARD: 1,
+    CostTier.PREMIUM: 2
+}
+
+
+# Whitespace-separated words, matching str.split() with no arguments
+_WORD_RE = re.compile(r"\S+")
+
+
+def _leading_words(text: str, count: int) -> Iterator[str]:
+    """Yield the first words of a text, like text.split()[:count]
+
+    Only as much of the text as needed is scanned, so mock responses to
+    large prompts do not split the whole prompt.
+
+    Args:
+        text: Text to split
+        count: Maximum number of words
+
+    Returns:
+        Iterator over at most count words
+    """
+    return (match.group() for match in islice(_WORD_RE.finditer(text), count))
+
+
+def _mock_embedding(dimensions: int) -> List[float]:
+    """Build a random embedding for running without an API client
+
+    starmap drives random.random() from C, avoiding a Python-level loop
+    iteration per component.
+
+    Args:
+        dimensions: Number of vector components
+
+    Returns:
+        List of random floats in [0, 1)
+    """
+    return list(starmap(random.random, repeat((), dimensions)))
+
+
+# Provider definitions are fixed for the life of the process; stamp their
+# metadata once at import instead of on every get_metadata() call
+_CREATED_AT = datetime.now()
+
+
+@dataclass(slots=True)
 class CostProfile:
     """Cost and performance characteristics of a model"""
     tier: CostTier
@@ -38,7 +90,7 @@ class CostProfile:
     tokens_per_second: Optional[int] = None  # Generation speed
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskRequirements:
     """Requirements for a specific task"""
     max_latency_ms: Optional[int] = None
@@ -51,7 +103,7 @@ class TaskRequirements:
     preferred_provider: Optional[str] = None  # User preference
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMetadata:
     """Metadata about a model provider"""
     name: str
@@ -75,11 +127,32 @@ class BaseModelProvider(ABC):
     LLM model or API service.
     """
 
+    # Requests generate_many() keeps in flight at once
+    _max_concurrency = 8
+
     def __init__(self):
         """Initialize the provider"""
         self._metadata = self.get_metadata()
         self._client = None
 
+        # Requirement checks read these instead of re-deriving them per call
+        self._caps_int = self._metadata.capabilities.value
+        self._has_vision = bool(self._caps_int & ModelCapabilities.VISION.value)
+        self._has_streaming = bool(self._caps_int & ModelCapabilities.STREAMING.value)
+        self._has_json_mode = bool(self._caps_int & ModelCapabilities.JSON_MODE.value)
+        self._tier_rank = _TIER_ORDER[self._metadata.cost_profile.tier]
+
+    def _load_request_defaults(self, provider_config: Dict[str, Any]) -> None:
+        """Resolve generate() defaults from the provider config
+
+        Called from initialize() so requests do not look up the config.
+
+        Args:
+            provider_config: This provider's entry in settings.llm.providers
+        """
+        self._default_max_tokens = provider_config.get("max_tokens", self._default_max_tokens)
+        self._default_temperature = provider_config.get("temperature", self._default_temperature)
+
     @abstractmethod
     def get_metadata(self) -> ModelMetadata:
         """Get metadata about this model provider
@@ -121,6 +194,27 @@ class BaseModelProvider(ABC):
         """
         pass
 
+    async def generate_many(self, prompts: List[str], **kwargs) -> List[str]:
+        """Generate completions for several prompts concurrently
+
+        Requests overlap up to _max_concurrency at a time instead of being
+        awaited one after another.
+
+        Args:
+            prompts: Input prompts
+            **kwargs: Parameters passed to generate() for every prompt
+
+        Returns:
+            Generated texts in the same order as the prompts
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(prompt, **kwargs)
+
+        return list(await asyncio.gather(*(generate_one(prompt) for prompt in prompts)))
+
     @abstractmethod
     async def generate_streaming(
         self,
@@ -179,7 +273,7 @@ class BaseModelProvider(ABC):
         Returns:
             True if capability is supported
         """
-        return bool(self._metadata.capabilities & capability)
+        return bool(self._caps_int & capability.value)
 
     def get_cost_estimate(self, input_tokens: int, output_tokens: int) -> float:
         """Estimate cost for a request
@@ -213,8 +307,7 @@ class BaseModelProvider(ABC):
             return False
 
         # Check cost tier
-        tier_order = {CostTier.ECONOMY: 0, CostTier.STANDARD: 1, CostTier.PREMIUM: 2}
-        if tier_order[profile.tier] > tier_order[requirements.max_cost_tier]:
+        if self._tier_rank > _TIER_ORDER[requirements.max_cost_tier]:
             return False
 
         # Check quality
@@ -226,13 +319,13 @@ class BaseModelProvider(ABC):
             return False
 
         # Check capabilities
-        if requirements.needs_vision and not self.supports_capability(ModelCapabilities.VISION):
+        if requirements.needs_vision and not self._has_vision:
             return False
 
-        if requirements.needs_streaming and not self.supports_capability(ModelCapabilities.STREAMING):
+        if requirements.needs_streaming and not self._has_streaming:
             return False
 
-        if requirements.needs_json_mode and not self.supports_capability(ModelCapabilities.JSON_MODE):
+        if requirements.needs_json_mode and not self._has_json_mode:
             return False
 
         return True
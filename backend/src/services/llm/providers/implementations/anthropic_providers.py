@@ -1,7 +1,7 @@
 """Anthropic model provider implementations"""
 
 from typing import Dict, Any, Optional, List
-from datetime import datetime
+from functools import lru_cache
 import asyncio
 
 from anthropic import AsyncAnthropic
@@ -11,16 +11,38 @@ from ..base_provider import (
     ModelMetadata,
     ModelCapabilities,
     CostProfile,
-    CostTier
+    CostTier,
+    _leading_words,
+    _CREATED_AT
 )
 from ..provider_decorators import register_provider
 from .....core.config import get_settings
 
 
+@lru_cache(maxsize=8)
+def _get_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """Get the Anthropic client for an API key, shared by all Claude providers
+
+    Each client owns an HTTP connection pool; sharing one per key lets Sonnet
+    and Haiku requests reuse open connections.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Shared AsyncAnthropic client
+    """
+    return AsyncAnthropic(api_key=api_key)
+
+
 @register_provider("anthropic-claude-3.5-sonnet")
 class ClaudeSonnetProvider(BaseModelProvider):
     """Claude 3.5 Sonnet - High quality detailed reasoning"""
 
+    # Request defaults, replaced from the provider config in initialize()
+    _default_max_tokens = 4000
+    _default_temperature = 0.3
+
     def get_metadata(self) -> ModelMetadata:
         """Get provider metadata from config"""
         settings = get_settings()
@@ -45,7 +67,7 @@ class ClaudeSonnetProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.95),
             description="Anthropic's most capable model for complex reasoning",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -53,8 +75,12 @@ class ClaudeSonnetProvider(BaseModelProvider):
         settings = get_settings()
         api_key = config.get("api_key") or settings.llm.anthropic_api_key
 
+        provider_config = settings.llm.providers.get("anthropic-claude-3.5-sonnet", {})
+        self._load_request_defaults(provider_config)
+        self._max_concurrency = provider_config.get("max_concurrency", self._max_concurrency)
+
         if api_key:
-            self._client = AsyncAnthropic(api_key=api_key)
+            self._client = _get_anthropic_client(api_key)
 
     async def generate(
         self,
@@ -70,13 +96,10 @@ class ClaudeSonnetProvider(BaseModelProvider):
             await asyncio.sleep(0.1)
             return f"[Claude Sonnet Mock] Response to: {prompt[:50]}..."
 
-        settings = get_settings()
-        config = settings.llm.providers.get("anthropic-claude-3.5-sonnet", {})
-
         response = await self._client.messages.create(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 4000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             stop_sequences=stop,
             **kwargs
@@ -95,18 +118,15 @@ class ClaudeSonnetProvider(BaseModelProvider):
         if not self._client:
             # Mock streaming
             yield "[Claude Sonnet Mock] "
-            for word in prompt.split()[:10]:
+            for word in _leading_words(prompt, 10):
                 await asyncio.sleep(0.05)
                 yield word + " "
             return
 
-        settings = get_settings()
-        config = settings.llm.providers.get("anthropic-claude-3.5-sonnet", {})
-
         async with self._client.messages.stream(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 4000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             **kwargs
         ) as stream:
@@ -140,6 +160,10 @@ class ClaudeSonnetProvider(BaseModelProvider):
 class ClaudeHaikuProvider(BaseModelProvider):
     """Claude 3.5 Haiku - Fast and economical"""
 
+    # Request defaults, replaced from the provider config in initialize()
+    _default_max_tokens = 1000
+    _default_temperature = 0.3
+
     def get_metadata(self) -> ModelMetadata:
         """Get provider metadata from config"""
         settings = get_settings()
@@ -164,7 +188,7 @@ class ClaudeHaikuProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.85),
             description="Fast and cost-effective Claude model",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -172,8 +196,12 @@ class ClaudeHaikuProvider(BaseModelProvider):
         settings = get_settings()
         api_key = config.get("api_key") or settings.llm.anthropic_api_key
 
+        provider_config = settings.llm.providers.get("anthropic-claude-3.5-haiku", {})
+        self._load_request_defaults(provider_config)
+        self._max_concurrency = provider_config.get("max_concurrency", self._max_concurrency)
+
         if api_key:
-            self._client = AsyncAnthropic(api_key=api_key)
+            self._client = _get_anthropic_client(api_key)
 
     async def generate(
         self,
@@ -189,13 +217,10 @@ class ClaudeHaikuProvider(BaseModelProvider):
             await asyncio.sleep(0.05)
             return f"[Claude Haiku Mock] Quick response: {prompt[:30]}..."
 
-        settings = get_settings()
-        config = settings.llm.providers.get("anthropic-claude-3.5-haiku", {})
-
         response = await self._client.messages.create(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 1000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             stop_sequences=stop,
             **kwargs
@@ -214,18 +239,15 @@ class ClaudeHaikuProvider(BaseModelProvider):
         if not self._client:
             # Mock streaming
             yield "[Haiku Mock] "
-            for word in prompt.split()[:5]:
+            for word in _leading_words(prompt, 5):
                 await asyncio.sleep(0.02)
                 yield word + " "
             return
 
-        settings = get_settings()
-        config = settings.llm.providers.get("anthropic-claude-3.5-haiku", {})
-
         async with self._client.messages.stream(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 1000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             **kwargs
         ) as stream:
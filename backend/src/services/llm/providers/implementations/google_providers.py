@@ -1,7 +1,6 @@
 """Google model provider implementations"""
 
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 import asyncio
 
 from ..base_provider import (
@@ -9,11 +8,17 @@ from ..base_provider import (
     ModelMetadata,
     ModelCapabilities,
     CostProfile,
-    CostTier
+    CostTier,
+    _leading_words,
+    _mock_embedding,
+    _CREATED_AT
 )
 from ..provider_decorators import register_provider
 from .....core.config import get_settings
 
+# Size of the Gemini text embedding vectors
+_EMBEDDING_DIMENSIONS = 768
+
 
 @register_provider("google-gemini-1.5-pro")
 class GeminiProProvider(BaseModelProvider):
@@ -44,7 +49,7 @@ class GeminiProProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.90),
             description="Google's multimodal model with massive context window",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -97,7 +102,7 @@ class GeminiProProvider(BaseModelProvider):
         if not self._client:
             # Mock streaming
             yield "[Gemini Pro Mock] "
-            for word in prompt.split()[:10]:
+            for word in _leading_words(prompt, 10):
                 await asyncio.sleep(0.05)
                 yield word + " "
             return
@@ -115,11 +120,10 @@ class GeminiProProvider(BaseModelProvider):
         # Gemini has embedding models like "models/text-embedding-004"
         if not self._client:
             # Mock embeddings
-            import random
-            return [random.random() for _ in range(768)]
+            return _mock_embedding(_EMBEDDING_DIMENSIONS)
 
         # Actual implementation would use Google's embedding API
-        return [0.0] * 768  # Placeholder
+        return [0.0] * _EMBEDDING_DIMENSIONS  # Placeholder
 
     async def health_check(self) -> Dict[str, Any]:
         """Check provider health"""
@@ -165,7 +169,7 @@ class GeminiFlashProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.82),
             description="Fast and cost-effective Gemini model",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -208,7 +212,7 @@ class GeminiFlashProvider(BaseModelProvider):
         if not self._client:
             # Mock streaming
             yield "[Flash Mock] "
-            for word in prompt.split()[:5]:
+            for word in _leading_words(prompt, 5):
                 await asyncio.sleep(0.02)
                 yield word + " "
             return
@@ -225,11 +229,10 @@ class GeminiFlashProvider(BaseModelProvider):
         """Generate embeddings using Gemini"""
         if not self._client:
             # Mock embeddings
-            import random
-            return [random.random() for _ in range(768)]
+            return _mock_embedding(_EMBEDDING_DIMENSIONS)
 
         # Actual implementation would use Google's embedding API
-        return [0.0] * 768  # Placeholder
+        return [0.0] * _EMBEDDING_DIMENSIONS  # Placeholder
 
     async def health_check(self) -> Dict[str, Any]:
         """Check provider health"""
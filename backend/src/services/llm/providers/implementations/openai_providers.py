@@ -1,7 +1,6 @@
 """OpenAI model provider implementations"""
 
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 import asyncio
 
 from openai import AsyncOpenAI
@@ -11,7 +10,10 @@ from ..base_provider import (
     ModelMetadata,
     ModelCapabilities,
     CostProfile,
-    CostTier
+    CostTier,
+    _leading_words,
+    _mock_embedding,
+    _CREATED_AT
 )
 from ..provider_decorators import register_provider
 from .....core.config import get_settings
@@ -21,6 +23,10 @@ from .....core.config import get_settings
 class GPT4OptimizedProvider(BaseModelProvider):
     """GPT-4 Optimized - High quality with function calling"""
 
+    # Request defaults, replaced from the provider config in initialize()
+    _default_max_tokens = 4000
+    _default_temperature = 0.3
+
     def get_metadata(self) -> ModelMetadata:
         """Get provider metadata from config"""
         settings = get_settings()
@@ -46,7 +52,7 @@ class GPT4OptimizedProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.93),
             description="OpenAI's optimized GPT-4 with multimodal capabilities",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -54,6 +60,8 @@ class GPT4OptimizedProvider(BaseModelProvider):
         settings = get_settings()
         api_key = config.get("api_key") or settings.llm.openai_api_key
 
+        self._load_request_defaults(settings.llm.providers.get("openai-gpt-4o", {}))
+
         if api_key:
             self._client = AsyncOpenAI(api_key=api_key)
 
@@ -71,13 +79,10 @@ class GPT4OptimizedProvider(BaseModelProvider):
             await asyncio.sleep(0.1)
             return f"[GPT-4o Mock] Response to: {prompt[:50]}..."
 
-        settings = get_settings()
-        config = settings.llm.providers.get("openai-gpt-4o", {})
-
         response = await self._client.chat.completions.create(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 4000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             stop=stop,
             **kwargs
@@ -96,18 +101,15 @@ class GPT4OptimizedProvider(BaseModelProvider):
         if not self._client:
             # Mock streaming
             yield "[GPT-4o Mock] "
-            for word in prompt.split()[:10]:
+            for word in _leading_words(prompt, 10):
                 await asyncio.sleep(0.05)
                 yield word + " "
             return
 
-        settings = get_settings()
-        config = settings.llm.providers.get("openai-gpt-4o", {})
-
         stream = await self._client.chat.completions.create(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 4000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             stream=True,
             **kwargs
@@ -126,8 +128,7 @@ class GPT4OptimizedProvider(BaseModelProvider):
         """Generate embeddings using OpenAI"""
         if not self._client:
             # Mock embeddings
-            import random
-            return [random.random() for _ in range(1536)]
+            return _mock_embedding(1536)
 
         response = await self._client.embeddings.create(
             model=model or "text-embedding-3-small",
@@ -156,6 +157,10 @@ class GPT4OptimizedProvider(BaseModelProvider):
 class GPT4MiniProvider(BaseModelProvider):
     """GPT-4 Mini - Fast and economical"""
 
+    # Request defaults, replaced from the provider config in initialize()
+    _default_max_tokens = 2000
+    _default_temperature = 0.3
+
     def get_metadata(self) -> ModelMetadata:
         """Get provider metadata from config"""
         settings = get_settings()
@@ -180,7 +185,7 @@ class GPT4MiniProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.80),
             description="Cost-effective GPT-4 variant for simple tasks",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -188,6 +193,8 @@ class GPT4MiniProvider(BaseModelProvider):
         settings = get_settings()
         api_key = config.get("api_key") or settings.llm.openai_api_key
 
+        self._load_request_defaults(settings.llm.providers.get("openai-gpt-4o-mini", {}))
+
         if api_key:
             self._client = AsyncOpenAI(api_key=api_key)
 
@@ -205,13 +212,10 @@ class GPT4MiniProvider(BaseModelProvider):
             await asyncio.sleep(0.05)
             return f"[GPT-4 Mini Mock] Quick: {prompt[:30]}..."
 
-        settings = get_settings()
-        config = settings.llm.providers.get("openai-gpt-4o-mini", {})
-
         response = await self._client.chat.completions.create(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 2000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             stop=stop,
             **kwargs
@@ -230,18 +234,15 @@ class GPT4MiniProvider(BaseModelProvider):
         if not self._client:
             # Mock streaming
             yield "[Mini Mock] "
-            for word in prompt.split()[:5]:
+            for word in _leading_words(prompt, 5):
                 await asyncio.sleep(0.02)
                 yield word + " "
             return
 
-        settings = get_settings()
-        config = settings.llm.providers.get("openai-gpt-4o-mini", {})
-
         stream = await self._client.chat.completions.create(
             model=self._metadata.model_id,
-            max_tokens=max_tokens or config.get("max_tokens", 2000),
-            temperature=temperature or config.get("temperature", 0.3),
+            max_tokens=max_tokens or self._default_max_tokens,
+            temperature=temperature or self._default_temperature,
             messages=[{"role": "user", "content": prompt}],
             stream=True,
             **kwargs
@@ -260,8 +261,7 @@ class GPT4MiniProvider(BaseModelProvider):
         """Generate embeddings using OpenAI"""
         if not self._client:
             # Mock embeddings
-            import random
-            return [random.random() for _ in range(1536)]
+            return _mock_embedding(1536)
 
         response = await self._client.embeddings.create(
             model=model or "text-embedding-3-small",
@@ -309,7 +309,7 @@ class TextEmbeddingSmallProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.85),
             description="Cost-effective embedding model",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -350,8 +350,7 @@ class TextEmbeddingSmallProvider(BaseModelProvider):
         """Generate embeddings"""
         if not self._client:
             # Mock embeddings
-            import random
-            return [random.random() for _ in range(1536)]
+            return _mock_embedding(1536)
 
         response = await self._client.embeddings.create(
             model=self._metadata.model_id,
@@ -395,7 +394,7 @@ class TextEmbeddingLargeProvider(BaseModelProvider):
             ),
             quality_score=config.get("quality_score", 0.95),
             description="High-quality embedding model for RAG",
-            created_at=datetime.now()
+            created_at=_CREATED_AT
         )
 
     async def initialize(self, config: Dict[str, Any]) -> None:
@@ -436,8 +435,7 @@ class TextEmbeddingLargeProvider(BaseModelProvider):
         """Generate embeddings"""
         if not self._client:
             # Mock embeddings
-            import random
-            return [random.random() for _ in range(3072)]  # Large model has more dimensions
+            return _mock_embedding(3072)  # Large model has more dimensions
 
         response = await self._client.embeddings.create(
             model=self._metadata.model_id,
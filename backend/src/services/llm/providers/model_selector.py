@@ -1,14 +1,22 @@
 """Model selector with intelligent strategy pattern for optimal model selection"""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 from ....core.config import get_settings
 from ....core.logger import CentralizedLogger
-from .base_provider import TaskRequirements, CostTier, ModelCapabilities
+from .base_provider import TaskRequirements, CostTier, ModelCapabilities, _TIER_ORDER
 from .provider_registry import ModelProviderRegistry
 from ..tool_registry import LLMToolType
 
 
+# Capability names used in provider config strings, as capability flag bits
+_CONFIG_CAPABILITY_BITS: Dict[str, int] = {
+    "vision": ModelCapabilities.VISION.value,
+    "streaming": ModelCapabilities.STREAMING.value,
+    "json_mode": ModelCapabilities.JSON_MODE.value
+}
+
+
 class SelectionStrategy(str, Enum):
     """Model selection strategies"""
     COST = "cost"  # Minimize cost
@@ -32,6 +40,10 @@ class ModelSelector:
         self.logger = CentralizedLogger("ModelSelector")
         self.strategy = SelectionStrategy(self.settings.llm.selection_strategy)
 
+        # Enabled models as flat (latency, tier rank, quality, context,
+        # capability bits, model info) rows, built on first selection
+        self._model_table: Optional[List[Tuple[float, int, float, int, int, Dict[str, Any]]]] = None
+
     def select_model(
         self,
         task_type: Optional[LLMToolType] = None,
@@ -77,83 +89,78 @@ class ModelSelector:
             # Default to quality
             return self._select_by_quality(eligible_models)
 
-    def _get_eligible_models(
-        self,
-        requirements: Optional[TaskRequirements]
-    ) -> List[Dict[str, Any]]:
-        """Get models that meet requirements
+    def _get_model_table(self) -> List[Tuple[float, int, float, int, int, Dict[str, Any]]]:
+        """Get the enabled models with their requirement fields pre-extracted
 
-        Args:
-            requirements: Task requirements
+        Config defaults, the cost tier rank and the capability string are
+        resolved once here, so filtering is plain comparisons per model.
 
         Returns:
-            List of eligible model configurations
+            List of (latency, tier rank, quality, context, capability bits, model info)
         """
-        eligible = []
-
-        for model_name, config in self.settings.llm.providers.items():
-            # Skip disabled models
-            if not config.get("enabled", False):
-                continue
-
-            # Check if model meets requirements
-            if requirements and not self._meets_requirements(config, requirements):
-                continue
-
-            # Add to eligible list with name
-            model_info = config.copy()
-            model_info["provider_name"] = model_name
-            eligible.append(model_info)
-
-        return eligible
+        if self._model_table is None:
+            table = []
+            for model_name, config in self.settings.llm.providers.items():
+                # Skip disabled models
+                if not config.get("enabled", False):
+                    continue
+
+                capability_bits = 0
+                for capability in config.get("capabilities", "").split(","):
+                    capability_bits |= _CONFIG_CAPABILITY_BITS.get(capability, 0)
+
+                # Model info with name, as handed to the selection strategies
+                model_info = config.copy()
+                model_info["provider_name"] = model_name
+
+                table.append((
+                    config.get("avg_latency_ms", float('inf')),
+                    _TIER_ORDER[CostTier(config.get("cost_tier", "standard"))],
+                    config.get("quality_score", 0),
+                    config.get("max_context", 0),
+                    capability_bits,
+                    model_info
+                ))
+            self._model_table = table
+        return self._model_table
 
-    def _meets_requirements(
+    def _get_eligible_models(
         self,
-        config: Dict[str, Any],
-        requirements: TaskRequirements
-    ) -> bool:
-        """Check if model config meets requirements
+        requirements: Optional[TaskRequirements]
+    ) -> List[Dict[str, Any]]:
+        """Get models that meet requirements
 
         Args:
-            config: Model configuration
             requirements: Task requirements
 
         Returns:
-            True if requirements are met
+            List of eligible model configurations
         """
-        # Check latency
-        if requirements.max_latency_ms:
-            if config.get("avg_latency_ms", float('inf')) > requirements.max_latency_ms:
-                return False
-
-        # Check cost tier
-        tier_order = {
-            CostTier.ECONOMY: 0,
-            CostTier.STANDARD: 1,
-            CostTier.PREMIUM: 2
-        }
-        model_tier = CostTier(config.get("cost_tier", "standard"))
-        if tier_order[model_tier] > tier_order[requirements.max_cost_tier]:
-            return False
-
-        # Check quality
-        if config.get("quality_score", 0) < requirements.min_quality_score:
-            return False
-
-        # Check context
-        if requirements.required_context > config.get("max_context", 0):
-            return False
-
-        # Check capabilities
-        model_caps = set(config.get("capabilities", "").split(","))
-        if requirements.needs_vision and "vision" not in model_caps:
-            return False
-        if requirements.needs_streaming and "streaming" not in model_caps:
-            return False
-        if requirements.needs_json_mode and "json_mode" not in model_caps:
-            return False
-
-        return True
+        table = self._get_model_table()
+        if not requirements:
+            return [row[-1] for row in table]
+
+        max_latency = requirements.max_latency_ms or float('inf')
+        max_tier_rank = _TIER_ORDER[requirements.max_cost_tier]
+        min_quality = requirements.min_quality_score
+        required_context = requirements.required_context
+        required_bits = 0
+        if requirements.needs_vision:
+            required_bits |= ModelCapabilities.VISION.value
+        if requirements.needs_streaming:
+            required_bits |= ModelCapabilities.STREAMING.value
+        if requirements.needs_json_mode:
+            required_bits |= ModelCapabilities.JSON_MODE.value
+
+        return [
+            model_info
+            for latency, tier_rank, quality, max_context, capability_bits, model_info in table
+            if latency <= max_latency
+            and tier_rank <= max_tier_rank
+            and quality >= min_quality
+            and max_context >= required_context
+            and capability_bits & required_bits == required_bits
+        ]
 
     def _select_by_cost(self, models: List[Dict[str, Any]]) -> str:
         """Select cheapest model
@@ -1,6 +1,6 @@
 """Decorator-based registration for model providers"""
 
-from typing import Type, Optional, List, Dict
+from typing import Type, Optional, List, Dict, Any
 from .base_provider import BaseModelProvider
 from .provider_registry import ModelProviderRegistry
 
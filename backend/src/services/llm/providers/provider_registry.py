@@ -15,6 +15,7 @@ class ModelProviderRegistry:
 
     _providers: Dict[str, Type[BaseModelProvider]] = {}
     _instances: Dict[str, BaseModelProvider] = {}
+    _metadata_cache: Dict[str, ModelMetadata] = {}
     _logger = CentralizedLogger("ModelProviderRegistry")
 
     @classmethod
@@ -29,6 +30,7 @@ class ModelProviderRegistry:
             raise ValueError(f"{provider_class} must inherit from BaseModelProvider")
 
         cls._providers[provider_name] = provider_class
+        cls._metadata_cache.pop(provider_name, None)
         cls._logger.info(f"Registered model provider: {provider_name}")
 
     @classmethod
@@ -96,13 +98,18 @@ class ModelProviderRegistry:
         Returns:
             Provider metadata or None if not found
         """
+        metadata = cls._metadata_cache.get(provider_name)
+        if metadata is not None:
+            return metadata
+
         if provider_name not in cls._providers:
             return None
 
-        # Create temporary instance to get metadata
+        # Create temporary instance to get metadata; cached until re-registration
         provider_class = cls._providers[provider_name]
         provider = provider_class()
-        return provider.get_metadata()
+        metadata = cls._metadata_cache[provider_name] = provider._metadata
+        return metadata
 
     @classmethod
     def get_providers_by_capability(cls, *capabilities) -> List[str]:
@@ -164,6 +171,7 @@ class ModelProviderRegistry:
         """Clear all registered providers (mainly for testing)"""
         cls._providers.clear()
         cls._instances.clear()
+        cls._metadata_cache.clear()
         cls._logger.debug("Cleared all registered providers")
 
     @classmethod
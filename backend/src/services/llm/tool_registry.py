@@ -29,6 +29,7 @@ class ToolRegistry:
 
     _tools: Dict[LLMToolType, Type[BaseLLMTool]] = {}
     _instances: Dict[LLMToolType, BaseLLMTool] = {}
+    _metadata_cache: Dict[LLMToolType, ToolMetadata] = {}
     _logger = CentralizedLogger("ToolRegistry")
 
     @classmethod
@@ -43,6 +44,7 @@ class ToolRegistry:
             raise ValueError(f"{tool_class} must inherit from BaseLLMTool")
 
         cls._tools[tool_type] = tool_class
+        cls._metadata_cache.pop(tool_type, None)
         cls._logger.info(f"Registered LLM tool: {tool_type}")
 
     @classmethod
@@ -114,11 +116,16 @@ class ToolRegistry:
         Returns:
             Tool metadata or None if tool not found
         """
+        metadata = cls._metadata_cache.get(tool_type)
+        if metadata is not None:
+            return metadata
+
         tool_class = cls._tools.get(tool_type)
         if tool_class:
-            # Create temporary instance to get metadata
+            # Create temporary instance to get metadata; cached until re-registration
             temp_instance = tool_class(name=tool_type.value)
-            return temp_instance.get_metadata()
+            metadata = cls._metadata_cache[tool_type] = temp_instance.get_metadata()
+            return metadata
         return None
 
     @classmethod
@@ -156,6 +163,7 @@ class ToolRegistry:
     def clear_instances(cls):
         """Clear all singleton instances (mainly for testing)"""
         cls._instances.clear()
+        cls._metadata_cache.clear()
         cls._logger.info("Cleared all tool instances")
 
     @classmethod
@@ -123,6 +123,31 @@ class StorageAdapter(ABC):
         """
         pass
 
+    async def transactional_update(
+        self,
+        document_id: str,
+        document: DocumentMessage,
+        *versions: DocumentVersion
+    ) -> bool:
+        """Save a document together with its version records in one unit
+
+        Backends that support batching (e.g. Redis MULTI/EXEC pipelines)
+        override this to commit everything at once. The default
+        implementation falls back to individual save calls.
+
+        Args:
+            document_id: ID of the document
+            document: Updated document to save
+            *versions: Version records to save alongside the document
+
+        Returns:
+            True if successful, False otherwise
+        """
+        for version in versions:
+            if not await self.save_version(document_id, version):
+                return False
+        return await self.save(document)
+
     @abstractmethod
     async def get_versions(
         self,
@@ -86,16 +86,15 @@ class FilesystemStorage(StorageAdapter):
                 document_path = self._get_document_path(document_id)
                 metadata_path = self._get_metadata_path(document_id)
 
-                # Save document data
-                document_data = document.model_dump(mode="json")
-                document_json = json.dumps(document_data, indent=2, default=str)
+                # Save document data (serialized natively by pydantic-core,
+                # including nested audit log details and datetimes)
+                document_json = document.model_dump_json(indent=2)
 
                 async with aiofiles.open(document_path, 'w') as f:
                     await f.write(document_json)
 
                 # Save metadata separately for efficient listing
-                metadata_data = document.metadata.model_dump(mode="json")
-                metadata_json = json.dumps(metadata_data, indent=2, default=str)
+                metadata_json = document.metadata.model_dump_json(indent=2)
 
                 async with aiofiles.open(metadata_path, 'w') as f:
                     await f.write(metadata_json)
@@ -276,35 +275,13 @@ class FilesystemStorage(StorageAdapter):
             try:
                 # Save version data
                 version_path = self._get_version_path(document_id, version.version)
-                version_data = version.model_dump(mode="json")
-                version_json = json.dumps(version_data, indent=2, default=str)
+                version_json = version.model_dump_json(indent=2)
 
                 async with aiofiles.open(version_path, 'w') as f:
                     await f.write(version_json)
 
                 # Update versions index
-                index_path = self._get_versions_index_path(document_id)
-
-                if await aiofiles.os.path.exists(index_path):
-                    async with aiofiles.open(index_path, 'r') as f:
-                        index_json = await f.read()
-                    versions_index = json.loads(index_json)
-                else:
-                    versions_index = {"versions": []}
-
-                # Add version to index if not already present
-                if version.version not in [v["version"] for v in versions_index["versions"]]:
-                    versions_index["versions"].append({
-                        "version": version.version,
-                        "timestamp": version.timestamp.isoformat(),
-                        "user": version.user,
-                        "commit_message": version.commit_message
-                    })
-                    versions_index["versions"].sort(key=lambda x: x["version"])
-
-                index_json = json.dumps(versions_index, indent=2)
-                async with aiofiles.open(index_path, 'w') as f:
-                    await f.write(index_json)
+                await self._update_versions_index(document_id, [version])
 
                 self.logger.info(f"Saved version {version.version} for document {document_id}")
                 return True
@@ -313,6 +290,66 @@ class FilesystemStorage(StorageAdapter):
                 self.logger.error(f"Failed to save version: {str(e)}")
                 raise StorageError(f"Failed to save version: {str(e)}") from e
 
+    async def _update_versions_index(
+        self,
+        document_id: str,
+        versions: List[DocumentVersion]
+    ) -> None:
+        """Add versions to the versions index with a single read and write"""
+        index_path = self._get_versions_index_path(document_id)
+
+        if await aiofiles.os.path.exists(index_path):
+            async with aiofiles.open(index_path, 'r') as f:
+                index_json = await f.read()
+            versions_index = json.loads(index_json)
+        else:
+            versions_index = {"versions": []}
+
+        # Add versions to index if not already present
+        known_versions = {v["version"] for v in versions_index["versions"]}
+        for version in versions:
+            if version.version not in known_versions:
+                known_versions.add(version.version)
+                versions_index["versions"].append({
+                    "version": version.version,
+                    "timestamp": version.timestamp.isoformat(),
+                    "user": version.user,
+                    "commit_message": version.commit_message
+                })
+        versions_index["versions"].sort(key=lambda x: x["version"])
+
+        index_json = json.dumps(versions_index, indent=2)
+        async with aiofiles.open(index_path, 'w') as f:
+            await f.write(index_json)
+
+    async def transactional_update(
+        self,
+        document_id: str,
+        document: DocumentMessage,
+        *versions: DocumentVersion
+    ) -> bool:
+        """Save a document and its versions, rewriting the versions index once"""
+        with self.traced_operation(
+            "transactional_update",
+            document_id=document_id,
+            versions=[version.version for version in versions]
+        ):
+            try:
+                for version in versions:
+                    version_path = self._get_version_path(document_id, version.version)
+                    async with aiofiles.open(version_path, 'w') as f:
+                        await f.write(version.model_dump_json(indent=2))
+
+                await self._update_versions_index(document_id, list(versions))
+
+                return await self.save(document)
+
+            except StorageError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Failed transactional update for {document_id}: {str(e)}")
+                raise StorageError(f"Failed to update document: {str(e)}") from e
+
     async def get_versions(
         self,
         document_id: str
@@ -91,12 +91,9 @@ class RedisStorage(StorageAdapter):
                 metadata_key = self._get_metadata_key(document_id)
                 list_key = self._get_document_list_key()
 
-                # Serialize document and metadata
-                document_data = document.model_dump(mode="json")
-                document_json = json.dumps(document_data, default=str)
-
-                metadata_data = document.metadata.model_dump(mode="json")
-                metadata_json = json.dumps(metadata_data, default=str)
+                # Serialize document and metadata natively via pydantic-core
+                document_json = document.model_dump_json()
+                metadata_json = document.metadata.model_dump_json()
 
                 # Use pipeline for atomic operations
                 pipe = self.redis_client.pipeline()
@@ -121,7 +118,7 @@ class RedisStorage(StorageAdapter):
                         commit_message="Initial version"
                     )
                     version_key = self._get_version_key(document_id, 1)
-                    version_json = json.dumps(version.model_dump(mode="json"), default=str)
+                    version_json = version.model_dump_json()
                     pipe.setex(version_key, self.ttl_seconds, version_json)
 
                     # Add to versions list
@@ -314,8 +311,7 @@ class RedisStorage(StorageAdapter):
                 versions_key = self._get_versions_list_key(document_id)
 
                 # Serialize version
-                version_data = version.model_dump(mode="json")
-                version_json = json.dumps(version_data, default=str)
+                version_json = version.model_dump_json()
 
                 # Use pipeline for atomic operations
                 pipe = self.redis_client.pipeline()
@@ -339,6 +335,54 @@ class RedisStorage(StorageAdapter):
                 self.logger.error(f"Failed to save version to Redis: {str(e)}")
                 raise StorageError(f"Redis version save failed: {str(e)}") from e
 
+    async def transactional_update(
+        self,
+        document_id: str,
+        document: DocumentMessage,
+        *versions: DocumentVersion
+    ) -> bool:
+        """Save a document and its versions in a single MULTI/EXEC pipeline"""
+        with self.traced_operation(
+            "transactional_update",
+            document_id=document_id,
+            versions=[version.version for version in versions]
+        ):
+            await self._ensure_connected()
+
+            try:
+                document_key = self._get_document_key(document_id)
+                metadata_key = self._get_metadata_key(document_id)
+                versions_key = self._get_versions_list_key(document_id)
+                list_key = self._get_document_list_key()
+
+                existing_versions = set(await self.redis_client.lrange(versions_key, 0, -1))
+
+                # Queue every write on one transactional pipeline
+                pipe = self.redis_client.pipeline(transaction=True)
+
+                for version in versions:
+                    version_key = self._get_version_key(document_id, version.version)
+                    pipe.setex(version_key, self.ttl_seconds, version.model_dump_json())
+                    if str(version.version) not in existing_versions:
+                        existing_versions.add(str(version.version))
+                        pipe.lpush(versions_key, version.version)
+                pipe.expire(versions_key, self.ttl_seconds)
+
+                pipe.setex(document_key, self.ttl_seconds, document.model_dump_json())
+                pipe.setex(metadata_key, self.ttl_seconds, document.metadata.model_dump_json())
+                pipe.zadd(list_key, {document_id: datetime.utcnow().timestamp()})
+
+                await pipe.execute()
+
+                self.logger.debug(
+                    f"Saved document {document_id} with {len(versions)} versions to Redis"
+                )
+                return True
+
+            except RedisError as e:
+                self.logger.error(f"Failed transactional update for {document_id}: {str(e)}")
+                raise StorageError(f"Redis transactional update failed: {str(e)}") from e
+
     async def get_versions(
         self,
         document_id: str
@@ -0,0 +1,33 @@
+"""Unit tests for API response classes"""
+
+import json
+
+import pytest
+
+from src.api import responses
+from src.api.responses import FastJSONResponse
+
+
+class TestFastJSONResponse:
+    """Test suite for the orjson-backed response"""
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_body_decodes_to_content(self, monkeypatch, orjson_available):
+        """Test the body round-trips with and without orjson"""
+        if orjson_available:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(responses, "ORJSON_AVAILABLE", orjson_available)
+        content = {"valid": False, "errors": [{"path": "root.a", "line": None}], "ratio": 0.5, "name": "é"}
+
+        response = FastJSONResponse(content=content)
+
+        assert json.loads(response.body) == content
+        assert response.media_type == "application/json"
+
+    def test_unencodable_content_falls_back(self):
+        """Test content orjson rejects is still encoded"""
+        content = {"value": 2 ** 70}
+
+        response = FastJSONResponse(content=content)
+
+        assert json.loads(response.body) == content
@@ -0,0 +1,69 @@
+"""Tests for BaseService tracing"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from pydantic import ValidationError
+
+from src.core.config import TelemetryConfig, get_settings
+from src.services.base_service import BaseService
+
+
+@pytest.fixture
+def fresh_settings():
+    """Rebuild cached settings so environment changes are picked up"""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class TestTraceSampleRate:
+    """Test suite for the telemetry trace sample rate setting"""
+
+    @pytest.mark.parametrize("env_name", ["TELEMETRY_TRACE_SAMPLE_RATE", "TRACE_SAMPLE_RATE"])
+    def test_sample_rate_read_from_env(self, env_name, fresh_settings, monkeypatch):
+        """Test BaseService picks up the sample rate from the environment"""
+        monkeypatch.setenv(env_name, "0.25")
+
+        service = BaseService("TestService")
+
+        assert service._trace_sample_rate == 0.25
+
+    def test_sample_rate_out_of_range_rejected(self, monkeypatch):
+        """Test sample rates outside 0.0-1.0 fail validation"""
+        monkeypatch.setenv("TRACE_SAMPLE_RATE", "5")
+
+        with pytest.raises(ValidationError):
+            TelemetryConfig()
+
+
+class TestTracedOperation:
+    """Test suite for BaseService.traced_operation"""
+
+    @pytest.fixture
+    def unsampled_service(self):
+        """Service whose operations are never sampled"""
+        service = BaseService("TestService")
+        service._trace_sample_rate = 0.0
+        service.logger = MagicMock()
+        return service
+
+    def test_unsampled_operation_yields_invalid_span(self, unsampled_service):
+        """Test that unsampled operations get a non-recording span"""
+        with unsampled_service.traced_operation("noop") as span:
+            assert not span.is_recording()
+
+        unsampled_service.logger.error.assert_not_called()
+
+    def test_unsampled_operation_logs_and_reraises(self, unsampled_service):
+        """Test that errors in unsampled operations are still logged"""
+        error = ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            with unsampled_service.traced_operation("failing_op"):
+                raise error
+
+        unsampled_service.logger.error.assert_called_once()
+        args, kwargs = unsampled_service.logger.error.call_args
+        assert args[0] == "Error in failing_op: boom"
+        assert kwargs["exc_info"] is error
@@ -0,0 +1,510 @@
+"""Tests for the document tools system"""
+
+from typing import Any, Dict, Optional
+
+import pytest
+
+from src.services.document_tools import (
+    BaseDocumentTool,
+    DocumentToolMetadata,
+    DocumentToolCategory,
+    DocumentToolCapability,
+    DocumentToolRegistry,
+    DocumentToolType,
+)
+from src.models.document import DocumentType
+
+
+class JSONCheckTool(BaseDocumentTool):
+    """Test validation tool for JSON documents"""
+
+    metadata_builds = 0
+
+    async def execute(self, document_id: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {"valid": True}
+
+    def get_metadata(self) -> DocumentToolMetadata:
+        type(self).metadata_builds += 1
+        return DocumentToolMetadata(
+            id="validate_json",
+            name="JSON Check",
+            description="Check JSON documents",
+            category=DocumentToolCategory.DATA_VALIDATION,
+            capabilities=[DocumentToolCapability.VALIDATION],
+            supported_document_types=[DocumentType.JSON]
+        )
+
+
+class AnyDocumentTool(BaseDocumentTool):
+    """Test analysis tool supporting every document type"""
+
+    async def execute(self, document_id: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {"analyzed": True}
+
+    def get_metadata(self) -> DocumentToolMetadata:
+        return DocumentToolMetadata(
+            id="sentiment_analysis",
+            name="Any Document",
+            description="Analyze any document",
+            category=DocumentToolCategory.ANALYSIS,
+            capabilities=[
+                DocumentToolCapability.ANALYSIS,
+                DocumentToolCapability.CLASSIFICATION
+            ]
+        )
+
+
+@pytest.fixture
+def clean_registry():
+    """Run a test against an empty registry, restoring it afterwards"""
+    was_frozen = DocumentToolRegistry.is_frozen()
+    DocumentToolRegistry.unfreeze()
+    saved_tools = dict(DocumentToolRegistry._tools)
+    DocumentToolRegistry._tools.clear()
+    DocumentToolRegistry.clear_instances()
+    JSONCheckTool.metadata_builds = 0
+    yield DocumentToolRegistry
+    DocumentToolRegistry.unfreeze()
+    DocumentToolRegistry._tools.clear()
+    DocumentToolRegistry.clear_instances()
+    for tool_type, tool_class in saved_tools.items():
+        DocumentToolRegistry.register(tool_type, tool_class)
+    if was_frozen:
+        DocumentToolRegistry.freeze()
+
+
+class TestDocumentToolMetadata:
+    """Test suite for DocumentToolMetadata"""
+
+    def test_defaults(self):
+        """Test optional collections default to empty values"""
+        metadata = DocumentToolMetadata(
+            id="test_tool",
+            name="Test Tool",
+            description="Tool for testing",
+            category=DocumentToolCategory.ANALYSIS
+        )
+
+        assert metadata.capabilities == ()
+        assert metadata.supported_document_types == []
+        assert metadata._supports_all_document_types is True
+        assert metadata.input_schema == {}
+        assert metadata.output_schema == {}
+
+    def test_string_values_normalized_to_enums(self):
+        """Test category and capability strings are mapped to enum members"""
+        metadata = DocumentToolMetadata(
+            id="test_tool",
+            name="Test Tool",
+            description="Tool for testing",
+            category="analysis",
+            capabilities=["validation", DocumentToolCapability.ANALYSIS]
+        )
+
+        assert metadata.category is DocumentToolCategory.ANALYSIS
+        assert metadata.capabilities == (
+            DocumentToolCapability.VALIDATION,
+            DocumentToolCapability.ANALYSIS
+        )
+
+    def test_membership_sets(self):
+        """Test hashed membership siblings mirror the ordered fields"""
+        metadata = DocumentToolMetadata(
+            id="test_tool",
+            name="Test Tool",
+            description="Tool for testing",
+            category=DocumentToolCategory.ANALYSIS,
+            capabilities=[DocumentToolCapability.ANALYSIS],
+            supported_document_types=[DocumentType.JSON, DocumentType.PDF]
+        )
+
+        assert metadata.has_capability(DocumentToolCapability.ANALYSIS)
+        assert not metadata.has_capability(DocumentToolCapability.SIMILARITY)
+        assert metadata._document_type_set == {DocumentType.JSON, DocumentType.PDF}
+        assert metadata._supports_all_document_types is False
+        assert metadata.supported_document_types == [DocumentType.JSON, DocumentType.PDF]
+
+    def test_unknown_category_rejected(self):
+        """Test unknown category strings raise"""
+        with pytest.raises(ValueError, match="not_a_category"):
+            DocumentToolMetadata(
+                id="test_tool",
+                name="Test Tool",
+                description="Tool for testing",
+                category="not_a_category"
+            )
+
+
+class TestInputValidation:
+    """Test suite for generated input validators"""
+
+    @pytest.fixture
+    def metadata(self) -> DocumentToolMetadata:
+        """Create metadata with a mixed input schema"""
+        return DocumentToolMetadata(
+            id="test_tool",
+            name="Test Tool",
+            description="Tool for testing",
+            category=DocumentToolCategory.ANALYSIS,
+            input_schema={
+                "mode": {"type": "str", "required": True},
+                "limit": {"type": "int", "required": False},
+                "threshold": {"type": "float"},
+                "extra": {"description": "Untyped parameter"}
+            }
+        )
+
+    def test_valid_parameters(self, metadata):
+        """Test valid parameters pass validation"""
+        assert metadata._validate("doc-1", {"mode": "fast", "limit": 3, "threshold": 1}) is True
+
+    def test_missing_document_id(self, metadata):
+        """Test missing document ID is rejected"""
+        with pytest.raises(ValueError, match="document_id is required"):
+            metadata._validate("", {"mode": "fast"})
+
+    def test_missing_required_parameter(self, metadata):
+        """Test missing required parameters are rejected"""
+        with pytest.raises(ValueError, match="Required parameter 'mode' missing"):
+            metadata._validate("doc-1", None)
+
+    def test_wrong_parameter_type(self, metadata):
+        """Test parameters of the wrong type are rejected"""
+        with pytest.raises(ValueError, match="Parameter 'limit' must be int, got str"):
+            metadata._validate("doc-1", {"mode": "fast", "limit": "3"})
+
+    def test_validator_shared_between_identical_schemas(self, metadata):
+        """Test identical schemas reuse the compiled validator"""
+        other = DocumentToolMetadata(
+            id="other_tool",
+            name="Other Tool",
+            description="Tool for testing",
+            category=DocumentToolCategory.ANALYSIS,
+            input_schema=dict(metadata.input_schema)
+        )
+
+        assert other._validate is metadata._validate
+
+    def test_non_string_type_treated_as_untyped(self):
+        """Test a list-valued type skips the type check instead of failing"""
+        metadata = DocumentToolMetadata(
+            id="union_tool",
+            name="Union Tool",
+            description="Tool for testing",
+            category=DocumentToolCategory.ANALYSIS,
+            input_schema={"value": {"type": ["str", "int"], "required": True}}
+        )
+
+        assert metadata._validate("doc-1", {"value": 3.5}) is True
+        with pytest.raises(ValueError, match="Required parameter 'value' missing"):
+            metadata._validate("doc-1", {})
+
+
+class TestRecommendationScore:
+    """Test suite for tool recommendation scoring"""
+
+    def test_listed_type_outscores_all_types_tool(self):
+        """Test explicit document type support scores above a generic tool"""
+        specific = JSONCheckTool(name="validate_json")
+        generic = AnyDocumentTool(name="sentiment_analysis")
+
+        specific_score = specific.get_recommendation_score(DocumentType.JSON)
+        generic_score = generic.get_recommendation_score(DocumentType.JSON)
+
+        assert specific_score == 0.5
+        assert specific_score > generic_score
+
+
+class TestDocumentToolRegistry:
+    """Test suite for DocumentToolRegistry"""
+
+    def test_metadata_cached_at_registration(self, clean_registry):
+        """Test metadata is built once and reused by lookups"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        assert JSONCheckTool.metadata_builds == 1
+
+        for _ in range(3):
+            metadata = clean_registry.get_tool_metadata(DocumentToolType.VALIDATE_JSON)
+            assert metadata.name == "JSON Check"
+        clean_registry.get_stats()
+        clean_registry.get_tool_info()
+
+        assert JSONCheckTool.metadata_builds == 1
+
+    def test_metadata_unknown_tool(self, clean_registry):
+        """Test metadata lookup for an unregistered tool"""
+        assert clean_registry.get_tool_metadata(DocumentToolType.SUMMARIZE) is None
+
+    def test_clear_instances_resets_metadata(self, clean_registry):
+        """Test clearing instances drops cached metadata"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.clear_instances()
+
+        clean_registry.get_tool_metadata(DocumentToolType.VALIDATE_JSON)
+        assert JSONCheckTool.metadata_builds == 2
+
+    def test_find_tools_by_document_type(self, clean_registry):
+        """Test document type lookup includes tools supporting all types"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+
+        json_tools = clean_registry.find_tools_by_document_type(DocumentType.JSON)
+        pdf_tools = clean_registry.find_tools_by_document_type(DocumentType.PDF)
+
+        assert set(json_tools) == {DocumentToolType.VALIDATE_JSON, DocumentToolType.SENTIMENT_ANALYSIS}
+        assert pdf_tools == [DocumentToolType.SENTIMENT_ANALYSIS]
+
+    def test_find_tools_by_capability_and_category(self, clean_registry):
+        """Test capability and category lookups"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+
+        assert clean_registry.find_tools_by_capability(
+            DocumentToolCapability.CLASSIFICATION
+        ) == [DocumentToolType.SENTIMENT_ANALYSIS]
+        assert clean_registry.find_tools_by_capability(DocumentToolCapability.SIMILARITY) == []
+        assert clean_registry.find_tools_by_category(
+            DocumentToolCategory.DATA_VALIDATION
+        ) == [DocumentToolType.VALIDATE_JSON]
+
+    def test_reregistration_replaces_index_entries(self, clean_registry):
+        """Test re-registering a tool type updates the indexes"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, AnyDocumentTool)
+
+        assert clean_registry.find_tools_by_category(DocumentToolCategory.DATA_VALIDATION) == []
+        assert clean_registry.find_tools_by_category(
+            DocumentToolCategory.ANALYSIS
+        ) == [DocumentToolType.VALIDATE_JSON]
+
+    def test_recommendations_instantiate_only_top_candidates(self, clean_registry, sample_document, monkeypatch):
+        """Test recommendations pre-score from metadata before creating tools"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+
+        created = []
+        original_create = clean_registry.create
+
+        def tracking_create(tool_type, **kwargs):
+            created.append(tool_type)
+            return original_create(tool_type, **kwargs)
+
+        monkeypatch.setattr(clean_registry, "create", tracking_create)
+
+        # PDF document: the JSON-only tool is filtered out before instantiation
+        recommendations = clean_registry.get_recommendations_for_document(sample_document)
+
+        assert created == [DocumentToolType.SENTIMENT_ANALYSIS]
+        assert [rec["tool_type"] for rec in recommendations] == ["sentiment_analysis"]
+        assert recommendations[0]["tool_name"] == "Any Document"
+        assert recommendations[0]["score"] == 0.25
+
+    def test_register_many_shares_metadata(self, clean_registry):
+        """Test batch registration builds metadata once for all aliases"""
+        clean_registry.register_many(
+            JSONCheckTool,
+            [DocumentToolType.VALIDATE_JSON, DocumentToolType.FORMAT_JSON]
+        )
+
+        assert JSONCheckTool.metadata_builds == 1
+        assert clean_registry.get_all_tools()[DocumentToolType.FORMAT_JSON] is JSONCheckTool
+        assert set(clean_registry.find_tools_by_category(
+            DocumentToolCategory.DATA_VALIDATION
+        )) == {DocumentToolType.VALIDATE_JSON, DocumentToolType.FORMAT_JSON}
+
+    def test_get_all_tools_is_read_only_view(self, clean_registry):
+        """Test get_all_tools returns a live read-only view"""
+        tools = clean_registry.get_all_tools()
+        assert len(tools) == 0
+
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+
+        assert tools[DocumentToolType.VALIDATE_JSON] is JSONCheckTool
+        assert clean_registry.get_all_tools() is tools
+        with pytest.raises(TypeError):
+            tools[DocumentToolType.FORMAT_JSON] = AnyDocumentTool
+
+    def test_dashboard_matches_info_and_stats(self, clean_registry):
+        """Test the fused dashboard equals the separate payloads"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+
+        dashboard = clean_registry.get_dashboard()
+
+        assert dashboard["tools"] == clean_registry.get_tool_info()
+        assert dashboard["statistics"] == clean_registry.get_stats()
+        assert dashboard["statistics"]["category_distribution"] == {
+            "data_validation": 1,
+            "analysis": 1
+        }
+        assert set(dashboard["tools"]["tools"]) == {"validate_json", "sentiment_analysis"}
+
+    def test_recommendations_cached_until_tools_change(self, clean_registry, sample_document, monkeypatch):
+        """Test repeat recommendation requests reuse results until registration changes"""
+        clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+
+        created = []
+        original_create = clean_registry.create
+
+        def tracking_create(tool_type, **kwargs):
+            created.append(tool_type)
+            return original_create(tool_type, **kwargs)
+
+        monkeypatch.setattr(clean_registry, "create", tracking_create)
+
+        first = clean_registry.get_recommendations_for_document(sample_document)
+        first[0]["score"] = 99
+        second = clean_registry.get_recommendations_for_document(sample_document)
+
+        assert len(created) == 1
+        assert second[0]["score"] == 0.25
+
+        sample_document.content.formatted_content = "Changed content"
+        clean_registry.get_recommendations_for_document(sample_document)
+        assert len(created) == 2
+
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.get_recommendations_for_document(sample_document)
+        assert len(created) == 3
+
+    def test_cached_recommendations_isolated_from_nested_mutation(self, clean_registry, sample_document):
+        """Test mutating a returned recommendation's nested dicts does not alter the cache"""
+        clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+
+        first = clean_registry.get_recommendations_for_document(sample_document)
+        expected_metadata = dict(first[0]["metadata"])
+        first[0]["metadata"]["requires_llm"] = "mutated"
+        first[0]["metadata"]["extra"] = True
+        second = clean_registry.get_recommendations_for_document(sample_document)
+        second[0]["metadata"].clear()
+        third = clean_registry.get_recommendations_for_document(sample_document)
+
+        assert third[0]["metadata"] == expected_metadata
+
+    def test_frozen_registry_rejects_registration(self, clean_registry):
+        """Test a frozen registry is read-only until unfrozen"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+        clean_registry.freeze()
+
+        with pytest.raises(RuntimeError, match="Cannot register AnyDocumentTool.*frozen"):
+            clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+        with pytest.raises(TypeError):
+            clean_registry._tools[DocumentToolType.SENTIMENT_ANALYSIS] = AnyDocumentTool
+        assert clean_registry.get_all_tools()[DocumentToolType.VALIDATE_JSON] is JSONCheckTool
+
+        clean_registry.unfreeze()
+        clean_registry.register(DocumentToolType.SENTIMENT_ANALYSIS, AnyDocumentTool)
+        assert clean_registry.is_registered(DocumentToolType.SENTIMENT_ANALYSIS)
+
+    def test_tool_decorated_while_frozen_is_queued(self, clean_registry, monkeypatch):
+        """Test decorating a tool after freeze() defers registration to unfreeze()"""
+        from src.services.document_tools import tool_decorators
+
+        monkeypatch.setattr(tool_decorators, "_decorated_tools", {})
+        clean_registry.freeze()
+
+        @tool_decorators.register_document_tool(DocumentToolType.VALIDATE_JSON)
+        class LateTool(JSONCheckTool):
+            pass
+
+        assert not clean_registry.is_registered(DocumentToolType.VALIDATE_JSON)
+
+        clean_registry.unfreeze()
+        assert clean_registry.get_all_tools()[DocumentToolType.VALIDATE_JSON] is LateTool
+        assert clean_registry._pending_registrations == []
+
+    def test_create_reuses_singleton(self, clean_registry):
+        """Test singleton creation returns the cached instance"""
+        clean_registry.register(DocumentToolType.VALIDATE_JSON, JSONCheckTool)
+
+        first = clean_registry.create(DocumentToolType.VALIDATE_JSON)
+        second = clean_registry.create(DocumentToolType.VALIDATE_JSON)
+        fresh = clean_registry.create(DocumentToolType.VALIDATE_JSON, singleton=False)
+
+        assert first is second
+        assert fresh is not first
+        assert first.name == "validate_json"
+
+
+class TestToolIntrospection:
+    """Test suite for decorator introspection helpers"""
+
+    def test_decoration_refreshes_cached_lookups(self, clean_registry, monkeypatch):
+        """Test memoized helpers see a class decorated after its first lookup"""
+        from src.services.document_tools import tool_decorators
+
+        monkeypatch.setattr(tool_decorators, "_decorated_tools", {})
+
+        class LateTool(JSONCheckTool):
+            pass
+
+        assert tool_decorators.is_tool_decorated(LateTool) is False
+        assert tool_decorators.get_tool_aliases_for_class(LateTool) == ()
+
+        tool_decorators.register_document_tool(
+            DocumentToolType.VALIDATE_JSON,
+            aliases=[DocumentToolType.FORMAT_JSON]
+        )(LateTool)
+
+        assert tool_decorators.is_tool_decorated(LateTool) is True
+        assert tool_decorators.get_tool_type_for_class(LateTool) is DocumentToolType.VALIDATE_JSON
+        assert tool_decorators.get_tool_aliases_for_class(LateTool) == (DocumentToolType.FORMAT_JSON,)
+
+    def test_scan_and_import_tools_lists_package_modules(self):
+        """Test the tools package scan finds every tool module"""
+        from src.services.document_tools.tool_decorators import scan_and_import_tools
+
+        modules = scan_and_import_tools()
+
+        assert "src.services.document_tools.tools.validate_json_tool" in modules
+        assert all(not name.rsplit(".", 1)[-1].startswith("__") for name in modules)
+        assert scan_and_import_tools("src.services.document_tools.base_tool") == []
+
+    def test_initialize_skips_scan_without_autoscan(self, clean_registry, monkeypatch):
+        """Test initialization uses the static import list unless autoscan is enabled"""
+        from src.services.document_tools import tool_decorators
+
+        scans = []
+        monkeypatch.delenv("MAVN_TOOL_AUTOSCAN", raising=False)
+        monkeypatch.setattr(tool_decorators, "scan_and_import_tools", lambda: scans.append(1) or [])
+
+        result = tool_decorators.initialize_document_tools()
+        assert scans == []
+        assert clean_registry.is_frozen()
+        assert "src.services.document_tools.tools.validate_json_tool" in result["imported_modules"]
+
+        monkeypatch.setenv("MAVN_TOOL_AUTOSCAN", "1")
+        tool_decorators.initialize_document_tools()
+        assert scans == [1]
+
+    def test_decoration_registers_tool(self, clean_registry, monkeypatch):
+        """Test decorating a tool registers it and its aliases immediately"""
+        from src.services.document_tools import tool_decorators
+
+        monkeypatch.setattr(tool_decorators, "_decorated_tools", {})
+
+        @tool_decorators.register_document_tool(
+            DocumentToolType.VALIDATE_JSON,
+            aliases=[DocumentToolType.FORMAT_JSON]
+        )
+        class DecoratedTool(JSONCheckTool):
+            pass
+
+        assert clean_registry.get_all_tools()[DocumentToolType.VALIDATE_JSON] is DecoratedTool
+        assert clean_registry.get_all_tools()[DocumentToolType.FORMAT_JSON] is DecoratedTool
+
+        # Entries dropped from the registry are restored by auto registration
+        clean_registry._tools.clear()
+        assert tool_decorators.auto_register_decorated_tools() == 1
+        assert clean_registry.is_registered(DocumentToolType.FORMAT_JSON)
+
+    def test_shipped_tools_have_no_instance_dict(self):
+        """Test slotted tool instances carry no per-instance __dict__"""
+        from src.services.document_tools.tools.validate_json_tool import ValidateJSONTool
+        from src.services.document_tools.tool_decorators import is_tool_decorated
+
+        tool = ValidateJSONTool(name="validate_json")
+
+        assert not hasattr(tool, "__dict__")
+        assert is_tool_decorated(ValidateJSONTool)
+        assert not is_tool_decorated(BaseDocumentTool)
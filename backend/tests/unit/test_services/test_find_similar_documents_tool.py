@@ -0,0 +1,391 @@
+"""Tests for the find similar documents tool"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.models.document import DocumentMessage, DocumentMetadata, DocumentContent, DocumentType
+from src.services.document_tools.tools import find_similar_documents_tool
+from src.services.document_tools.tools.find_similar_documents_tool import FindSimilarDocumentsTool
+
+
+def make_document(document_id: str, text: str, document_type=None, version: int = 1):
+    """Build a minimal document message with the given text"""
+    return DocumentMessage(
+        metadata=DocumentMetadata(
+            document_id=document_id,
+            document_type=document_type or DocumentType.TEXT,
+            name=document_id,
+            created_user="test_user",
+            updated_user="test_user",
+            version=version
+        ),
+        content=DocumentContent(raw_text=text)
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_caches():
+    """Isolate the module-level caches between tests"""
+    find_similar_documents_tool._embedding_cache.clear()
+    find_similar_documents_tool._document_keyword_cache.clear()
+    yield
+    find_similar_documents_tool._embedding_cache.clear()
+    find_similar_documents_tool._document_keyword_cache.clear()
+
+
+@pytest.fixture
+def vector_search_service() -> MagicMock:
+    """Create a mock vector search service"""
+    service = MagicMock()
+    service.embedding_model = "test-embedding-model"
+    service.generate_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])
+    return service
+
+
+@pytest.fixture
+def tool(vector_search_service) -> FindSimilarDocumentsTool:
+    """Create the tool with a mock vector search service"""
+    return FindSimilarDocumentsTool(
+        name="find_similar_documents",
+        vector_search_service=vector_search_service
+    )
+
+
+class TestQueryEmbeddingCache:
+    """Test suite for query embedding caching"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_embedded_once(self, tool, vector_search_service):
+        """Test identical query text reuses the cached embedding"""
+        first = await tool._get_query_embedding("quarterly revenue report")
+        second = await tool._get_query_embedding("quarterly revenue report")
+
+        assert first == second == [0.1, 0.2, 0.3]
+        vector_search_service.generate_embedding.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_miss_and_hit_return_lists(self, tool, vector_search_service):
+        """Test the provider's embedding type is normalized on both cache paths"""
+        vector_search_service.generate_embedding = AsyncMock(return_value=(0.4, 0.5))
+
+        first = await tool._get_query_embedding("quarterly revenue forecast")
+        second = await tool._get_query_embedding("quarterly revenue forecast")
+
+        assert type(first) is list and type(second) is list
+        assert first == second == [0.4, 0.5]
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_model(self, tool, vector_search_service):
+        """Test changing the embedding model misses the cache"""
+        await tool._get_query_embedding("quarterly revenue report")
+        vector_search_service.embedding_model = "other-model"
+        await tool._get_query_embedding("quarterly revenue report")
+
+        assert vector_search_service.generate_embedding.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_refreshed(self, tool, vector_search_service, monkeypatch):
+        """Test entries past their TTL are re-embedded"""
+        monkeypatch.setattr(find_similar_documents_tool, "_EMBEDDING_CACHE_TTL_SECONDS", 0.0)
+
+        await tool._get_query_embedding("quarterly revenue report")
+        await tool._get_query_embedding("quarterly revenue report")
+
+        assert vector_search_service.generate_embedding.await_count == 2
+
+
+class TestKeywordSimilarity:
+    """Test suite for keyword-based similarity search"""
+
+    @pytest.fixture
+    def document_service(self) -> MagicMock:
+        """Create a mock document service with candidate documents"""
+        service = MagicMock()
+        service.list_documents = AsyncMock(return_value=[
+            make_document("source", "quarterly revenue report"),
+            make_document("match", "The quarterly revenue grew; see the report appendix"),
+            make_document("partial", "Revenue notes only"),
+            make_document("empty", ""),
+        ])
+        return service
+
+    def test_similarity_is_keyword_set_overlap(self, tool):
+        """Test similarity is the fraction of query keywords in the document"""
+        query = frozenset({"quarterly", "revenue", "report", "growth"})
+        document = frozenset({"revenue", "report", "appendix"})
+
+        assert tool._calculate_keyword_similarity(query, document) == 0.5
+        assert tool._calculate_keyword_similarity(frozenset(), document) == 0.0
+
+    def test_document_keywords_cached_by_content(self, tool, monkeypatch):
+        """Test candidate keywords are extracted once per distinct content"""
+        calls = []
+        original = tool._extract_keywords
+        monkeypatch.setattr(FindSimilarDocumentsTool, "_extract_keywords",
+                            lambda self, text: calls.append(text) or original(text))
+
+        document = make_document("doc-1", "Quarterly revenue report")
+        first = tool._document_keywords(document)
+        second = tool._document_keywords(make_document("doc-1", "Quarterly revenue report", version=2))
+        tool._document_keywords(make_document("doc-2", "Annual revenue report"))
+
+        assert first is second
+        assert first == {"quarterly", "revenue", "report"}
+        assert len(calls) == 2
+        assert tool._document_keywords(make_document("doc-3", "")) is None
+
+    def test_short_candidates_skipped_before_tokenizing(self, tool, monkeypatch):
+        """Test candidates too short to reach the threshold are never tokenized"""
+        tokenized = []
+        original = tool._document_keywords
+        monkeypatch.setattr(FindSimilarDocumentsTool, "_document_keywords",
+                            lambda self, doc: tokenized.append(doc.metadata.document_id) or original(doc))
+        query = frozenset({"quarterly", "revenue", "report", "growth"})
+        documents = [
+            make_document("short", "revenue"),
+            make_document("long", "quarterly revenue report growth"),
+        ]
+
+        results = tool._score_keyword_candidates(
+            documents, query, 0.75, False, "source", DocumentType.PDF, 5
+        )
+
+        assert tokenized == ["long"]
+        assert [result["document_id"] for result in results] == ["long"]
+
+    def test_top_k_keeps_best_and_earliest(self, tool):
+        """Test only the best `limit` candidates are kept, earlier ones winning ties"""
+        query = frozenset({"quarterly", "revenue", "report", "growth"})
+        documents = [
+            make_document("half-1", "quarterly revenue"),
+            make_document("full", "quarterly revenue report growth"),
+            make_document("half-2", "report growth"),
+            make_document("three", "quarterly revenue report"),
+        ]
+
+        results = tool._score_keyword_candidates(
+            documents, query, 0.5, False, "source", DocumentType.PDF, 3
+        )
+
+        assert [result["document_id"] for result in results] == ["full", "three", "half-1"]
+        assert [result["similarity_score"] for result in results] == [1.0, 0.75, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_keyword_search_ranks_matches(self, tool, document_service):
+        """Test keyword search skips the source document and applies the threshold"""
+        tool.document_service = document_service
+        source = make_document("source", "quarterly revenue report")
+
+        results = await tool._keyword_similarity_search(
+            "quarterly revenue report", source, limit=5, threshold=0.5, exclude_same_type=False
+        )
+
+        assert [result["document_id"] for result in results] == ["match"]
+        assert results[0]["similarity_score"] == 1.0
+
+
+class TestQueryExtraction:
+    """Test suite for query text extraction"""
+
+    def test_json_text_in_document_order(self, tool):
+        """Test JSON string values are collected in document order"""
+        content = '{"title": "Annual report", "items": [{"name": "Revenue"}, "1234", "ok"], "note": "Final"}'
+
+        assert tool._extract_json_text(content) == "Annual report Revenue Final"
+
+    def test_json_text_stops_at_query_limit(self, tool, monkeypatch):
+        """Test extraction stops once the query length limit is reached"""
+        monkeypatch.setattr(find_similar_documents_tool, "_MAX_QUERY_LENGTH", 10)
+        content = '["alpha beta", "gamma delta", "epsilon"]'
+
+        assert tool._extract_json_text(content) == "alpha beta"
+
+    def test_large_json_not_parsed(self, tool, monkeypatch):
+        """Test JSON documents above the parse limit use their raw leading text"""
+        monkeypatch.setattr(find_similar_documents_tool, "_MAX_JSON_PARSE_LENGTH", 20)
+        monkeypatch.setattr(FindSimilarDocumentsTool, "_extract_json_text", MagicMock(side_effect=AssertionError))
+        document = make_document("doc-1", "", DocumentType.JSON)
+        document.content.formatted_content = '{"title": "Annual report", "note": "Final"}'
+
+        assert tool._extract_query_text(document) == document.content.formatted_content
+
+    def test_query_text_falls_back_to_raw_text(self, tool, monkeypatch):
+        """Test raw text is used, capped before stripping"""
+        monkeypatch.setattr(find_similar_documents_tool, "_MAX_QUERY_LENGTH", 12)
+
+        assert tool._extract_query_text(make_document("doc-1", "  Annual report 2024 ")) == "Annual rep"
+        assert tool._extract_query_text(make_document("doc-2", "")) == ""
+
+    def test_invalid_json_returned_unchanged(self, tool):
+        """Test non-JSON content is used as-is"""
+        assert tool._extract_json_text("not json") == "not json"
+
+
+class TestResultEnrichment:
+    """Test suite for result enrichment"""
+
+    @pytest.mark.asyncio
+    async def test_snippets_fetched_concurrently(self, tool):
+        """Test content is fetched for every result, tolerating failures"""
+        async def get_document(document_id):
+            if document_id == "missing":
+                raise KeyError(document_id)
+            return make_document(document_id, "x" * 250)
+
+        tool.document_service = MagicMock()
+        tool.document_service.get_document = AsyncMock(side_effect=get_document)
+        results = [
+            {"document_id": "long", "similarity_score": 0.95},
+            {"document_id": "missing", "similarity_score": 0.75},
+        ]
+
+        enriched = await tool._enrich_results(results, include_content=True)
+
+        assert tool.document_service.get_document.await_count == 2
+        assert enriched[0]["content_snippet"] == "x" * 200 + "..."
+        assert enriched[1]["content_snippet"] == "Content unavailable"
+        assert [doc["similarity_level"] for doc in enriched] == ["very_high", "medium"]
+
+    @pytest.mark.asyncio
+    async def test_no_fetch_without_include_content(self, tool):
+        """Test content is not fetched unless requested"""
+        tool.document_service = MagicMock()
+        tool.document_service.get_document = AsyncMock()
+
+        results = [{"document_id": "a", "similarity_score": 0.5}]
+        enriched = await tool._enrich_results(results, False)
+
+        assert enriched is results
+        tool.document_service.get_document.assert_not_awaited()
+        assert "content_snippet" not in enriched[0]
+        assert enriched[0]["similarity_level"] == "low"
+
+    @pytest.mark.asyncio
+    async def test_level_boundaries(self, tool):
+        """Test level edges are inclusive lower bounds"""
+        scores = [0.9, 0.8999, 0.8, 0.7, 0.6999, 0.0]
+        enriched = await tool._enrich_results(
+            [{"document_id": str(i), "similarity_score": score} for i, score in enumerate(scores)],
+            include_content=False
+        )
+
+        assert [doc["similarity_level"] for doc in enriched] == [
+            "very_high", "high", "high", "medium", "low", "low"
+        ]
+
+
+class TestSearchStatistics:
+    """Test suite for search statistics"""
+
+    def test_distribution_counts_assigned_levels(self, tool):
+        """Test statistics count the levels assigned during enrichment"""
+        enriched = [
+            {"similarity_score": 0.95, "similarity_level": "very_high"},
+            {"similarity_score": 0.92, "similarity_level": "very_high"},
+            {"similarity_score": 0.72, "similarity_level": "medium"},
+        ]
+
+        statistics = tool._generate_search_statistics(enriched, "quarterly revenue report")
+
+        assert statistics["similarity_distribution"] == {
+            "very_high": 2, "high": 0, "medium": 1, "low": 0
+        }
+        assert statistics["max_similarity"] == 0.95
+        assert statistics["min_similarity"] == 0.72
+        assert statistics["query_keywords"] == 3
+
+    def test_precomputed_query_keywords_reused(self, tool, monkeypatch):
+        """Test statistics do not re-tokenize when keywords are passed in"""
+        monkeypatch.setattr(FindSimilarDocumentsTool, "_extract_keywords",
+                            lambda self, text: pytest.fail("query re-tokenized"))
+        enriched = [{"similarity_score": 0.8, "similarity_level": "high"}]
+
+        statistics = tool._generate_search_statistics(
+            enriched, "quarterly revenue report",
+            query_keywords=frozenset({"quarterly", "revenue", "report"})
+        )
+
+        assert statistics["query_keywords"] == 3
+
+
+class TestVectorSimilarity:
+    """Test suite for vector similarity search"""
+
+    @pytest.mark.asyncio
+    async def test_exclusions_pushed_to_service(self, tool, vector_search_service):
+        """Test only `limit` results are requested when the service filters"""
+        vector_search_service.similarity_search = AsyncMock(return_value=[
+            {"document_id": "a", "score": 0.9, "document_type": "pdf"},
+        ])
+        source = make_document("source", "quarterly revenue report")
+
+        results = await tool._vector_similarity_search("quarterly revenue", source, 1, 0.7, True)
+
+        assert [result["document_id"] for result in results] == ["a"]
+        kwargs = vector_search_service.similarity_search.await_args.kwargs
+        assert kwargs["limit"] == 1
+        assert kwargs["exclude_ids"] == ["source"]
+        assert kwargs["exclude_document_types"] == ["text"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_over_fetches_on_demand(self, tool, vector_search_service):
+        """Test services without exclusion support are paged only as needed"""
+        candidates = [
+            {"document_id": "source", "score": 0.99, "document_type": "text"},
+            {"document_id": "same", "score": 0.95, "document_type": "text"},
+            {"document_id": "other", "score": 0.9, "document_type": "pdf"},
+        ]
+        limits = []
+
+        async def similarity_search(query_vector, limit, threshold):
+            limits.append(limit)
+            return candidates[:limit]
+
+        vector_search_service.similarity_search = similarity_search
+        source = make_document("source", "quarterly revenue report")
+
+        results = await tool._vector_similarity_search("quarterly revenue", source, 1, 0.7, True)
+
+        assert [result["document_id"] for result in results] == ["other"]
+        assert limits == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_type_error_from_supporting_service_not_retried(self, tool, vector_search_service,
+                                                                  monkeypatch):
+        """Test a TypeError inside a service that accepts exclusions is not treated as unsupported"""
+        calls = []
+
+        async def similarity_search(query_vector, limit, threshold,
+                                    exclude_ids=None, exclude_document_types=None):
+            calls.append(limit)
+            raise TypeError("bad vector")
+
+        vector_search_service.similarity_search = similarity_search
+        keyword_search = AsyncMock(return_value=[])
+        monkeypatch.setattr(FindSimilarDocumentsTool, "_keyword_similarity_search", keyword_search)
+        source = make_document("source", "quarterly revenue report")
+
+        results = await tool._vector_similarity_search("quarterly revenue", source, 1, 0.7, True)
+
+        assert results == []
+        assert calls == [1]
+        keyword_search.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_partial_exclusion_support_uses_fallback(self, tool, vector_search_service):
+        """Test a service missing exclude_document_types is not sent exclusions"""
+        calls = []
+
+        async def similarity_search(query_vector, limit, threshold, exclude_ids=None):
+            calls.append(exclude_ids)
+            return [{"document_id": "other", "score": 0.9, "document_type": "pdf"}]
+
+        vector_search_service.similarity_search = similarity_search
+        source = make_document("source", "quarterly revenue report")
+
+        results = await tool._vector_similarity_search("quarterly revenue", source, 1, 0.7, True)
+
+        assert [result["document_id"] for result in results] == ["other"]
+        assert calls == [None]
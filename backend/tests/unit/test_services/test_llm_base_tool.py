@@ -0,0 +1,126 @@
+"""Tests for the LLM tool base class"""
+
+from typing import Any, Dict
+
+import pytest
+
+from src.services.llm.base_tool import BaseLLMTool, ToolMetadata
+from src.services.llm.tool_registry import LLMToolType, ToolRegistry
+
+
+class SchemaTool(BaseLLMTool):
+    """Test tool with a typed input schema"""
+
+    metadata_builds = 0
+
+    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        self.validate_input(input_data)
+        return {"ok": True}
+
+    def get_metadata(self) -> ToolMetadata:
+        type(self).metadata_builds += 1
+        return ToolMetadata(
+            name="schema_tool",
+            description="Tool with a typed schema",
+            input_schema={
+                "text": {"type": "str", "required": True},
+                "limit": {"type": "int", "required": False},
+                "ratio": {"type": "float", "required": False},
+                "options": {"type": "dict", "required": False},
+                "anything": {"type": "any", "required": False}
+            },
+            max_input_length=10
+        )
+
+
+class OtherTool(SchemaTool):
+    """Test tool with different metadata"""
+
+    def get_metadata(self) -> ToolMetadata:
+        return ToolMetadata(name="other_tool", description="Another tool")
+
+
+@pytest.fixture
+def tool() -> SchemaTool:
+    """Create the schema test tool"""
+    return SchemaTool(name="schema_tool")
+
+
+class TestValidateInput:
+    """Test suite for compiled input validation"""
+
+    def test_valid_input(self, tool):
+        """Test input matching the schema passes"""
+        assert tool.validate_input({"text": "hello", "limit": 3, "ratio": 1, "anything": object()})
+
+    def test_missing_required_field(self, tool):
+        """Test a missing required field is rejected"""
+        with pytest.raises(ValueError, match="Required field 'text' missing"):
+            tool.validate_input({"limit": 3})
+
+    @pytest.mark.parametrize("field, value, message", [
+        ("text", 5, "Field 'text' must be a string"),
+        ("limit", "3", "Field 'limit' must be an integer"),
+        ("ratio", "0.5", "Field 'ratio' must be a number"),
+        ("options", [], "Field 'options' must be a dictionary")
+    ])
+    def test_wrong_type(self, tool, field, value, message):
+        """Test wrongly typed fields are rejected with the field message"""
+        input_data = {"text": "hello", field: value}
+
+        with pytest.raises(ValueError, match=message):
+            tool.validate_input(input_data)
+
+    def test_text_length_limit(self, tool):
+        """Test text beyond max_input_length is rejected"""
+        with pytest.raises(ValueError, match="maximum length of 10 characters"):
+            tool.validate_input({"text": "x" * 11})
+
+    def test_metadata_not_rebuilt_per_call(self, tool):
+        """Test validation reuses the validator built at construction"""
+        builds = SchemaTool.metadata_builds
+
+        for _ in range(3):
+            tool.validate_input({"text": "hello"})
+
+        assert SchemaTool.metadata_builds == builds
+
+
+class TestMetadataReuse:
+    """Test suite for metadata reuse"""
+
+    def test_str_uses_cached_metadata(self, tool):
+        """Test the string form does not rebuild metadata"""
+        builds = SchemaTool.metadata_builds
+
+        assert str(tool) == "schema_tool (v1.0.0): Tool with a typed schema"
+        assert SchemaTool.metadata_builds == builds
+
+    def test_registry_metadata_built_once(self, monkeypatch):
+        """Test registry metadata lookups reuse the first result"""
+        monkeypatch.setattr(ToolRegistry, "_tools", {})
+        monkeypatch.setattr(ToolRegistry, "_metadata_cache", {})
+        ToolRegistry.register(LLMToolType.CLASSIFICATION, SchemaTool)
+        builds = SchemaTool.metadata_builds
+
+        for _ in range(3):
+            assert ToolRegistry.get_tool_metadata(LLMToolType.CLASSIFICATION).name == "schema_tool"
+        ToolRegistry.get_tool_info()
+
+        assert SchemaTool.metadata_builds == builds + 2
+
+    def test_registry_metadata_refreshed_on_register(self, monkeypatch):
+        """Test re-registering a tool type drops its cached metadata"""
+        monkeypatch.setattr(ToolRegistry, "_tools", {})
+        monkeypatch.setattr(ToolRegistry, "_metadata_cache", {})
+        ToolRegistry.register(LLMToolType.CLASSIFICATION, SchemaTool)
+        ToolRegistry.get_tool_metadata(LLMToolType.CLASSIFICATION)
+
+        ToolRegistry.register(LLMToolType.CLASSIFICATION, OtherTool)
+
+        assert ToolRegistry.get_tool_metadata(LLMToolType.CLASSIFICATION).name == "other_tool"
+
+    def test_metadata_uses_slots(self, tool):
+        """Test metadata records carry no per-instance attribute dict"""
+        assert not hasattr(tool._metadata, "__dict__")
+        assert tool._metadata.capabilities == []
@@ -0,0 +1,154 @@
+"""Unit tests for the concrete LLM provider implementations"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.config import get_settings
+from src.services.llm.providers.implementations import anthropic_providers, google_providers, openai_providers
+from src.services.llm.providers.implementations.anthropic_providers import (
+    ClaudeSonnetProvider,
+    ClaudeHaikuProvider
+)
+from src.services.llm.providers.implementations.google_providers import (
+    GeminiProProvider,
+    GeminiFlashProvider
+)
+from src.services.llm.providers.implementations.openai_providers import (
+    GPT4OptimizedProvider,
+    GPT4MiniProvider,
+    TextEmbeddingSmallProvider,
+    TextEmbeddingLargeProvider
+)
+
+
+@pytest.fixture
+def provider_settings(monkeypatch):
+    """Settings whose provider config lookups are counted"""
+    llm = get_settings().llm
+    providers = MagicMock(wraps=llm.providers)
+    settings = SimpleNamespace(
+        llm=SimpleNamespace(providers=providers, anthropic_api_key=None, openai_api_key=None)
+    )
+    monkeypatch.setattr(anthropic_providers, "get_settings", lambda: settings)
+    monkeypatch.setattr(openai_providers, "get_settings", lambda: settings)
+    return settings
+
+
+def fake_anthropic_client() -> MagicMock:
+    """Build a client whose messages.create returns a fixed text"""
+    client = MagicMock()
+    client.messages.create = AsyncMock(
+        return_value=SimpleNamespace(content=[SimpleNamespace(text="answer")])
+    )
+    return client
+
+
+class TestClaudeProviders:
+    """Test suite for the Anthropic providers"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider_class, key", [
+        (ClaudeSonnetProvider, "anthropic-claude-3.5-sonnet"),
+        (ClaudeHaikuProvider, "anthropic-claude-3.5-haiku")
+    ])
+    async def test_request_defaults_resolved_once(self, provider_settings, provider_class, key):
+        """Test generate uses config defaults without re-reading settings"""
+        config = dict(provider_settings.llm.providers[key], max_tokens=123, temperature=0.7)
+        provider_settings.llm.providers.get.side_effect = lambda name, default=None: config
+        provider = provider_class()
+        await provider.initialize({"api_key": "test-key"})
+        provider._client = fake_anthropic_client()
+        lookups = provider_settings.llm.providers.get.call_count
+
+        for _ in range(3):
+            assert await provider.generate("hello") == "answer"
+
+        assert provider_settings.llm.providers.get.call_count == lookups
+        request = provider._client.messages.create.call_args.kwargs
+        assert (request["max_tokens"], request["temperature"]) == (123, 0.7)
+
+    @pytest.mark.asyncio
+    async def test_client_shared_per_api_key(self, provider_settings, monkeypatch):
+        """Test both Claude providers reuse one client per API key"""
+        monkeypatch.setattr(anthropic_providers, "AsyncAnthropic", MagicMock(side_effect=lambda api_key: object()))
+        anthropic_providers._get_anthropic_client.cache_clear()
+        sonnet, haiku, other = ClaudeSonnetProvider(), ClaudeHaikuProvider(), ClaudeHaikuProvider()
+
+        await sonnet.initialize({"api_key": "key-a"})
+        await haiku.initialize({"api_key": "key-a"})
+        await other.initialize({"api_key": "key-b"})
+        anthropic_providers._get_anthropic_client.cache_clear()
+
+        assert sonnet._client is haiku._client
+        assert other._client is not sonnet._client
+        assert anthropic_providers.AsyncAnthropic.call_count == 2
+
+
+class TestOpenAIProviders:
+    """Test suite for the OpenAI providers"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider_class, key", [
+        (GPT4OptimizedProvider, "openai-gpt-4o"),
+        (GPT4MiniProvider, "openai-gpt-4o-mini")
+    ])
+    async def test_request_defaults_resolved_once(self, provider_settings, provider_class, key):
+        """Test generate uses config defaults without re-reading settings"""
+        config = dict(provider_settings.llm.providers[key], max_tokens=321, temperature=0.9)
+        provider_settings.llm.providers.get.side_effect = lambda name, default=None: config
+        provider = provider_class()
+        await provider.initialize({})
+        provider._client = MagicMock()
+        provider._client.chat.completions.create = AsyncMock(return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="answer"))]
+        ))
+        lookups = provider_settings.llm.providers.get.call_count
+
+        for _ in range(3):
+            assert await provider.generate("hello") == "answer"
+
+        assert provider_settings.llm.providers.get.call_count == lookups
+        request = provider._client.chat.completions.create.call_args.kwargs
+        assert (request["max_tokens"], request["temperature"]) == (321, 0.9)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider_class, dimensions", [
+        (GPT4OptimizedProvider, 1536),
+        (TextEmbeddingSmallProvider, 1536),
+        (TextEmbeddingLargeProvider, 3072)
+    ])
+    async def test_mock_embeddings(self, provider_class, dimensions):
+        """Test the clientless embedding path returns a full random vector"""
+        embedding = await provider_class().generate_embeddings("text")
+
+        assert len(embedding) == dimensions
+        assert all(0.0 <= value < 1.0 for value in embedding)
+
+
+class TestGeminiProviders:
+    """Test suite for the Google providers"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider_class", [GeminiProProvider, GeminiFlashProvider])
+    async def test_mock_embeddings(self, provider_class):
+        """Test the clientless embedding path returns a full random vector"""
+        provider = provider_class()
+
+        first = await provider.generate_embeddings("text")
+        second = await provider.generate_embeddings("text")
+
+        assert len(first) == 768
+        assert all(isinstance(value, float) and 0.0 <= value < 1.0 for value in first)
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_mock_streaming_yields_leading_words(self, monkeypatch):
+        """Test the clientless stream echoes the first prompt words"""
+        monkeypatch.setattr(google_providers.asyncio, "sleep", AsyncMock())
+        provider = GeminiFlashProvider()
+
+        chunks = [chunk async for chunk in provider.generate_streaming("one two  three four five six " * 1000)]
+
+        assert chunks == ["[Flash Mock] ", "one ", "two ", "three ", "four ", "five "]
@@ -11,7 +11,8 @@ from src.services.llm.providers.base_provider import (
     ModelCapabilities,
     CostProfile,
     CostTier,
-    TaskRequirements
+    TaskRequirements,
+    _leading_words
 )
 from src.services.llm.providers.provider_registry import ModelProviderRegistry
 from src.services.llm.providers.model_selector import ModelSelector, SelectionStrategy
@@ -58,6 +59,87 @@ class TestModelProviderBase:
         assert req.needs_vision is True
 
 
+def make_provider(capabilities, tier=CostTier.STANDARD, latency_ms=1000, quality=0.85, max_context=8192):
+    """Build a provider instance with the given metadata"""
+    class RequirementsProvider(BaseModelProvider):
+        def get_metadata(self) -> ModelMetadata:
+            return ModelMetadata(
+                name="Requirements",
+                provider="mock",
+                model_id="mock-req",
+                version="1.0",
+                capabilities=capabilities,
+                cost_profile=CostProfile(
+                    tier=tier,
+                    cost_per_1k_input=0.001,
+                    cost_per_1k_output=0.002,
+                    avg_latency_ms=latency_ms,
+                    max_context=max_context
+                ),
+                quality_score=quality,
+                description="Test",
+                created_at=datetime.now()
+            )
+
+        async def initialize(self, config: Dict[str, Any]) -> None:
+            pass
+
+        async def generate(self, prompt: str, **kwargs) -> str:
+            return "response"
+
+        async def generate_streaming(self, prompt: str, **kwargs):
+            yield "stream"
+
+        async def generate_embeddings(self, text: str, **kwargs) -> List[float]:
+            return [0.0]
+
+        async def health_check(self) -> Dict[str, Any]:
+            return {"status": "ok"}
+
+    return RequirementsProvider()
+
+
+class TestProviderRequirements:
+    """Test provider capability and requirement checks"""
+
+    def test_supports_capability(self):
+        """Test single and combined capability checks"""
+        provider = make_provider(ModelCapabilities.TEXT_GENERATION | ModelCapabilities.STREAMING)
+
+        assert provider.supports_capability(ModelCapabilities.STREAMING)
+        assert not provider.supports_capability(ModelCapabilities.VISION)
+        assert provider.supports_capability(ModelCapabilities.VISION | ModelCapabilities.TEXT_GENERATION)
+
+    @pytest.mark.parametrize("requirements, expected", [
+        (TaskRequirements(), True),
+        (TaskRequirements(needs_streaming=True), True),
+        (TaskRequirements(needs_vision=True), False),
+        (TaskRequirements(needs_json_mode=True), False),
+        (TaskRequirements(max_cost_tier=CostTier.ECONOMY), False),
+        (TaskRequirements(max_cost_tier=CostTier.PREMIUM), True),
+        (TaskRequirements(max_latency_ms=500), False),
+        (TaskRequirements(min_quality_score=0.9), False),
+        (TaskRequirements(required_context=10000), False)
+    ])
+    def test_meets_requirements(self, requirements, expected):
+        """Test each requirement is checked against the provider metadata"""
+        provider = make_provider(ModelCapabilities.TEXT_GENERATION | ModelCapabilities.STREAMING)
+
+        assert provider.meets_requirements(requirements) is expected
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "   ",
+        "one",
+        "  alpha beta\tgamma\n delta ",
+        "a\u3000b\xa0c\x1fd e f g h"
+    ])
+    def test_leading_words_matches_split(self, text):
+        """Test the bounded word scan agrees with str.split()"""
+        for count in (0, 1, 3, 10):
+            assert list(_leading_words(text, count)) == text.split()[:count]
+
+
 class TestProviderRegistry:
     """Test provider registry functionality"""
 
@@ -209,6 +291,21 @@ class TestProviderRegistry:
         assert metadata.quality_score == 0.95
         assert metadata.cost_profile.tier == CostTier.PREMIUM
 
+    def test_provider_metadata_built_once(self, monkeypatch):
+        """Test repeated metadata lookups reuse the first instance's metadata"""
+        provider_class = type(make_provider(ModelCapabilities.TEXT_GENERATION))
+        builds = []
+        get_metadata = provider_class.get_metadata
+        monkeypatch.setattr(provider_class, "get_metadata", lambda self: builds.append(1) or get_metadata(self))
+        ModelProviderRegistry.register("counted", provider_class)
+
+        for _ in range(3):
+            assert ModelProviderRegistry.get_provider_metadata("counted").model_id == "mock-req"
+        ModelProviderRegistry.get_provider_info()
+        ModelProviderRegistry.get_providers_by_capability(ModelCapabilities.TEXT_GENERATION)
+
+        assert len(builds) == 1
+
     def test_get_providers_by_capability(self):
         """Test filtering providers by capability"""
         # Create providers with different capabilities
@@ -505,4 +602,69 @@ class TestModelSelector:
         cost = selector.estimate_cost('test_model', 1000, 500)
 
         # Should be (1000/1000 * 0.003) + (500/1000 * 0.015) = 0.003 + 0.0075 = 0.0105
-        assert abs(cost - 0.0105) < 0.0001
\ No newline at end of file
+        assert abs(cost - 0.0105) < 0.0001
+
+    @pytest.mark.parametrize("requirements, expected", [
+        (None, {"economy", "vision", "premium"}),
+        (TaskRequirements(min_quality_score=0.0), {"economy", "vision"}),
+        (TaskRequirements(max_cost_tier=CostTier.PREMIUM, min_quality_score=0.0), {"economy", "vision", "premium"}),
+        (TaskRequirements(needs_vision=True, min_quality_score=0.0), {"vision"}),
+        (TaskRequirements(needs_vision=True, needs_json_mode=True, min_quality_score=0.0), set()),
+        (TaskRequirements(needs_streaming=True, max_cost_tier=CostTier.PREMIUM), {"premium"}),
+        (TaskRequirements(required_context=60000, min_quality_score=0.0), {"vision"}),
+        (TaskRequirements(max_latency_ms=500, min_quality_score=0.0), {"economy"})
+    ])
+    def test_eligible_models_filter(self, monkeypatch, requirements, expected):
+        """Test requirement filtering over the precomputed model table"""
+        providers = {
+            'economy': {
+                'enabled': True, 'cost_tier': 'economy', 'quality_score': 0.6,
+                'avg_latency_ms': 300, 'max_context': 16000, 'capabilities': 'text_generation'
+            },
+            'vision': {
+                'enabled': True, 'cost_tier': 'standard', 'quality_score': 0.8,
+                'avg_latency_ms': 1500, 'max_context': 100000, 'capabilities': 'text_generation,vision'
+            },
+            'premium': {
+                'enabled': True, 'cost_tier': 'premium', 'quality_score': 0.95,
+                'avg_latency_ms': 2500, 'max_context': 50000, 'capabilities': 'streaming,json_mode'
+            },
+            'disabled': {'enabled': False, 'cost_tier': 'economy'}
+        }
+        mock_settings = type('Settings', (), {
+            'llm': type('LLM', (), {'selection_strategy': 'quality', 'providers': providers})()
+        })()
+        monkeypatch.setattr('src.services.llm.providers.model_selector.get_settings', lambda: mock_settings)
+        selector = ModelSelector()
+
+        eligible = selector._get_eligible_models(requirements)
+
+        assert {model["provider_name"] for model in eligible} == expected
+        assert selector._get_model_table() is selector._get_model_table()
+
+
+class TestGenerateMany:
+    """Test concurrent generation over several prompts"""
+
+    @pytest.mark.asyncio
+    async def test_results_in_prompt_order_within_limit(self):
+        """Test results keep prompt order and concurrency stays bounded"""
+        provider = make_provider(ModelCapabilities.TEXT_GENERATION)
+        provider._max_concurrency = 3
+        active = []
+        peak = []
+
+        async def generate(prompt: str, **kwargs) -> str:
+            active.append(prompt)
+            peak.append(len(active))
+            await asyncio.sleep(0.01 * (len(prompt) % 3))
+            active.remove(prompt)
+            return f"{prompt}:{kwargs['temperature']}"
+
+        provider.generate = generate
+        prompts = [f"prompt-{index}" for index in range(10)]
+
+        results = await provider.generate_many(prompts, temperature=0.2)
+
+        assert results == [f"{prompt}:0.2" for prompt in prompts]
+        assert max(peak) == 3
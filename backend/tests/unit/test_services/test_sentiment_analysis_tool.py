@@ -0,0 +1,476 @@
+"""Tests for the sentiment analysis tool"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from src.models.document import DocumentMessage, DocumentMetadata, DocumentContent, DocumentType
+from src.services.document_tools.tools import sentiment_analysis_tool
+from src.services.document_tools.tools.sentiment_analysis_tool import SentimentAnalysisTool
+
+
+def make_document(text: str) -> DocumentMessage:
+    """Build a minimal text document message"""
+    return DocumentMessage(
+        metadata=DocumentMetadata(
+            document_id="doc-1",
+            document_type=DocumentType.TEXT,
+            name="doc-1",
+            created_user="test_user",
+            updated_user="test_user"
+        ),
+        content=DocumentContent(raw_text=text)
+    )
+
+
+LINE_RESPONSE = "SENTIMENT: positive\nCONFIDENCE: 0.9\nMENTIONS: 1\nREASONING: upbeat"
+
+
+def batched_response(prompt: str) -> str:
+    """Answer batched prompts with JSON and everything else with KEY: value lines"""
+    if "numbered text segment" in prompt:
+        count = len(prompt.split("Segments:\n", 1)[1].splitlines())
+        return json.dumps([
+            {"i": i, "label": "positive", "confidence": 0.8} for i in range(count)
+        ])
+    if "Respond with JSON only, keyed by aspect" in prompt:
+        return 'Here you go: {"food": {"sentiment": "positive", "confidence": 0.7, "mentions": 2, "reasoning": "tasty"}}'
+    return LINE_RESPONSE
+
+
+class ConcurrencyTrackingLLM:
+    """LLM stub that records how many requests are in flight at once"""
+
+    def __init__(self, fail_on: str = None, respond=lambda prompt: LINE_RESPONSE):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.prompts = []
+        self.calls = []
+        self.fail_on = fail_on
+        self.respond = respond
+
+    async def generate_text(self, prompt: str, **kwargs) -> str:
+        self.prompts.append(prompt)
+        self.calls.append(kwargs)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on and self.fail_on in prompt:
+                raise RuntimeError("provider error")
+            return self.respond(prompt)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def clear_analysis_cache():
+    """Isolate the module-level analysis cache between tests"""
+    sentiment_analysis_tool._analysis_cache.clear()
+    yield
+    sentiment_analysis_tool._analysis_cache.clear()
+
+
+@pytest.fixture
+def llm_service() -> ConcurrencyTrackingLLM:
+    """Create a concurrency tracking LLM stub answering batched prompts"""
+    return ConcurrencyTrackingLLM(respond=batched_response)
+
+
+@pytest.fixture
+def tool(llm_service) -> SentimentAnalysisTool:
+    """Create the tool with the LLM stub"""
+    return SentimentAnalysisTool(name="sentiment_analysis", llm_service=llm_service)
+
+
+class TestMetadata:
+    """Test suite for tool metadata"""
+
+    def test_metadata_built_once(self, tool):
+        """Test every call and instance shares one metadata object"""
+        other = SentimentAnalysisTool(name="sentiment_analysis")
+
+        assert tool.get_metadata() is tool.get_metadata() is other.get_metadata()
+        assert tool.get_metadata().id == "sentiment_analysis"
+
+
+class TestConcurrentAnalysis:
+    """Test suite for concurrent LLM requests"""
+
+    @pytest.mark.asyncio
+    async def test_execute_issues_requests_concurrently(self, tool, llm_service):
+        """Test overall, segment, aspect and emotion requests run in one wave"""
+        document = make_document("The service was great. The food was wonderful. Prices were fair enough.")
+
+        result = await tool.execute(document, {"granularity": "sentence", "aspects": ["food", "service"]})
+
+        # overall + batched segments + batched aspects + emotions
+        assert len(llm_service.prompts) == 4
+        assert llm_service.max_in_flight == 4
+        assert result["overall_sentiment"]["label"] == "positive"
+        assert [item["segment_index"] for item in result["detailed_analysis"]] == [0, 1, 2]
+        assert result["aspects"]["food"]["mentions"] == 2
+        assert result["aspects"]["service"]["reasoning"] == "Analysis failed"
+
+    @pytest.mark.asyncio
+    async def test_document_prompts_share_prefix(self, tool, llm_service):
+        """Test whole-document prompts start with the same instructions and text"""
+        text = "The service was great. The food was wonderful."
+
+        await tool.execute(make_document(text), {"aspects": ["food"]})
+
+        prefix = sentiment_analysis_tool._DOCUMENT_PROMPT_PREFIX + text + "\n\n"
+        assert len(llm_service.prompts) == 3
+        assert all(prompt.startswith(prefix) for prompt in llm_service.prompts)
+
+    @pytest.mark.asyncio
+    async def test_failed_segment_falls_back(self):
+        """Test a failing segment request uses the keyword fallback"""
+        llm_service = ConcurrencyTrackingLLM(fail_on="terrible")
+        tool = SentimentAnalysisTool(name="sentiment_analysis", llm_service=llm_service)
+
+        results = await tool._analyze_by_granularity("The food was terrible. The staff were great.", "sentence")
+
+        assert results[0]["sentiment"]["fallback"] is True
+        assert results[0]["sentiment"]["label"] == "negative"
+        assert results[1]["sentiment"]["label"] == "positive"
+
+    @pytest.mark.asyncio
+    async def test_failed_aspect_reported(self):
+        """Test a failing aspect request does not fail the other aspects"""
+        llm_service = ConcurrencyTrackingLLM(fail_on='"price"')
+        tool = SentimentAnalysisTool(name="sentiment_analysis", llm_service=llm_service)
+
+        results = await tool._analyze_aspects("The food was great but the price was high.", ["food", "price"])
+
+        assert results["food"]["sentiment"] == "positive"
+        assert results["price"]["reasoning"] == "Analysis failed"
+
+
+class TestBatchedAnalysis:
+    """Test suite for batched segment and aspect prompts"""
+
+    @pytest.mark.asyncio
+    async def test_segments_analyzed_in_one_request(self, tool, llm_service):
+        """Test all segments share one prompt and missing entries fall back"""
+        llm_service.respond = lambda prompt: '```json\n[{"i": 1, "label": "NEGATIVE", "confidence": 3}]\n```'
+
+        results = await tool._analyze_by_granularity("The food was terrible. The staff were great.", "sentence")
+
+        assert len(llm_service.prompts) == 1
+        assert results[0]["sentiment"]["fallback"] is True
+        assert results[1]["sentiment"] == {
+            "label": "negative", "confidence": 1.0, "reasoning": "Batched segment analysis"
+        }
+
+
+class TestStreaming:
+    """Test suite for streamed execution"""
+
+    @pytest.mark.asyncio
+    async def test_parts_streamed_before_statistics(self, tool):
+        """Test each section is yielded once, statistics last"""
+        document = make_document("The service was great. The food was wonderful.")
+
+        parts = [part async for part in tool.execute_stream(document, {"granularity": "sentence"})]
+
+        assert [len(part) for part in parts] == [1] * 5
+        assert {next(iter(part)) for part in parts[:4]} == {
+            "overall_sentiment", "detailed_analysis", "aspects", "emotions"
+        }
+        assert "statistics" in parts[-1]
+
+    @pytest.mark.asyncio
+    async def test_execute_keeps_result_order(self, tool):
+        """Test execute aggregates the stream in the documented key order"""
+        result = await tool.execute(make_document("The service was great."))
+
+        assert list(result) == ["overall_sentiment", "detailed_analysis", "aspects", "emotions", "statistics"]
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_pending_analyses(self, tool, llm_service):
+        """Test abandoning the stream cancels analyses still in flight"""
+        stream = tool.execute_stream(make_document("The service was great."))
+
+        await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert llm_service.in_flight == 0
+
+
+class TestAnalysisCache:
+    """Test suite for the overall/emotion analysis cache"""
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_text_hits_cache(self, tool, llm_service):
+        """Test case/whitespace variants reuse the cached LLM analysis"""
+        first = await tool._analyze_overall_sentiment("The service was great.")
+        second = await tool._analyze_overall_sentiment("the  service was\nGREAT.")
+
+        assert len(llm_service.prompts) == 1
+        assert second == first
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_namespaces_kept_apart(self, tool, llm_service):
+        """Test overall and emotion analyses do not share entries"""
+        await tool._analyze_overall_sentiment("The service was great.")
+        await tool._detect_emotions("The service was great.")
+        await tool._detect_emotions("The service was great.")
+
+        assert len(llm_service.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self):
+        """Test failed LLM analyses are retried on the next call"""
+        llm_service = ConcurrencyTrackingLLM(fail_on="Analyze the sentiment")
+        tool = SentimentAnalysisTool(name="sentiment_analysis", llm_service=llm_service)
+
+        await tool._analyze_overall_sentiment("The service was great.")
+        await tool._analyze_overall_sentiment("The service was great.")
+
+        assert len(llm_service.prompts) == 2
+
+
+class TestResponseParsing:
+    """Test suite for LLM response parsing"""
+
+    def test_parsed_responses_memoized_and_copied(self, tool):
+        """Test repeated responses hit the parse cache without sharing results"""
+        sentiment_analysis_tool._parse_sentiment_text.cache_clear()
+
+        first = tool._parse_sentiment_response(LINE_RESPONSE)
+        first["label"] = "mutated"
+        second = tool._parse_sentiment_response(LINE_RESPONSE)
+
+        assert second == {"label": "positive", "confidence": 0.9, "reasoning": "upbeat"}
+        assert sentiment_analysis_tool._parse_sentiment_text.cache_info().hits == 1
+
+    def test_emotion_and_aspect_parsing(self, tool):
+        """Test emotion scores are clamped and aspect fields are read"""
+        assert tool._parse_emotion_response("Joy: 0.8 (happy)\nAnger: 3 (loud)") == {"joy": 0.8, "anger": 1.0}
+        assert tool._parse_aspect_response(LINE_RESPONSE) == {
+            "sentiment": "positive", "confidence": 0.9, "mentions": 1, "reasoning": "upbeat"
+        }
+
+
+class TestKeywordFallback:
+    """Test suite for the keyword-based fallbacks"""
+
+    def test_sentiment_counts_distinct_whole_words(self, tool):
+        """Test polarity words are matched case-insensitively as whole words"""
+        result = tool._fallback_sentiment_analysis("GREAT food, great staff, I dislike nothing. Poorly lit.")
+
+        assert result["label"] == "positive"
+        assert result["reasoning"] == "Keyword-based analysis: 1 positive, 0 negative words"
+
+    def test_emotions_scored_per_distinct_keyword(self, tool):
+        """Test emotion intensities and that substrings like 'made' do not match 'mad'"""
+        emotions = tool._fallback_emotion_detection("Happy and GLAD. We made it, though I was worried.")
+
+        assert emotions == {"joy": 0.4, "fear": 0.2}
+
+    @pytest.mark.asyncio
+    async def test_aspect_mentions_counted_case_insensitively(self):
+        """Test the aspect fallback counts mentions, including overlapping aspects"""
+        tool = SentimentAnalysisTool(name="sentiment_analysis")
+
+        results = await tool._analyze_aspects("Food was hot. FOOD QUALITY was fine.", ["food", "food quality", "price"])
+
+        assert [results[aspect]["mentions"] for aspect in ("food", "food quality", "price")] == [2, 1, 0]
+        assert results["price"]["confidence"] == 0.0
+
+
+class TestTextSplitting:
+    """Test suite for granularity splitting"""
+
+    def test_sentences_split_on_terminator_runs(self, tool):
+        """Test sentences are split on runs of terminators and stripped"""
+        text = "Great food!! Slow service... Would I return? Yes"
+
+        assert tool._split_text_by_granularity(text, "sentence") == [
+            "Great food", "Slow service", "Would I return", "Yes"
+        ]
+
+    def test_paragraphs_split_on_blank_lines(self, tool):
+        """Test paragraphs split on blank lines, falling back to single newlines"""
+        assert tool._split_text_by_granularity("First\n\n\n  Second  \n\n", "paragraph") == ["First", "Second"]
+        assert tool._split_text_by_granularity("First\nSecond\n", "paragraph") == ["First", "Second"]
+
+
+class TestJsonResponses:
+    """Test suite for JSON-mode LLM answers"""
+
+    def test_json_answers_parsed_and_normalized(self, tool):
+        """Test JSON answers are preferred and normalized"""
+        assert tool._parse_sentiment_response(
+            'Sure: {"label": "Negative", "confidence": 1.5, "reasoning": "rude staff"}'
+        ) == {"label": "negative", "confidence": 1.0, "reasoning": "rude staff"}
+        assert tool._parse_emotion_response('{"Joy": 0.6, "anger": "high", "fear": 2}') == {"joy": 0.6, "fear": 1.0}
+        assert tool._parse_aspect_response('{"sentiment": "positive", "mentions": 2}') == {
+            "sentiment": "positive", "confidence": 0.0, "mentions": 2, "reasoning": "No reasoning provided"
+        }
+
+    @pytest.mark.asyncio
+    async def test_single_item_prompts_request_json(self, tool, llm_service):
+        """Test per-segment and per-aspect prompts render their JSON templates"""
+        llm_service.respond = lambda prompt: '{"label": "positive", "sentiment": "positive", "confidence": 0.9}'
+
+        segment = await tool._analyze_segment_sentiment("The food was great.")
+        aspect = await tool._analyze_aspect_sentiment("The food was great.", "food")
+
+        assert segment["label"] == "positive"
+        assert aspect["sentiment"] == "positive"
+        assert all('{"' in prompt for prompt in llm_service.prompts)
+
+
+class TestPromptTruncation:
+    """Test suite for token-bounded prompt text"""
+
+    @pytest.fixture(autouse=True)
+    def clear_truncation_cache(self):
+        """Isolate memoized truncations between tests"""
+        sentiment_analysis_tool._truncate_to_tokens.cache_clear()
+        yield
+        sentiment_analysis_tool._truncate_to_tokens.cache_clear()
+
+    def test_estimated_truncation_keeps_whole_words(self, monkeypatch):
+        """Test the estimate cuts at a space within budget * chars-per-token"""
+        monkeypatch.setattr(sentiment_analysis_tool, "_get_tokenizer", lambda: None)
+
+        assert sentiment_analysis_tool._truncate_to_tokens("alpha beta gamma delta", 3) == "alpha beta"
+        assert sentiment_analysis_tool._truncate_to_tokens("short", 4) == "short"
+
+    def test_tokenizer_truncation(self, monkeypatch):
+        """Test a tokenizer, when available, bounds the text by real tokens"""
+        class WordTokenizer:
+            def encode(self, text, disallowed_special=()):
+                return text.split(" ")
+
+            def decode(self, tokens):
+                return " ".join(tokens)
+
+        monkeypatch.setattr(sentiment_analysis_tool, "_get_tokenizer", lambda: WordTokenizer())
+
+        assert sentiment_analysis_tool._truncate_to_tokens("alpha beta gamma delta", 2) == "alpha beta"
+        assert sentiment_analysis_tool._truncate_to_tokens("alpha beta", 2) == "alpha beta"
+
+
+class TestModelRouting:
+    """Test suite for overall-sentiment routing"""
+
+    @pytest.mark.asyncio
+    async def test_unambiguous_keywords_skip_llm(self, tool, llm_service):
+        """Test a strong keyword margin is answered without an LLM call"""
+        result = await tool._analyze_overall_sentiment("Great, excellent and wonderful service. Perfect.")
+
+        assert llm_service.prompts == []
+        assert result["fallback"] is True
+        assert result["label"] == "positive"
+
+    @pytest.mark.asyncio
+    async def test_configured_models_selected_by_length(self, llm_service):
+        """Test short documents use the small model and long ones the large model"""
+        tool = SentimentAnalysisTool(
+            name="sentiment_analysis",
+            llm_service=llm_service,
+            small_model_name="small-model",
+            large_model_name="large-model"
+        )
+
+        await tool._analyze_overall_sentiment("The service was fine.")
+        await tool._analyze_overall_sentiment("The service was fine. " * 100)
+
+        assert [call["model"] for call in llm_service.calls] == ["small-model", "large-model"]
+
+    @pytest.mark.asyncio
+    async def test_service_default_model_without_configuration(self, tool, llm_service):
+        """Test no model argument is passed when none is configured"""
+        await tool._analyze_overall_sentiment("The service was fine.")
+
+        assert "model" not in llm_service.calls[0]
+
+
+class TestStatistics:
+    """Test suite for sentiment statistics"""
+
+    def test_distribution_and_dominant_emotion(self, tool):
+        """Test label shares, word count and dominant emotion"""
+        detailed = [
+            {"sentiment": {"label": "positive"}},
+            {"sentiment": {"label": "negative"}},
+            {"sentiment": {"label": "positive"}},
+            {"sentiment": {"label": "positive"}},
+        ]
+
+        stats = tool._generate_statistics(
+            "Good  food,\nbad service", {"confidence": 0.7}, detailed, {"joy": 0.4, "anger": 0.6}
+        )
+
+        assert stats["word_count"] == 4
+        assert stats["sentiment_distribution"] == {"positive": 0.75, "negative": 0.25}
+        assert stats["dominant_emotion"] == {"emotion": "anger", "intensity": 0.6}
+
+
+class TestLargeTextFallback:
+    """Test suite for keyword scans of large texts"""
+
+    def test_chunked_scan_keeps_whole_words(self, monkeypatch):
+        """Test chunk boundaries never split or invent keyword matches"""
+        monkeypatch.setattr(sentiment_analysis_tool, "_SCAN_CHUNK_SIZE", 8)
+
+        found = sentiment_analysis_tool._find_keywords(
+            sentiment_analysis_tool._POLARITY_RE, "a fantastic and terrible, goodness WRONG"
+        )
+
+        assert found == {"fantastic", "terrible", "wrong"}
+
+    @pytest.mark.asyncio
+    async def test_large_texts_scanned_in_worker_thread(self, monkeypatch):
+        """Test fallback scans of large texts run off the event loop thread"""
+        monkeypatch.setattr(sentiment_analysis_tool, "_OFFLOAD_TEXT_LENGTH", 10)
+        tool = SentimentAnalysisTool(name="sentiment_analysis")
+        threads = []
+        original = sentiment_analysis_tool._find_keywords
+
+        def tracking_find_keywords(pattern, text):
+            threads.append(threading.get_ident())
+            return original(pattern, text)
+
+        monkeypatch.setattr(sentiment_analysis_tool, "_find_keywords", tracking_find_keywords)
+
+        result = await tool.execute(make_document("I was happy, the food was great."))
+
+        assert result["overall_sentiment"]["label"] == "positive"
+        assert result["emotions"] == {"joy": 0.2}
+        assert threads and threading.get_ident() not in threads
+
+
+class TestEarlyExit:
+    """Test suite for answering confident documents without the LLM"""
+
+    @pytest.mark.asyncio
+    async def test_confident_keywords_skip_all_llm_calls(self, tool, llm_service):
+        """Test a confident document-level request makes no LLM calls"""
+        document = make_document("Great, excellent and wonderful service. I was happy.")
+
+        result = await tool.execute(document)
+
+        assert llm_service.prompts == []
+        assert result["overall_sentiment"]["fallback"] is True
+        assert result["emotions"] == {"joy": 0.2}
+        assert list(result) == ["overall_sentiment", "detailed_analysis", "aspects", "emotions", "statistics"]
+
+    @pytest.mark.asyncio
+    async def test_higher_threshold_or_aspects_use_llm(self, tool, llm_service):
+        """Test the LLM is still used above the keyword confidence or with aspects"""
+        document = make_document("Great, excellent and wonderful service. I was happy.")
+
+        await tool.execute(document, {"confidence_threshold": 0.9})
+        await tool.execute(document, {"aspects": ["service"]})
+
+        assert any("emotions" in prompt for prompt in llm_service.prompts)
+        assert any('"service"' in prompt for prompt in llm_service.prompts)
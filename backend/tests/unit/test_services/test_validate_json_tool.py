@@ -0,0 +1,517 @@
+"""Tests for the JSON validation tool"""
+
+import asyncio
+import json
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.document import DocumentMessage, DocumentMetadata, DocumentContent, DocumentType
+from src.services.document_tools.tools import validate_json_tool
+from src.services.document_tools.tools.validate_json_tool import ValidateJSONTool
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer"}
+    },
+    "required": ["name"]
+}
+
+
+def make_document(payload) -> DocumentMessage:
+    """Build a JSON document message from a payload or raw string"""
+    text = payload if isinstance(payload, str) else json.dumps(payload)
+    return DocumentMessage(
+        metadata=DocumentMetadata(
+            document_id="doc-1",
+            document_type=DocumentType.JSON,
+            name="doc.json",
+            created_user="test_user",
+            updated_user="test_user"
+        ),
+        content=DocumentContent(raw_text=text)
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_validator_cache():
+    """Isolate the compiled validator cache between tests"""
+    validate_json_tool._get_validator.cache_clear()
+    validate_json_tool._get_fast_validator.cache_clear()
+    yield
+    validate_json_tool._get_validator.cache_clear()
+    validate_json_tool._get_fast_validator.cache_clear()
+
+
+@pytest.fixture
+def tool() -> ValidateJSONTool:
+    """Create the JSON validation tool"""
+    return ValidateJSONTool(name="validate_json")
+
+
+class TestSchemaValidation:
+    """Test suite for schema validation"""
+
+    @pytest.mark.asyncio
+    async def test_valid_document(self, tool):
+        """Test a document matching the schema has no errors"""
+        result = await tool.execute(make_document({"name": "Ada", "age": 36}), {"schema": SCHEMA})
+
+        assert result["valid"] is True
+        assert result["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_all_schema_errors_reported(self, tool):
+        """Test every schema violation is mapped to an error entry"""
+        result = await tool.execute(make_document({"age": "old"}), {"schema": SCHEMA})
+
+        assert result["valid"] is False
+        assert {tuple(error["path"]) for error in result["errors"]} == {(), ("age",)}
+        assert all(error["type"] == "schema_validation" for error in result["errors"])
+
+    @pytest.mark.asyncio
+    async def test_invalid_schema_reported(self, tool):
+        """Test a schema rejected by the metaschema yields a schema error"""
+        result = await tool.execute(make_document({"name": "Ada"}), {"schema": {"type": "nope"}})
+
+        assert result["valid"] is False
+        assert result["errors"][0]["type"] == "schema_error"
+
+    @pytest.mark.asyncio
+    async def test_validator_compiled_once_per_schema(self, tool):
+        """Test equivalent schemas share one compiled validator"""
+        reordered = dict(reversed(list(SCHEMA.items())))
+
+        await tool.execute(make_document({"name": "Ada"}), {"schema": SCHEMA})
+        await tool.execute(make_document({"name": "Grace"}), {"schema": reordered})
+
+        info = validate_json_tool._get_validator.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_equivalent_spellings_share_validator(self, tool):
+        """Test canonically equal schemas hit the same cache entry"""
+        spelled_out = {
+            "$comment": "person record",
+            "required": ["name"],
+            "properties": {
+                "age": {"type": ["integer"]},
+                "name": {"type": "string", "$comment": "display name"}
+            },
+            "type": ["object"]
+        }
+
+        first = await tool.execute(make_document({"age": "old"}), {"schema": SCHEMA})
+        second = await tool.execute(make_document({"age": "old"}), {"schema": spelled_out})
+
+        assert first == second
+        assert validate_json_tool._get_validator.cache_info().misses == 1
+
+    def test_canonicalization_keeps_names_and_data(self):
+        """Test property names and instance data are not normalized"""
+        schema = {
+            "properties": {"$comment": {"type": "string"}},
+            "enum": [{"type": ["x"], "$comment": "kept"}]
+        }
+
+        canonical = json.loads(validate_json_tool._canonicalize_schema(schema))
+
+        assert canonical == schema
+
+
+class TestSyntaxValidation:
+    """Test suite for JSON syntax checks"""
+
+    @pytest.mark.asyncio
+    async def test_syntax_error_location(self, tool):
+        """Test malformed JSON reports the line and column"""
+        result = await tool.execute(make_document('{\n  "name": }'))
+
+        assert result["valid"] is False
+        error = result["errors"][0]
+        assert error["type"] == "syntax_error"
+        assert (error["line"], error["column"]) == (2, 11)
+
+    @pytest.mark.asyncio
+    async def test_empty_document(self, tool):
+        """Test a document without content is invalid"""
+        result = await tool.execute(make_document(""))
+
+        assert result["valid"] is False
+        assert result["errors"] == ["No JSON content found in document"]
+
+
+class TestParsing:
+    """Test suite for JSON parsing"""
+
+    @pytest.mark.parametrize("text", [
+        '{"value": NaN}',
+        '{"value": 123456789012345678901234567890}',
+        '{"value": -9999999999999999999}'
+    ])
+    def test_stdlib_extensions_still_accepted(self, text):
+        """Test input only the stdlib parser accepts still parses"""
+        assert validate_json_tool._parse_json(text) == json.loads(text)
+
+    @pytest.mark.asyncio
+    async def test_results_match_stdlib_parser(self, tool, monkeypatch):
+        """Test results are the same with and without orjson"""
+        document = make_document({"items": [1, "two", None], "nested": {"flag": True}})
+        fast = await tool.execute(document, {"strict": True})
+
+        monkeypatch.setattr(validate_json_tool, "ORJSON_AVAILABLE", False)
+        slow = await tool.execute(document, {"strict": True})
+
+        assert fast == slow
+
+    def test_depth_prescan_only_for_unlimited_orjson(self, monkeypatch):
+        """Test the nesting pre-scan is skipped when orjson limits depth itself"""
+        pytest.importorskip("orjson")
+        prescan = MagicMock(return_value=False)
+        monkeypatch.setattr(validate_json_tool, "_nesting_exceeds", prescan)
+        text = json.dumps([[i] for i in range(2000)])
+
+        monkeypatch.setattr(validate_json_tool, "ORJSON_DEPTH_LIMITED", True)
+        validate_json_tool._parse_json(text)
+        prescan.assert_not_called()
+
+        monkeypatch.setattr(validate_json_tool, "ORJSON_DEPTH_LIMITED", False)
+        validate_json_tool._parse_json(text)
+        prescan.assert_called_once()
+
+
+class TestStructureAnalysis:
+    """Test suite for the structure checks and statistics walk"""
+
+    def test_nesting_up_to_max_depth(self):
+        """Test nesting up to the depth limit is analyzed in full"""
+        depth = validate_json_tool._MAX_DEPTH
+        data = inner = {}
+        for _ in range(depth):
+            inner["child"] = {}
+            inner = inner["child"]
+
+        validation, statistics = validate_json_tool._analyze(data, strict=False)
+
+        assert validation["errors"] == []
+        assert statistics["max_depth"] == depth
+        assert statistics["total_objects"] == depth + 1
+        assert validation["warnings"][0]["depth"] == depth
+
+    def test_walk_stops_beyond_max_depth(self):
+        """Test the walk stops at the first node past the depth limit"""
+        data = inner = []
+        for _ in range(validate_json_tool._MAX_DEPTH + 50):
+            inner.append([])
+            inner = inner[0]
+
+        validation, statistics = validate_json_tool._analyze({"a": data}, strict=False)
+
+        assert validation["errors"] == [{
+            "type": "max_depth_exceeded",
+            "message": f"JSON nesting exceeds the maximum depth of {validate_json_tool._MAX_DEPTH}",
+            "depth": validate_json_tool._MAX_DEPTH + 1
+        }]
+        assert statistics["total_arrays"] == validate_json_tool._MAX_DEPTH
+
+    @pytest.mark.parametrize("opening, closing", [('{"a":', "}"), ("[", "]")])
+    @pytest.mark.asyncio
+    async def test_adversarial_nesting_rejected(self, tool, opening, closing):
+        """Test 100k-deep documents are rejected without crashing the parser"""
+        depth = 100000
+        document = make_document(opening * depth + "1" + closing * depth)
+
+        result = await tool.execute(document)
+
+        assert result["valid"] is False
+        assert result["errors"][0]["type"] == "max_depth_exceeded"
+
+    @pytest.mark.parametrize("text, exceeds", [
+        ("[" * 5 + "]" * 5, False),
+        ("[" * 6 + "]" * 6, True),
+        ('["[[[[[[[[", "{{{{{{{{"]', False),
+        ('["\\"", [[[[[]]]]]]', True),
+        ('["\\"[[[[[[[[\\\\"]', False),
+        ("[[]]" * 20, False)
+    ])
+    def test_nesting_prescan(self, text, exceeds):
+        """Test the pre-scan counts only brackets outside string literals"""
+        assert validate_json_tool._nesting_exceeds(text, 5) is exceeds
+
+    @pytest.mark.asyncio
+    async def test_strict_findings_in_document_order(self, tool):
+        """Test strict errors list nulls then mixed arrays in document order"""
+        document = make_document({
+            "a": None,
+            "b": [1, "x", {"c": None}],
+            "d": [None, [True, 2]]
+        })
+
+        result = await tool.execute(document, {"strict": True})
+
+        paths = [(error["type"], error["path"]) for error in result["errors"]]
+        assert paths == [
+            ("null_value", "root.a"),
+            ("null_value", "root.b[2].c"),
+            ("null_value", "root.d[0]"),
+            ("inconsistent_array", "root.b"),
+            ("inconsistent_array", "root.d"),
+            ("inconsistent_array", "root.d[1]")
+        ]
+        assert result["statistics"]["type_distribution"] == {
+            "object": 2, "array": 3, "null": 3, "int": 2, "str": 1, "bool": 1
+        }
+
+    @pytest.mark.parametrize("values, mixed", [
+        ([1, 2, 3], False),
+        ([[1], ["a"]], False),
+        ([{"a": 1}, {}], False),
+        ([1, 2.0], True),
+        ([True, 1], True),
+        (["a", None], True)
+    ])
+    def test_mixed_array_detection(self, values, mixed):
+        """Test arrays are flagged exactly when element types differ"""
+        validation, _ = validate_json_tool._analyze({"values": values}, strict=True)
+
+        flagged = [error["path"] for error in validation["strict_errors"]
+                   if error["type"] == "inconsistent_array"]
+        assert (flagged == ["root.values"]) is mixed
+
+    @pytest.mark.asyncio
+    async def test_strict_errors_capped(self, tool):
+        """Test strict findings stop at the cap and flag the truncation"""
+        cap = validate_json_tool._MAX_STRICT_ERRORS
+        document = make_document({"values": [None] * (cap + 50)})
+
+        result = await tool.execute(document, {"strict": True})
+
+        assert len(result["errors"]) == cap
+        assert result["errors"][-1]["path"] == f"root.values[{cap - 1}]"
+        assert result["warnings"][-1]["type"] == "truncated"
+        assert result["statistics"]["total_null_values"] == cap + 50
+
+    @pytest.mark.asyncio
+    async def test_strict_errors_at_cap_not_truncated(self, tool):
+        """Test exactly reaching the cap does not flag truncation"""
+        cap = validate_json_tool._MAX_STRICT_ERRORS
+        document = make_document({"values": [None] * cap})
+
+        result = await tool.execute(document, {"strict": True})
+
+        assert len(result["errors"]) == cap
+        assert result["warnings"] == []
+
+    @pytest.mark.parametrize("parameters, reported", [
+        ({}, ["root.over"]),
+        ({"large_array_threshold": 5}, ["root.over", "root.at", "root.small"]),
+        ({"large_array_threshold": sys.maxsize}, [])
+    ])
+    @pytest.mark.asyncio
+    async def test_large_array_threshold(self, tool, parameters, reported):
+        """Test arrays are reported above the default or requested threshold"""
+        threshold = validate_json_tool._LARGE_ARRAY_THRESHOLD
+        document = make_document({
+            "over": [0] * (threshold + 1),
+            "at": [0] * threshold,
+            "small": [0] * 6
+        })
+
+        result = await tool.execute(document, parameters)
+
+        assert [warning["path"] for warning in result["warnings"]] == reported
+
+
+class TestOptionalAnalysis:
+    """Test suite for switching off statistics and additional checks"""
+
+    @pytest.mark.asyncio
+    async def test_syntax_only_skips_walk(self, tool, monkeypatch):
+        """Test turning both off never walks the parsed tree"""
+        monkeypatch.setattr(validate_json_tool, "_analyze", MagicMock())
+        parameters = {"schema": SCHEMA, "strict": True, "collect_statistics": False, "additional_checks": False}
+
+        result = await tool.execute(make_document({"name": None}), parameters)
+
+        validate_json_tool._analyze.assert_not_called()
+        assert result["valid"] is False
+        assert [error["type"] for error in result["errors"]] == ["schema_validation"]
+        assert (result["warnings"], result["statistics"]) == ([], {})
+
+    @pytest.mark.asyncio
+    async def test_statistics_without_checks(self, tool):
+        """Test statistics are kept while warnings and strict errors are dropped"""
+        document = make_document({"a": None, "b": [1] * 2000})
+
+        result = await tool.execute(document, {"strict": True, "additional_checks": False})
+
+        assert result["valid"] is True
+        assert result["warnings"] == []
+        assert result["statistics"]["total_null_values"] == 1
+
+    @pytest.mark.asyncio
+    async def test_checks_without_statistics(self, tool):
+        """Test warnings and strict errors are kept while statistics are dropped"""
+        document = make_document({"a": None, "b": [1] * 2000})
+
+        result = await tool.execute(document, {"strict": True, "collect_statistics": False})
+
+        assert result["statistics"] == {}
+        assert [warning["type"] for warning in result["warnings"]] == ["large_array"]
+        assert [error["type"] for error in result["errors"]] == ["null_value"]
+
+
+class TestCompiledSchemaCheck:
+    """Test suite for the compiled fast-path schema check"""
+
+    @pytest.mark.asyncio
+    async def test_passing_fast_check_skips_full_validation(self, tool, monkeypatch):
+        """Test documents accepted by the fast check skip iter_errors"""
+        validator = MagicMock()
+        monkeypatch.setattr(validate_json_tool, "_get_validator", lambda key: validator)
+        monkeypatch.setattr(validate_json_tool, "_get_fast_validator", lambda key: lambda data: data)
+
+        result = await tool.execute(make_document({"name": "Ada"}), {"schema": SCHEMA})
+
+        assert result["valid"] is True
+        validator.iter_errors.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failing_fast_check_reports_all_errors(self, tool):
+        """Test a rejected document still gets the full error list"""
+        pytest.importorskip("fastjsonschema")
+
+        result = await tool.execute(make_document({"age": "old"}), {"schema": SCHEMA})
+
+        assert validate_json_tool._get_fast_validator(validate_json_tool._schema_key(SCHEMA))
+        assert {tuple(error["path"]) for error in result["errors"]} == {(), ("age",)}
+
+    def test_fast_check_leaves_defaults_unapplied(self):
+        """Test the compiled check does not fill in schema defaults"""
+        pytest.importorskip("fastjsonschema")
+        schema = {"type": "object", "properties": {"flag": {"type": "boolean", "default": True}}}
+        data = {}
+
+        fast_check = validate_json_tool._get_fast_validator(validate_json_tool._schema_key(schema))
+
+        assert validate_json_tool._passes(fast_check, data)
+        assert data == {}
+
+
+class TestBatchValidation:
+    """Test suite for batch validation"""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_results(self, tool):
+        """Test batch results equal per-document results in order"""
+        documents = [
+            make_document({"name": "Ada"}),
+            make_document({"age": "old"}),
+            make_document('{"name": '),
+            make_document({"name": None, "tags": [1, "a"]})
+        ]
+        parameters = {"schema": SCHEMA, "strict": True}
+
+        results = await tool.execute_batch(documents, parameters)
+
+        expected = [await tool.execute(document, parameters) for document in documents]
+        assert results == expected
+        assert [result["valid"] for result in results] == [True, False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_batch_sharded_into_worker_chunks(self, tool, monkeypatch):
+        """Test documents are submitted as one contiguous chunk per worker"""
+        monkeypatch.setattr(validate_json_tool.os, "cpu_count", lambda: 3)
+        pool = MagicMock()
+        monkeypatch.setattr(validate_json_tool, "_get_process_pool", lambda: pool)
+        loop = asyncio.get_running_loop()
+        submitted = []
+
+        async def run_inline(executor, func, *args):
+            submitted.append(len(args[0]))
+            return func(*args)
+
+        monkeypatch.setattr(loop, "run_in_executor", run_inline)
+        documents = [make_document({"name": str(index)}) for index in range(7)]
+
+        results = await tool.execute_batch(documents)
+
+        assert submitted == [3, 3, 1]
+        assert [result["statistics"]["total_keys"] for result in results] == [1] * 7
+
+    @pytest.mark.asyncio
+    async def test_single_document_batch_runs_inline(self, tool, monkeypatch):
+        """Test a one-document batch does not start the process pool"""
+        monkeypatch.setattr(validate_json_tool, "_get_process_pool", MagicMock())
+
+        results = await tool.execute_batch([make_document({"name": "Ada"})])
+
+        assert results[0]["valid"] is True
+        validate_json_tool._get_process_pool.assert_not_called()
+
+    def test_process_pool_shut_down_at_exit(self, monkeypatch):
+        """Test the lazily created pool registers its shutdown with atexit"""
+        pool = MagicMock()
+        exit_handlers = []
+        monkeypatch.setattr(validate_json_tool, "_process_pool", None)
+        monkeypatch.setattr(validate_json_tool, "ProcessPoolExecutor", lambda max_workers: pool)
+        monkeypatch.setattr(validate_json_tool.atexit, "register", exit_handlers.append)
+
+        assert validate_json_tool._get_process_pool() is pool
+        assert validate_json_tool._get_process_pool() is pool
+        assert exit_handlers == [validate_json_tool._shutdown_process_pool]
+
+        exit_handlers[0]()
+        pool.shutdown.assert_called_once_with()
+        assert validate_json_tool._process_pool is None
+
+
+class TestStreamingAnalysis:
+    """Test suite for event-based analysis of large documents"""
+
+    @pytest.fixture(autouse=True)
+    def stream_everything(self, monkeypatch):
+        """Route every document through the event-based path"""
+        pytest.importorskip("ijson")
+        monkeypatch.setattr(validate_json_tool, "_STREAM_ANALYSIS_MIN_LENGTH", 0)
+
+    @pytest.mark.asyncio
+    async def test_matches_tree_analysis(self, tool, monkeypatch):
+        """Test event-based results equal the parsed-tree results"""
+        payload = {
+            "rows": [{"id": i, "score": i / 2, "tags": ["a"] * (i % 3)} for i in range(1500)],
+            "deep": {"a": {"b": {"c": {"d": {"e": {"f": {"g": {"h": {"i": {"j": {"k": None}}}}}}}}}}},
+            "flag": False
+        }
+        document = make_document(payload)
+
+        streamed = await tool.execute(document)
+        monkeypatch.setattr(validate_json_tool, "IJSON_AVAILABLE", False)
+        parsed = await tool.execute(document)
+
+        assert streamed == parsed
+        assert [warning["type"] for warning in streamed["warnings"]] == ["deep_nesting", "large_array"]
+
+    @pytest.mark.asyncio
+    async def test_nesting_beyond_max_depth_rejected(self, tool):
+        """Test the event walk stops at the depth limit too"""
+        depth = validate_json_tool._MAX_DEPTH + 50
+        document = make_document("[" * depth + "]" * depth)
+
+        result = await tool.execute(document)
+
+        assert result["valid"] is False
+        assert result["errors"][0]["type"] == "max_depth_exceeded"
+        assert result["statistics"]["max_depth"] == validate_json_tool._MAX_DEPTH + 1
+
+    @pytest.mark.asyncio
+    async def test_syntax_error_uses_regular_parse(self, tool):
+        """Test malformed documents still report the error location"""
+        result = await tool.execute(make_document('{\n  "name": }'))
+
+        assert (result["errors"][0]["line"], result["errors"][0]["column"]) == (2, 11)
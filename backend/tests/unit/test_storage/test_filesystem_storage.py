@@ -180,6 +180,39 @@ class TestFilesystemStorage:
         version_numbers = [v.version for v in versions]
         assert version_numbers == sorted(version_numbers)
 
+    @pytest.mark.asyncio
+    async def test_transactional_update(self, storage, sample_document):
+        """Test saving a document together with its versions"""
+        document_id = sample_document.metadata.document_id
+        await storage.save(sample_document)
+
+        snapshot = DocumentVersion(
+            version=1,
+            timestamp=datetime.utcnow(),
+            user="test_user",
+            changes={"snapshot": "before_update"}
+        )
+        sample_document.metadata.version = 2
+        sample_document.metadata.name = "Updated Name"
+        new_version = DocumentVersion(
+            version=2,
+            timestamp=datetime.utcnow(),
+            user="test_user",
+            changes={"metadata": {"name": "Updated Name"}}
+        )
+
+        result = await storage.transactional_update(
+            document_id, sample_document, snapshot, new_version
+        )
+        assert result is True
+
+        loaded_doc = await storage.load(document_id)
+        assert loaded_doc.metadata.name == "Updated Name"
+        assert loaded_doc.metadata.version == 2
+
+        versions = await storage.get_versions(document_id)
+        assert [v.version for v in versions] == [1, 2]
+
     @pytest.mark.asyncio
     async def test_get_versions_nonexistent_document(self, storage):
         """Test getting versions for a document that doesn't exist"""